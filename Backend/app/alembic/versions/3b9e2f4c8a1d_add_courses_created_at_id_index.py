@@ -0,0 +1,28 @@
+"""Add (created_at, id) index on courses for keyset pagination
+
+Revision ID: 3b9e2f4c8a1d
+Revises: 7645eb2d5dc0
+Create Date: 2026-10-18 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9e2f4c8a1d'
+down_revision: Union[str, Sequence[str], None] = '7645eb2d5dc0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_courses_created_at_id', 'courses', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_courses_created_at_id', table_name='courses')
@@ -0,0 +1,46 @@
+"""Add course_read_models denormalized read model
+
+Revision ID: 8d41c7a2e5f9
+Revises: 3b9e2f4c8a1d
+Create Date: 2026-10-18 11:03:27.552091
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41c7a2e5f9'
+down_revision: Union[str, Sequence[str], None] = '3b9e2f4c8a1d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('course_read_models',
+    sa.Column('course_id', sa.Integer(), nullable=False),
+    sa.Column('slug', sa.String(length=255), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('summary', sa.JSON(), nullable=False),
+    sa.Column('detail', sa.JSON(), nullable=False),
+    sa.Column('version', sa.String(length=64), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['course_id'], ['courses.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('course_id'),
+    sa.UniqueConstraint('slug')
+    )
+    op.create_index('idx_course_read_models_created_at_course_id', 'course_read_models', ['created_at', 'course_id'], unique=False)
+
+    # DDL only: the rows are backfilled by scripts/rebuild_read_models.py
+    # (`make migrate` runs it), with the same code and version hash as the
+    # session hooks in app/db/course_read_model.py. Calling that code from here
+    # would tie this revision to the current models.
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_course_read_models_created_at_course_id', table_name='course_read_models')
+    op.drop_table('course_read_models')
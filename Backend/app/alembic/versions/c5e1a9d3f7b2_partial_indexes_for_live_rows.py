@@ -0,0 +1,80 @@
+"""Replace redundant and deleted_at indexes with partial indexes on live rows
+
+Revision ID: c5e1a9d3f7b2
+Revises: 8d41c7a2e5f9
+Create Date: 2026-10-18 12:40:07.512930
+
+Every ORM query now filters deleted_at IS NULL (app.db.soft_delete), so the
+access paths only need live rows:
+
+* courses: (created_at, id) WHERE deleted_at IS NULL; slug lookups use the
+  unique ix_courses_slug.
+* lectures: (course_id, id) WHERE deleted_at IS NULL serves the per-course
+  lecture lists in id order; lecture lookups use the primary key.
+* course_teacher: lookups by course_id use the (course_id, teacher_id)
+  primary key; idx_course_teacher_teacher_id serves teacher -> courses.
+
+Dropped as duplicates: ix_*_id next to the primary keys, idx_lectures_slug
+(same as ix_lectures_slug), idx_course_teacher_course_id (leading primary key
+column), the *_deleted_at composites and the low-selectivity deleted_at
+indexes. See benchmarks/README.md for EXPLAIN and write cost numbers.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e1a9d3f7b2'
+down_revision: Union[str, Sequence[str], None] = '8d41c7a2e5f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_ROWS = sa.text('deleted_at IS NULL')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_courses_live_created_at_id', 'courses', ['created_at', 'id'], unique=False,
+        postgresql_where=LIVE_ROWS, sqlite_where=LIVE_ROWS,
+    )
+    op.create_index(
+        'idx_lectures_live_course_id_id', 'lectures', ['course_id', 'id'], unique=False,
+        postgresql_where=LIVE_ROWS, sqlite_where=LIVE_ROWS,
+    )
+
+    op.drop_index('idx_courses_created_at_id', table_name='courses')
+    op.drop_index('idx_courses_slug_deleted_at', table_name='courses')
+    op.drop_index('idx_courses_deleted_at', table_name='courses')
+    op.drop_index('ix_courses_id', table_name='courses')
+    op.drop_index('idx_teachers_email_deleted_at', table_name='teachers')
+    op.drop_index('idx_teachers_deleted_at', table_name='teachers')
+    op.drop_index('ix_teachers_id', table_name='teachers')
+    op.drop_index('idx_course_teacher_course_id', table_name='course_teacher')
+    op.drop_index('idx_lectures_course_id_deleted_at', table_name='lectures')
+    op.drop_index('idx_lectures_course_id', table_name='lectures')
+    op.drop_index('idx_lectures_deleted_at', table_name='lectures')
+    op.drop_index('idx_lectures_slug', table_name='lectures')
+    op.drop_index('ix_lectures_id', table_name='lectures')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_lectures_id', 'lectures', ['id'], unique=False)
+    op.create_index('idx_lectures_slug', 'lectures', ['slug'], unique=False)
+    op.create_index('idx_lectures_deleted_at', 'lectures', ['deleted_at'], unique=False)
+    op.create_index('idx_lectures_course_id', 'lectures', ['course_id'], unique=False)
+    op.create_index('idx_lectures_course_id_deleted_at', 'lectures', ['course_id', 'deleted_at'], unique=False)
+    op.create_index('idx_course_teacher_course_id', 'course_teacher', ['course_id'], unique=False)
+    op.create_index('ix_teachers_id', 'teachers', ['id'], unique=False)
+    op.create_index('idx_teachers_deleted_at', 'teachers', ['deleted_at'], unique=False)
+    op.create_index('idx_teachers_email_deleted_at', 'teachers', ['email', 'deleted_at'], unique=False)
+    op.create_index('ix_courses_id', 'courses', ['id'], unique=False)
+    op.create_index('idx_courses_deleted_at', 'courses', ['deleted_at'], unique=False)
+    op.create_index('idx_courses_slug_deleted_at', 'courses', ['slug', 'deleted_at'], unique=False)
+    op.create_index('idx_courses_created_at_id', 'courses', ['created_at', 'id'], unique=False)
+
+    op.drop_index('idx_lectures_live_course_id_id', table_name='lectures')
+    op.drop_index('idx_courses_live_created_at_id', table_name='courses')
@@ -0,0 +1,70 @@
+"""Full-text search over course and lecture names and descriptions
+
+Revision ID: e2b7d4f1a6c3
+Revises: c5e1a9d3f7b2
+Create Date: 2026-10-18 14:12:45.204318
+
+PostgreSQL: generated search_vector tsvector columns (name weighted A,
+description B) with partial GIN indexes on live rows, the only rows searched.
+SQLite: the shared catalog_fts FTS5 table and sync triggers, as created by
+app/db/search.py for Base.metadata.create_all, filled from existing rows.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.search import (
+    SEARCHABLE_TABLES,
+    SEARCH_CONFIG,
+    SQLITE_KINDS,
+    SQLITE_SEARCH_DDL,
+    SQLITE_SEARCH_TABLE,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7d4f1a6c3'
+down_revision: Union[str, Sequence[str], None] = 'c5e1a9d3f7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_ROWS = sa.text('deleted_at IS NULL')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    for table in SEARCHABLE_TABLES:
+        if dialect == 'postgresql':
+            op.execute(f"""
+                ALTER TABLE {table} ADD COLUMN search_vector tsvector
+                GENERATED ALWAYS AS (
+                    setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(name, '')), 'A') ||
+                    setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')
+                ) STORED
+            """)
+            op.create_index(
+                f'idx_{table}_live_search_vector', table, ['search_vector'], unique=False,
+                postgresql_using='gin', postgresql_where=LIVE_ROWS,
+            )
+        elif dialect == 'sqlite':
+            for statement in SQLITE_SEARCH_DDL[table]:
+                op.execute(statement)
+            op.execute(f"""
+                INSERT INTO {SQLITE_SEARCH_TABLE}(rowid, name, description)
+                SELECT id * 2 + {SQLITE_KINDS[table]}, name, description FROM {table}
+            """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    for table in SEARCHABLE_TABLES:
+        if dialect == 'postgresql':
+            op.drop_index(f'idx_{table}_live_search_vector', table_name=table)
+            op.drop_column(table, 'search_vector')
+        elif dialect == 'sqlite':
+            for trigger in ('ai', 'ad', 'au'):
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_search_{trigger}")
+            op.execute(f"DROP TABLE IF EXISTS {SQLITE_SEARCH_TABLE}")
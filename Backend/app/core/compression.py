@@ -0,0 +1,132 @@
+"""
+Response compression with Accept-Encoding negotiation.
+
+gzip is always available; brotli is offered when the optional 'brotli'
+package is installed (pip install 'platziflix[brotli]').
+"""
+
+import gzip
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import get_settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the optional extra
+    brotli = None
+
+
+@dataclass
+class CompressionStats:
+    """Counters for one content coding."""
+
+    responses: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    cpu_seconds: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters plus the derived ratio and CPU cost per response."""
+        return {
+            "responses": self.responses,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "ratio": self.bytes_out / self.bytes_in if self.bytes_in else 0.0,
+            "cpu_ms_per_response": (
+                self.cpu_seconds * 1000 / self.responses if self.responses else 0.0
+            ),
+        }
+
+
+class Compressor:
+    """Negotiate and apply gzip/brotli, recording ratio and CPU cost per coding."""
+
+    def __init__(self, min_size: int, gzip_level: int, brotli_quality: int):
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        # Preferred first when the client weighs several codings equally
+        self.encodings: Tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+        self.stats = {encoding: CompressionStats() for encoding in self.encodings}
+        self._lock = threading.Lock()
+
+    def negotiate(self, accept_encoding: Optional[str]) -> Optional[str]:
+        """Pick the content coding for an Accept-Encoding header (None = identity)."""
+        if not accept_encoding:
+            return None
+
+        weights: Dict[str, float] = {}
+        for item in accept_encoding.split(","):
+            coding, _, params = item.strip().partition(";")
+            q = 1.0
+            for param in params.split(";"):
+                name, _, value = param.strip().partition("=")
+                if name.strip().lower() == "q":
+                    try:
+                        q = float(value)
+                    except ValueError:
+                        q = 0.0
+            weights[coding.strip().lower()] = q
+
+        best, best_q = None, 0.0
+        for encoding in self.encodings:
+            q = weights.get(encoding, weights.get("*", 0.0))
+            if q > best_q:
+                best, best_q = encoding, q
+        return best
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """Compress body with the given coding and record the cost."""
+        start = time.thread_time()
+        if encoding == "br":
+            compressed = brotli.compress(body, quality=self.brotli_quality)
+        elif encoding == "gzip":
+            compressed = gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+        else:
+            raise ValueError(f"Unsupported content coding: {encoding}")
+        elapsed = time.thread_time() - start
+
+        with self._lock:
+            stats = self.stats[encoding]
+            stats.responses += 1
+            stats.bytes_in += len(body)
+            stats.bytes_out += len(compressed)
+            stats.cpu_seconds += elapsed
+        return compressed
+
+
+class EncodedBody:
+    """
+    An encoded response body plus its compressed variants, built on first use.
+
+    Kept in the response body cache so each variant is compressed once per
+    representation instead of once per request.
+    """
+
+    def __init__(self, identity: bytes):
+        self.identity = identity
+        self._variants: Dict[str, bytes] = {}
+
+    def variant(self, encoding: Optional[str], compressor: Compressor) -> Tuple[bytes, Optional[str]]:
+        """Return (body, applied coding); small bodies are sent uncompressed."""
+        if encoding is None or len(self.identity) < compressor.min_size:
+            return self.identity, None
+        body = self._variants.get(encoding)
+        if body is None:
+            body = self._variants[encoding] = compressor.compress(self.identity, encoding)
+        return body, encoding
+
+
+@lru_cache
+def get_compressor() -> Compressor:
+    """Get the process-wide compressor configured in settings."""
+    settings = get_settings()
+    return Compressor(
+        min_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
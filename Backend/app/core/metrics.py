@@ -0,0 +1,287 @@
+"""
+Prometheus-style runtime metrics.
+
+MetricsMiddleware records per-route request latency, status codes and
+in-flight requests. SQLAlchemy engine events attribute every executed
+statement to the request that issued it, so each route reports how many
+queries it runs and how much of its latency is spent in the database.
+track_queries() gives the same accounting for any block of code (a service
+call, a test), which is what query budgets and N+1 detection build on.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Histogram bucket upper bounds
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS: Tuple[float, ...] = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+# Route label of requests that matched no route (404s)
+UNMATCHED_ROUTE = "<unmatched>"
+
+Labels = Tuple[Tuple[str, str], ...]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DatabaseUsage:
+    """Statements executed on behalf of one request or tracked block."""
+
+    queries: int = 0
+    seconds: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+
+    def repeated(self, threshold: int = 2) -> Dict[str, int]:
+        """Statements issued at least threshold times (likely N+1 loads)."""
+        return {
+            statement: count
+            for statement, count in self.statements.items()
+            if count >= threshold
+        }
+
+
+# Every tracker active in the current context; nested blocks all get counted
+_active_database_usage: ContextVar[Tuple[DatabaseUsage, ...]] = ContextVar(
+    "active_database_usage", default=()
+)
+
+
+@contextmanager
+def track_queries() -> Iterator[DatabaseUsage]:
+    """Count the SQL statements executed inside the block."""
+    usage = DatabaseUsage()
+    token = _active_database_usage.set(_active_database_usage.get() + (usage,))
+    try:
+        yield usage
+    finally:
+        _active_database_usage.reset(token)
+
+
+class Histogram:
+    """Cumulative-bucket histogram with sum and count."""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self, name: str, labels: Labels) -> Iterable[str]:
+        for bound, count in zip(self.buckets, self.counts):
+            yield _sample(f"{name}_bucket", labels + (("le", _number(bound)),), count)
+        yield _sample(f"{name}_bucket", labels + (("le", "+Inf"),), self.count)
+        yield _sample(f"{name}_sum", labels, self.sum)
+        yield _sample(f"{name}_count", labels, self.count)
+
+
+class MetricsRegistry:
+    """Process-wide request and database metrics."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.requests: Dict[Labels, int] = {}
+        self.latency: Dict[Labels, Histogram] = {}
+        self.db_queries: Dict[Labels, Histogram] = {}
+        self.db_seconds: Dict[Labels, Histogram] = {}
+        self.db_queries_total = 0
+        self.db_seconds_total = 0.0
+        self._lock = threading.Lock()
+
+    def request_started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def request_finished(
+        self, method: str, route: str, status: int, seconds: float, usage: DatabaseUsage
+    ) -> None:
+        """Record a finished request with the database usage attributed to it."""
+        route_labels = (("method", method), ("route", route))
+        status_labels = route_labels + (("status", str(status)),)
+        with self._lock:
+            self.in_flight -= 1
+            self.requests[status_labels] = self.requests.get(status_labels, 0) + 1
+            self.latency.setdefault(route_labels, Histogram(LATENCY_BUCKETS)).observe(seconds)
+            self.db_queries.setdefault(
+                route_labels, Histogram(QUERY_COUNT_BUCKETS)
+            ).observe(usage.queries)
+            self.db_seconds.setdefault(
+                route_labels, Histogram(LATENCY_BUCKETS)
+            ).observe(usage.seconds)
+
+    def query_executed(self, seconds: float) -> None:
+        """Record an executed statement, whether or not a request issued it."""
+        with self._lock:
+            self.db_queries_total += 1
+            self.db_seconds_total += seconds
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        with self._lock:
+            lines: List[str] = []
+            _family(lines, "http_requests_in_flight", "gauge",
+                    "Requests currently being served.", [_sample("http_requests_in_flight", (), self.in_flight)])
+            _family(lines, "http_requests_total", "counter",
+                    "Requests by method, route template and status code.",
+                    [_sample("http_requests_total", labels, count)
+                     for labels, count in sorted(self.requests.items())])
+            _family(lines, "http_request_duration_seconds", "histogram",
+                    "Request latency by route template.",
+                    _histogram_samples("http_request_duration_seconds", self.latency))
+            _family(lines, "http_request_db_queries", "histogram",
+                    "SQL statements executed per request.",
+                    _histogram_samples("http_request_db_queries", self.db_queries))
+            _family(lines, "http_request_db_duration_seconds", "histogram",
+                    "Time spent executing SQL per request.",
+                    _histogram_samples("http_request_db_duration_seconds", self.db_seconds))
+            _family(lines, "db_queries_total", "counter",
+                    "SQL statements executed.", [_sample("db_queries_total", (), self.db_queries_total)])
+            _family(lines, "db_query_duration_seconds_total", "counter",
+                    "Time spent executing SQL.",
+                    [_sample("db_query_duration_seconds_total", (), self.db_seconds_total)])
+            return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Reset every metric except the in-flight gauge."""
+        with self._lock:
+            self.requests.clear()
+            self.latency.clear()
+            self.db_queries.clear()
+            self.db_seconds.clear()
+            self.db_queries_total = 0
+            self.db_seconds_total = 0.0
+
+
+def render_gauges(name: str, help_text: str, samples: Dict[Labels, float]) -> str:
+    """Render an extra gauge family (e.g. pool occupancy) in exposition format."""
+    lines: List[str] = []
+    _family(lines, name, "gauge", help_text,
+            [_sample(name, labels, value) for labels, value in samples.items()])
+    return "\n".join(lines) + "\n"
+
+
+def _family(lines: List[str], name: str, kind: str, help_text: str, samples: Iterable[str]) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+    lines.extend(samples)
+
+
+def _histogram_samples(name: str, histograms: Dict[Labels, Histogram]) -> List[str]:
+    return [
+        line
+        for labels, histogram in sorted(histograms.items())
+        for line in histogram.samples(name, labels)
+    ]
+
+
+def _sample(name: str, labels: Labels, value: float) -> str:
+    if labels:
+        rendered = ",".join(f'{key}="{_escape(value)}"' for key, value in labels)
+        return f"{name}{{{rendered}}} {_number(value)}"
+    return f"{name} {_number(value)}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+@lru_cache
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return MetricsRegistry()
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, status and database usage per route.
+
+    With repeat_warning_threshold > 0, requests that issue the same statement
+    that many times are logged as likely N+1 loads.
+    """
+
+    def __init__(self, app: Any, repeat_warning_threshold: int = 0):
+        self.app = app
+        self.repeat_warning_threshold = repeat_warning_threshold
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        registry = get_metrics_registry()
+        status = 500
+
+        async def send_with_status(message: Dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        registry.request_started()
+        start = time.perf_counter()
+        with track_queries() as usage:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+                registry.request_finished(
+                    scope["method"], route, status, time.perf_counter() - start, usage
+                )
+                if self.repeat_warning_threshold > 0:
+                    self._warn_repeated(scope["method"], route, usage)
+
+    def _warn_repeated(self, method: str, route: str, usage: DatabaseUsage) -> None:
+        for statement, count in usage.repeated(self.repeat_warning_threshold).items():
+            logger.warning(
+                "%s %s issued the same statement %d times (possible N+1): %s",
+                method, route, count, " ".join(statement.split()),
+            )
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_query(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    seconds = time.perf_counter() - conn.info["query_start_time"].pop()
+    get_metrics_registry().query_executed(seconds)
+    for usage in _active_database_usage.get():
+        usage.queries += 1
+        usage.seconds += seconds
+        usage.statements[statement] += 1
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_query_timer(context: Any) -> None:
+    starts = context.connection.info.get("query_start_time") if context.connection else None
+    if starts:
+        starts.pop()
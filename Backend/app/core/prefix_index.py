@@ -0,0 +1,169 @@
+"""In-memory prefix index over short titles, for search-as-you-type."""
+
+import re
+import sys
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_left, insort
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+# Entries pack (slot << OFFSET_BITS) | offset of a word start into one integer
+OFFSET_BITS = 16
+OFFSET_MASK = (1 << OFFSET_BITS) - 1
+
+_WORD = re.compile(r"\w+")
+
+
+def fold(text: str) -> str:
+    """Accent- and case-fold text ("Introducción" -> "introduccion"), collapsing spaces."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def _word_starts(title: str) -> List[int]:
+    return [match.start() for match in _WORD.finditer(title) if match.start() <= OFFSET_MASK]
+
+
+class PrefixIndex:
+    """
+    Thread-safe prefix index mapping folded titles to payloads.
+
+    Every word start of a title is indexed, so "react" and "curso de re" both
+    match "Curso de React". Entries live in one sorted array of packed
+    (title slot, word offset) integers searched with bisect: each title is
+    stored once and every indexed word adds 8 bytes.
+    """
+
+    def __init__(self) -> None:
+        self._titles: List[Optional[str]] = []
+        self._payloads: List[Any] = []
+        self._slots: Dict[Hashable, int] = {}
+        self._free: List[int] = []
+        self._entries = array("Q")
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._slots
+
+    def load(self, items: Iterable[Tuple[Hashable, str, Any]]) -> None:
+        """Replace the whole index with (key, title, payload) items, sorting once."""
+        titles: List[Optional[str]] = []
+        payloads: List[Any] = []
+        slots: Dict[Hashable, int] = {}
+        for key, title, payload in items:
+            if key in slots:
+                titles[slots[key]] = fold(title)
+                payloads[slots[key]] = payload
+                continue
+            slots[key] = len(titles)
+            titles.append(fold(title))
+            payloads.append(payload)
+
+        entries = [
+            slot << OFFSET_BITS | offset
+            for slot, title in enumerate(titles)
+            for offset in _word_starts(title)
+        ]
+        entries.sort(key=lambda entry: titles[entry >> OFFSET_BITS][entry & OFFSET_MASK:])
+
+        with self._lock:
+            self._titles, self._payloads, self._slots = titles, payloads, slots
+            self._free = []
+            self._entries = array("Q", entries)
+
+    def put(self, key: Hashable, title: str, payload: Any) -> None:
+        """Add or replace the title and payload stored under key."""
+        folded = fold(title)
+        with self._lock:
+            if key in self._slots:
+                self._remove(key)
+            slot = self._free.pop() if self._free else len(self._titles)
+            if slot == len(self._titles):
+                self._titles.append(folded)
+                self._payloads.append(payload)
+            else:
+                self._titles[slot] = folded
+                self._payloads[slot] = payload
+            self._slots[key] = slot
+            for offset in _word_starts(folded):
+                insort(self._entries, slot << OFFSET_BITS | offset, key=self._suffix)
+
+    def discard(self, key: Hashable) -> None:
+        """Remove key if present."""
+        with self._lock:
+            if key in self._slots:
+                self._remove(key)
+
+    def search(
+        self, prefix: str, limit: int, accept: Optional[Callable[[Any], bool]] = None
+    ) -> List[Any]:
+        """
+        Payloads of up to limit titles with a word sequence starting with prefix,
+        in alphabetical order of the matched text; accept filters payloads.
+        """
+        folded = fold(prefix)
+        if not folded or limit <= 0:
+            return []
+
+        results: List[Any] = []
+        seen = set()
+        with self._lock:
+            position = bisect_left(self._entries, folded, key=self._suffix)
+            while position < len(self._entries) and len(results) < limit:
+                entry = self._entries[position]
+                position += 1
+                if not self._suffix(entry).startswith(folded):
+                    break
+                slot = entry >> OFFSET_BITS
+                if slot in seen:
+                    continue
+                seen.add(slot)
+                payload = self._payloads[slot]
+                if accept is None or accept(payload):
+                    results.append(payload)
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """Title and entry counts plus the approximate memory footprint in bytes."""
+        with self._lock:
+            titles = [title for title in self._titles if title is not None]
+            memory = (
+                sys.getsizeof(self._entries)
+                + sys.getsizeof(self._titles)
+                + sys.getsizeof(self._payloads)
+                + sys.getsizeof(self._slots)
+                + sum(sys.getsizeof(title) for title in titles)
+                + sum(_deep_size(key) for key in self._slots)
+                + sum(_deep_size(payload) for payload in self._payloads if payload is not None)
+            )
+            return {"titles": len(titles), "entries": len(self._entries), "memory_bytes": memory}
+
+    def _suffix(self, entry: int) -> str:
+        return self._titles[entry >> OFFSET_BITS][entry & OFFSET_MASK:]
+
+    def _remove(self, key: Hashable) -> None:
+        slot = self._slots.pop(key)
+        for offset in _word_starts(self._titles[slot]):
+            entry = slot << OFFSET_BITS | offset
+            position = bisect_left(self._entries, self._suffix(entry), key=self._suffix)
+            while self._entries[position] != entry:
+                position += 1
+            del self._entries[position]
+        self._titles[slot] = None
+        self._payloads[slot] = None
+        self._free.append(slot)
+
+
+def _deep_size(value: Any) -> int:
+    """Size of a value plus its tuple items or dict values (dict keys are shared strings)."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(sys.getsizeof(item) for item in value.values())
+    elif isinstance(value, tuple):
+        size += sum(sys.getsizeof(item) for item in value)
+    return size
@@ -0,0 +1,167 @@
+"""
+Shared (cross-worker) cache tier with pluggable storage backends.
+
+Values are serialized once to JSON bytes and stored in the backend, so every
+worker or pod pointing at the same backend reads the same payload.
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, Hashable, Iterable, Optional, Protocol, Set, Tuple
+
+from app.core.cache import CacheStats
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Byte store used by SharedCache."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored payload or None."""
+        ...
+
+    def set(self, key: str, value: bytes, ttl_seconds: float, tags: Iterable[str]) -> None:
+        """Store a payload with a TTL, indexed under the given tags."""
+        ...
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Delete every payload indexed under any of the tags; returns how many."""
+        ...
+
+
+class InMemoryCacheBackend:
+    """Process-local stand-in for a shared backend (tests, single worker)."""
+
+    def __init__(self) -> None:
+        self._values: Dict[str, Tuple[bytes, float]] = {}
+        self._tags: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._values.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._values[key]
+                return None
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: float, tags: Iterable[str]) -> None:
+        with self._lock:
+            self._values[key] = (value, time.monotonic() + ttl_seconds)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        with self._lock:
+            keys: Set[str] = set()
+            for tag in tags:
+                keys |= self._tags.pop(tag, set())
+            return sum(self._values.pop(key, None) is not None for key in keys)
+
+
+class RedisCacheBackend:
+    """
+    Backend for any server speaking the Redis protocol (Redis, Valkey, KeyDB).
+
+    Tags are Redis sets holding the keys they cover. Every key shares the same
+    TTL, so refreshing the tag TTL on each write keeps it alive as long as its
+    newest key.
+    """
+
+    def __init__(self, url: str, tag_prefix: str = "tag:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError(
+                "SHARED_CACHE_BACKEND=redis requires the 'redis' package "
+                "(pip install 'platziflix[redis]')"
+            ) from e
+
+        self.client = redis.Redis.from_url(url)
+        self.tag_prefix = tag_prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float, tags: Iterable[str]) -> None:
+        ttl = max(1, int(ttl_seconds))
+        pipeline = self.client.pipeline()
+        pipeline.set(key, value, ex=ttl)
+        for tag in tags:
+            tag_key = f"{self.tag_prefix}{tag}"
+            pipeline.sadd(tag_key, key)
+            pipeline.expire(tag_key, ttl)
+        pipeline.execute()
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        tag_keys = [f"{self.tag_prefix}{tag}" for tag in tags]
+        if not tag_keys:
+            return 0
+        keys = self.client.sunion(tag_keys)
+        deleted = self.client.delete(*keys) if keys else 0
+        self.client.delete(*tag_keys)
+        return deleted
+
+
+class SharedCache:
+    """
+    Second-level cache tier: serializes values and namespaces keys for a backend.
+
+    Backend errors are logged and treated as misses so an unavailable cache
+    server degrades to database reads instead of failing requests.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: float, prefix: str):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self.stats = CacheStats()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (hit, value) for key."""
+        try:
+            payload = self.backend.get(self._key(key))
+        except Exception:
+            logger.exception("Shared cache get failed")
+            self.stats.errors += 1
+            payload = None
+
+        if payload is None:
+            self.stats.misses += 1
+            return False, None
+        self.stats.hits += 1
+        return True, json.loads(payload)
+
+    def set(self, key: Hashable, value: Any, tags: Iterable[str] = ()) -> None:
+        """Serialize value once and store it for every worker."""
+        payload = json.dumps(value, separators=(",", ":")).encode()
+        try:
+            self.backend.set(
+                self._key(key), payload, self.ttl_seconds, [self._tag(tag) for tag in tags]
+            )
+        except Exception:
+            logger.exception("Shared cache set failed")
+            self.stats.errors += 1
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Drop every shared entry carrying any of the given tags."""
+        try:
+            count = self.backend.invalidate_tags([self._tag(tag) for tag in tags])
+        except Exception:
+            logger.exception("Shared cache invalidation failed")
+            self.stats.errors += 1
+            return 0
+        self.stats.invalidations += count
+        return count
+
+    def _key(self, key: Hashable) -> str:
+        return f"{self.prefix}:{json.dumps(key, separators=(',', ':'))}"
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.prefix}:{tag}"
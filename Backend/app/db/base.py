@@ -1,16 +1,90 @@
+import asyncio
+from functools import lru_cache
+from typing import List, Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import get_settings
+from app.db.pool import get_pool_options
+from app.db.replicas import Replica, ReplicaRouter
 
 settings = get_settings()
 
-# Create SQLAlchemy engine
-engine = create_engine(settings.DATABASE_URL)
+# Async drivers used when DATABASE_ASYNC is enabled
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """Translate a sync database URL into its async driver equivalent."""
+    scheme, separator, rest = database_url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{separator}{rest}"
+
+
+# Engines are created on first use rather than at import time: creating one
+# imports its DBAPI driver (psycopg2, asyncpg), which would otherwise slow down
+# process start and test collection.
+
+
+@lru_cache
+def get_engine() -> Engine:
+    """Get the primary engine, creating it on first use."""
+    return create_engine(
+        settings.DATABASE_URL, **get_pool_options(settings, settings.DATABASE_URL)
+    )
+
+
+@lru_cache
+def get_async_engine() -> Optional[AsyncEngine]:
+    """Get the async engine, created only in async mode so the async driver stays optional."""
+    if not settings.DATABASE_ASYNC:
+        return None
+    return create_async_engine(
+        get_async_database_url(settings.DATABASE_URL),
+        **get_pool_options(settings, settings.DATABASE_URL, is_async=True),
+    )
+
+
+# Session factories, bound to an engine when each session is opened
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+
+
+def _create_replica(url: str) -> Replica:
+    return Replica(
+        url,
+        create_engine(url, **get_pool_options(settings, url)),
+        create_async_engine(
+            get_async_database_url(url), **get_pool_options(settings, url, is_async=True)
+        ) if settings.DATABASE_ASYNC else None,
+    )
+
+
+def _read_urls() -> List[str]:
+    return [url.strip() for url in settings.DATABASE_READ_URLS.split(",") if url.strip()]
+
+
+@lru_cache
+def get_read_router() -> ReplicaRouter:
+    """Get the router over the read replicas (none without DATABASE_READ_URLS)."""
+    return ReplicaRouter(
+        [_create_replica(url) for url in _read_urls()],
+        balancing=settings.DATABASE_READ_BALANCING,
+        max_lag_seconds=settings.DATABASE_READ_MAX_LAG_SECONDS,
+        check_interval_seconds=settings.DATABASE_READ_CHECK_INTERVAL,
+    )
+
+
+# Session.info key holding the staleness bound of sessions reading a replica
+REPLICA_LAG_BOUND = "replica_lag_bound"
 
-# Create SessionLocal class for database sessions
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Create Base class for declarative models
 Base = declarative_base()
@@ -24,8 +98,57 @@ def get_db():
     Dependency to get database session.
     Yields a database session and ensures it's properly closed.
     """
-    db = SessionLocal()
+    db = SessionLocal(bind=get_engine())
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db():
+    """
+    Dependency to get async database session.
+    Yields an AsyncSession and ensures it's properly closed.
+    """
+    async with AsyncSessionLocal(bind=get_async_engine()) as db:
+        yield db
+
+
+def get_replica_db():
+    """
+    Dependency to get a read-only database session on a healthy replica.
+    Falls back to the primary when no replica is healthy.
+    """
+    read_router = get_read_router()
+    if read_router.needs_check():
+        read_router.check()
+    replica = read_router.pick()
+    db = SessionLocal(bind=replica.engine if replica else get_engine())
+    if replica:
+        db.info[REPLICA_LAG_BOUND] = read_router.max_lag_seconds
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_replica_db():
+    """
+    Dependency to get a read-only AsyncSession on a healthy replica.
+    Health checks run in a worker thread so they never block the event loop.
+    """
+    read_router = get_read_router()
+    if read_router.needs_check():
+        await asyncio.to_thread(read_router.check)
+    replica = read_router.pick(is_async=True)
+    async with AsyncSessionLocal(
+        bind=replica.async_engine if replica else get_async_engine()
+    ) as db:
+        if replica:
+            db.info[REPLICA_LAG_BOUND] = read_router.max_lag_seconds
+        yield db
+
+
+# Sessions for read-only queries: replicas when configured, otherwise the primary
+get_read_db = get_replica_db if _read_urls() else get_db
+get_async_read_db = get_async_replica_db if _read_urls() else get_async_db
@@ -0,0 +1,263 @@
+"""
+Maintenance of the denormalized course read model.
+
+CourseReadModel rows hold the pre-assembled course list and detail payloads.
+They are rebuilt for the affected courses inside the same transaction as every
+committed write to courses, lectures, teachers or course_teacher made through a
+Session: unit of work changes as well as update()/delete() statements and
+bulk updates executed with Session.execute().
+
+Writes executed on a plain Connection (raw SQL, Core statements outside a
+Session, other applications) bypass these hooks and leave the affected rows
+stale. After such writes rebuild the read model in full with
+refresh_all_course_read_models(), e.g. `python scripts/rebuild_read_models.py`
+(`make rebuild-read-models`).
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+from sqlalchemy import delete, event, inspect, insert, select, tuple_
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine import Result
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.db.models.course import Course
+from app.db.models.course_read_model import CourseReadModel
+from app.db.models.course_teacher import CourseTeacher
+from app.db.models.lecture import Lecture
+from app.db.models.teacher import Teacher
+
+# Courses rebuilt per round of queries
+REFRESH_BATCH_SIZE = 500
+
+# The deleted_at filters below are explicit because these functions also run on
+# plain Connections (bulk loads), where the Session-level soft-delete criterion
+# of app.db.soft_delete does not apply. Each collection is loaded with its own
+# query so the cost grows with lectures + teachers, not lectures x teachers.
+
+Executor = Union[Session, Connection]
+
+
+def _batches(ids: List[int]) -> Iterable[List[int]]:
+    for start in range(0, len(ids), REFRESH_BATCH_SIZE):
+        yield ids[start:start + REFRESH_BATCH_SIZE]
+
+
+def _version(detail: Dict[str, Any]) -> str:
+    """Content hash of a course detail, used as its ETag fingerprint."""
+    payload = json.dumps(detail, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def refresh_course_read_models(db: Executor, course_ids: Iterable[int]) -> None:
+    """Rebuild the read model rows of the given courses (removing deleted ones)."""
+    ids = sorted(set(course_ids))
+    refreshed_at = datetime.now(timezone.utc)
+
+    for batch in _batches(ids):
+        db.execute(delete(CourseReadModel).where(CourseReadModel.course_id.in_(batch)))
+
+        courses = db.execute(
+            select(
+                Course.id, Course.name, Course.description, Course.thumbnail,
+                Course.slug, Course.created_at,
+            )
+            .where(Course.id.in_(batch))
+            .where(Course.deleted_at.is_(None))
+        ).mappings().all()
+        if not courses:
+            continue
+
+        teachers: Dict[int, List[Dict[str, Any]]] = {}
+        for row in db.execute(
+            select(CourseTeacher.course_id, Teacher.id, Teacher.name)
+            .join(Teacher, Teacher.id == CourseTeacher.teacher_id)
+            .where(CourseTeacher.course_id.in_(batch))
+            .where(Teacher.deleted_at.is_(None))
+            .order_by(CourseTeacher.course_id, Teacher.id)
+        ):
+            teachers.setdefault(row.course_id, []).append({"id": row.id, "name": row.name})
+
+        lectures: Dict[int, List[Dict[str, Any]]] = {}
+        for row in db.execute(
+            select(Lecture.course_id, Lecture.id, Lecture.name, Lecture.description, Lecture.slug)
+            .where(Lecture.course_id.in_(batch))
+            .where(Lecture.deleted_at.is_(None))
+            .order_by(Lecture.course_id, Lecture.id)
+        ):
+            lectures.setdefault(row.course_id, []).append({
+                "id": row.id,
+                "name": row.name,
+                "description": row.description,
+                "slug": row.slug
+            })
+
+        rows = []
+        for course in courses:
+            summary = {
+                "id": course["id"],
+                "name": course["name"],
+                "description": course["description"],
+                "thumbnail": course["thumbnail"],
+                "slug": course["slug"]
+            }
+            detail = {
+                **summary,
+                "teacher_id": teachers.get(course["id"], []),
+                "lectures": lectures.get(course["id"], [])
+            }
+            rows.append({
+                "course_id": course["id"],
+                "slug": course["slug"],
+                "created_at": course["created_at"],
+                "summary": summary,
+                "detail": detail,
+                "version": _version(detail),
+                "refreshed_at": refreshed_at,
+            })
+        db.execute(insert(CourseReadModel), rows)
+
+
+def refresh_all_course_read_models(db: Executor) -> None:
+    """Rebuild the whole read model (backfills and bulk loads)."""
+    db.execute(delete(CourseReadModel))
+    course_ids = db.execute(select(Course.id).where(Course.deleted_at.is_(None))).scalars().all()
+    refresh_course_read_models(db, course_ids)
+
+
+def _affected_course_ids(db: Executor, changes: Dict[str, Set[int]]) -> Set[int]:
+    """Resolve collected changes to the course IDs whose rows must be rebuilt."""
+    course_ids = set(changes["courses"])
+    if changes["teachers"]:
+        course_ids.update(db.execute(
+            select(CourseTeacher.course_id)
+            .where(CourseTeacher.teacher_id.in_(changes["teachers"]))
+        ).scalars())
+    return course_ids
+
+
+def _pending_changes(session: Session) -> Dict[str, Set[int]]:
+    return session.info.setdefault("read_model_changes", {"courses": set(), "teachers": set()})
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_deleted_teacher_courses(session: Session, flush_context: Any, instances: Any) -> None:
+    """
+    Remember the courses of teachers being deleted: the flush removes their
+    course_teacher rows (Teacher.courses is a secondary relationship), so the
+    lookup in _affected_course_ids() would no longer find them.
+    """
+    teacher_ids = [
+        instance.id for instance in session.deleted if isinstance(instance, Teacher)
+    ]
+    if teacher_ids:
+        _pending_changes(session)["courses"].update(session.execute(
+            select(CourseTeacher.course_id).where(CourseTeacher.teacher_id.in_(teacher_ids))
+        ).scalars())
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_read_model_changes(session: Session, flush_context: Any) -> None:
+    """Remember which courses and teachers the flushed changes touch."""
+    changes = _pending_changes(session)
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, Course):
+            changes["courses"].add(instance.id)
+        elif isinstance(instance, (Lecture, CourseTeacher)):
+            changes["courses"].add(instance.course_id)
+            # A row moved to another course also changes the course it left
+            changes["courses"].update(
+                course_id
+                for course_id in inspect(instance).attrs.course_id.history.deleted
+                if course_id is not None
+            )
+        elif isinstance(instance, Teacher):
+            changes["teachers"].add(instance.id)
+
+
+# Primary key columns of the tables feeding the read model
+_KEY_COLUMNS = {
+    Course.__table__: (Course.id,),
+    Teacher.__table__: (Teacher.id,),
+    Lecture.__table__: (Lecture.id,),
+    CourseTeacher.__table__: (CourseTeacher.course_id, CourseTeacher.teacher_id),
+}
+
+
+def _statement_keys(execute_state: ORMExecuteState, columns: tuple) -> List[tuple]:
+    """Primary keys of the rows an update()/delete() statement is about to touch."""
+    parameters = execute_state.parameters
+    if isinstance(parameters, list):
+        # Bulk UPDATE by primary key: one parameter set per row
+        return [tuple(row[column.key] for column in columns) for row in parameters]
+    query = select(*columns).execution_options(include_deleted=True)
+    if execute_state.statement.whereclause is not None:
+        query = query.where(execute_state.statement.whereclause)
+    return [tuple(row) for row in execute_state.session.execute(query, parameters)]
+
+
+def _course_ids_of(session: Session, columns: tuple, keys: List[tuple]) -> Set[int]:
+    """Courses the given lecture or course_teacher rows currently belong to."""
+    if not keys:
+        return set()
+    if columns[0] is Lecture.id:
+        query = select(Lecture.course_id).where(Lecture.id.in_([key[0] for key in keys]))
+    else:
+        query = select(CourseTeacher.course_id).where(tuple_(*columns).in_(keys))
+    return set(session.execute(query.execution_options(include_deleted=True)).scalars())
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_statement_changes(execute_state: ORMExecuteState) -> Optional[Result]:
+    """Remember the courses and teachers touched by update()/delete() statements."""
+    if not (execute_state.is_update or execute_state.is_delete):
+        return None
+    columns = _KEY_COLUMNS.get(execute_state.statement.table)
+    if columns is None:
+        return None
+    session = execute_state.session
+    changes = _pending_changes(session)
+    keys = _statement_keys(execute_state, columns)
+    if columns[0] is Course.id:
+        changes["courses"].update(key[0] for key in keys)
+        return None
+    if columns[0] is Teacher.id:
+        changes["teachers"].update(key[0] for key in keys)
+        return None
+
+    # Lectures and course_teacher rows: the courses they belong to before and,
+    # when the statement moves them, after it runs
+    changes["courses"].update(_course_ids_of(session, columns, keys))
+    result = execute_state.invoke_statement()
+    if execute_state.is_update and keys:
+        if columns[0] is Lecture.id:
+            changes["courses"].update(_course_ids_of(session, columns, keys))
+        else:
+            # The course is part of a course_teacher key: follow the teachers
+            changes["courses"].update(session.execute(
+                select(CourseTeacher.course_id)
+                .where(CourseTeacher.teacher_id.in_({key[1] for key in keys}))
+            ).scalars())
+    return result
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_read_models(session: Session) -> None:
+    """Rebuild the affected read model rows in the committing transaction."""
+    session.flush()
+    changes = session.info.pop("read_model_changes", None)
+    if not changes:
+        return
+    course_ids = _affected_course_ids(session, changes)
+    if course_ids:
+        refresh_course_read_models(session, course_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_read_model_changes(session: Session) -> None:
+    """Forget collected changes that were rolled back."""
+    session.info.pop("read_model_changes", None)
@@ -2,10 +2,17 @@ from .teacher import Teacher
 from .course import Course
 from .lecture import Lecture
 from .course_teacher import CourseTeacher
+from .course_read_model import CourseReadModel
+
+# Registers the session hooks that keep CourseReadModel current
+from app.db import course_read_model  # noqa: E402,F401
+# Registers the SQLite full-text search tables created with the schema
+from app.db import search  # noqa: E402,F401
 
 __all__ = [
     "Teacher",
     "Course",
     "Lecture",
-    "CourseTeacher"
-] 
\ No newline at end of file
+    "CourseTeacher",
+    "CourseReadModel"
+]
@@ -1,27 +1,31 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
+from app.db.soft_delete import SoftDeleteMixin
 
 
-class Course(Base):
+class Course(SoftDeleteMixin, Base):
     __tablename__ = "courses"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=False)
     thumbnail = Column(String(500), nullable=False)
     slug = Column(String(255), unique=True, nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    deleted_at = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships
     teachers = relationship("Teacher", secondary="course_teacher", back_populates="courses")
     lectures = relationship("Lecture", back_populates="course")
 
-    # Indexes for optimization
+    # Indexes for optimization. Partial indexes only cover live rows, since
+    # every ORM query filters deleted_at IS NULL (app.db.soft_delete).
     __table_args__ = (
-        Index('idx_courses_deleted_at', 'deleted_at'),
-        Index('idx_courses_slug_deleted_at', 'slug', 'deleted_at'),
+        Index(
+            'idx_courses_live_created_at_id', 'created_at', 'id',
+            postgresql_where=text('deleted_at IS NULL'),
+            sqlite_where=text('deleted_at IS NULL'),
+        ),
     ) 
\ No newline at end of file
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, JSON
+from app.db.base import Base
+
+
+class CourseReadModel(Base):
+    """
+    Denormalized course rows, pre-assembled for the read endpoints.
+
+    One row per live (not deleted) course, kept current by
+    app.db.course_read_model on every committed catalog write.
+    """
+
+    __tablename__ = "course_read_models"
+
+    course_id = Column(Integer, ForeignKey("courses.id", ondelete="CASCADE"), primary_key=True)
+    slug = Column(String(255), unique=True, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    summary = Column(JSON, nullable=False)
+    detail = Column(JSON, nullable=False)
+    version = Column(String(64), nullable=False)
+    refreshed_at = Column(DateTime(timezone=True), nullable=False)
+
+    # Indexes for optimization
+    __table_args__ = (
+        Index('idx_course_read_models_created_at_course_id', 'created_at', 'course_id'),
+    )
@@ -8,8 +8,7 @@ class CourseTeacher(Base):
     course_id = Column(Integer, ForeignKey("courses.id"), primary_key=True)
     teacher_id = Column(Integer, ForeignKey("teachers.id"), primary_key=True)
 
-    # Indexes for optimization
+    # Indexes for optimization (lookups by course_id use the primary key)
     __table_args__ = (
-        Index('idx_course_teacher_course_id', 'course_id'),
         Index('idx_course_teacher_teacher_id', 'teacher_id'),
     ) 
\ No newline at end of file
@@ -1,13 +1,14 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
+from app.db.soft_delete import SoftDeleteMixin
 
 
-class Lecture(Base):
+class Lecture(SoftDeleteMixin, Base):
     __tablename__ = "lectures"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=False)
@@ -15,15 +16,16 @@ class Lecture(Base):
     video_url = Column(String(500), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    deleted_at = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships
     course = relationship("Course", back_populates="lectures")
 
-    # Indexes for optimization
+    # Indexes for optimization. Partial indexes only cover live rows, since
+    # every ORM query filters deleted_at IS NULL (app.db.soft_delete).
     __table_args__ = (
-        Index('idx_lectures_course_id', 'course_id'),
-        Index('idx_lectures_slug', 'slug'),
-        Index('idx_lectures_deleted_at', 'deleted_at'),
-        Index('idx_lectures_course_id_deleted_at', 'course_id', 'deleted_at'),
+        Index(
+            'idx_lectures_live_course_id_id', 'course_id', 'id',
+            postgresql_where=text('deleted_at IS NULL'),
+            sqlite_where=text('deleted_at IS NULL'),
+        ),
     ) 
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""
+Connection pool configuration and instrumentation.
+
+The engines use instrumented QueuePools that time every checkout, so pool
+saturation shows up as checkout wait time and timeouts instead of silently
+queued requests.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.core.config import Settings
+
+# Upper bounds (milliseconds) of the checkout wait histogram buckets
+WAIT_BUCKETS_MS: Tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class PoolStats:
+    """Checkout counters and wait time histogram of one pool."""
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self._lock = threading.Lock()
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        """Record how long a checkout waited for a connection."""
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_buckets[bisect_left(WAIT_BUCKETS_MS, seconds * 1000)] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters with a cumulative histogram ({"le": count})."""
+        cumulative, buckets = 0, {}
+        for bound, count in zip((*WAIT_BUCKETS_MS, "+Inf"), self.wait_buckets):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": self.wait_seconds_total,
+            "wait_ms_buckets": buckets,
+        }
+
+
+class InstrumentedPoolMixin:
+    """Time every checkout of a QueuePool and count checkout timeouts."""
+
+    stats: PoolStats
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self) -> Any:
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.stats.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        self.stats.record_wait(time.perf_counter() - start)
+        return connection
+
+    def recreate(self) -> Pool:
+        # Keep the counters across engine.dispose()
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    """QueuePool with checkout instrumentation (sync engine)."""
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool with checkout instrumentation (async engine)."""
+
+
+def get_pool_limits(settings: Settings, workers: int) -> Tuple[int, int]:
+    """
+    Pool size and max overflow of each engine when running this many workers.
+
+    The DATABASE_MAX_CONNECTIONS budget is split evenly over every engine of
+    every worker (two per worker in async mode: the sync engine still serves
+    writes and the warm-up), so together they never open more connections to
+    a database server than it allows. DATABASE_POOL_SIZE and
+    DATABASE_MAX_OVERFLOW are upper bounds within each engine's share.
+    """
+    pool_size, max_overflow = settings.DATABASE_POOL_SIZE, settings.DATABASE_MAX_OVERFLOW
+    if settings.DATABASE_MAX_CONNECTIONS <= 0:
+        return pool_size, max_overflow
+    engines = workers * (2 if settings.DATABASE_ASYNC else 1)
+    budget = settings.DATABASE_MAX_CONNECTIONS // engines
+    if budget < 1:
+        raise ValueError(
+            f"DATABASE_MAX_CONNECTIONS={settings.DATABASE_MAX_CONNECTIONS} is less than one "
+            f"connection for each of {engines} engines ({workers} workers); "
+            f"lower WEB_CONCURRENCY or raise the limit"
+        )
+    pool_size = min(pool_size, budget)
+    return pool_size, min(max_overflow, budget - pool_size)
+
+
+def get_pool_options(
+    settings: Settings, database_url: str, is_async: bool = False
+) -> Dict[str, Any]:
+    """
+    Build the create_engine() pool arguments from settings.
+
+    Pools are sized per worker (get_pool_limits). The worker count is read from
+    WEB_CONCURRENCY, which the launcher (app.server) sets to the number of
+    workers it starts; left unset, the process is assumed to run alone.
+
+    In-memory SQLite keeps SQLAlchemy's default single-connection pool, since a
+    QueuePool would hand out connections to separate empty databases.
+    """
+    if database_url.startswith("sqlite") and (
+        database_url.endswith("://") or ":memory:" in database_url
+    ):
+        return {}
+    pool_size, max_overflow = get_pool_limits(settings, max(settings.WEB_CONCURRENCY, 1))
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    }
+
+
+def get_pool_stats(engine: Optional[Engine]) -> Optional[Dict[str, Any]]:
+    """Live occupancy plus checkout counters of an engine's pool."""
+    if engine is None:
+        return None
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"pool": type(pool).__name__}
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+        "timeout_seconds": pool.timeout(),
+        **(pool.stats.as_dict() if isinstance(pool, InstrumentedPoolMixin) else {}),
+    }
@@ -0,0 +1,177 @@
+"""
+Read replica routing for the read-only catalog queries.
+
+Replicas listed in DATABASE_READ_URLS are balanced round-robin or by fewest
+checked-out connections. Each replica is health checked at most once per
+check interval (connectivity plus replication lag); unhealthy or lagging
+replicas are skipped and, with none available, reads go to the primary.
+
+After a write, reads can be pinned to the primary for the lag window so a
+replica still replaying that write never serves (or refills caches with) the
+rows it changed.
+"""
+
+import threading
+import time
+from itertools import count
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from app.db.pool import get_pool_stats
+
+BALANCING_STRATEGIES = ("round_robin", "least_connections")
+
+# Seconds behind the primary; 0 when caught up (an idle primary writes no new
+# transactions, so the last replay timestamp alone would look like lag)
+POSTGRES_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+def replica_lag_seconds(connection: Connection) -> float:
+    """Replication lag of the connected database (0 for non-replicated backends)."""
+    if connection.dialect.name != "postgresql":
+        connection.execute(text("SELECT 1"))
+        return 0.0
+    return float(connection.execute(POSTGRES_LAG_SQL).scalar_one())
+
+
+class Replica:
+    """A read replica's engines and last health check result."""
+
+    def __init__(self, url: str, engine: Engine, async_engine: Optional[AsyncEngine] = None):
+        self.url = url
+        self.engine = engine
+        self.async_engine = async_engine
+        self.healthy = False
+        self.lag_seconds: Optional[float] = None
+        self.error: Optional[str] = None
+        self.checked_at: Optional[float] = None
+        self.checking = False
+
+        # A dropped connection takes the replica out until the next check
+        for target in (engine, async_engine.sync_engine if async_engine else None):
+            if target is not None:
+                event.listen(target, "handle_error", self._on_error)
+
+    def _on_error(self, context: Any) -> None:
+        if context.is_disconnect:
+            self.healthy = False
+            self.error = str(context.original_exception)
+
+    def checked_out(self, is_async: bool = False) -> int:
+        """Connections currently in use on the engine serving the given mode."""
+        engine = self.async_engine.sync_engine if is_async and self.async_engine else self.engine
+        return engine.pool.checkedout() if isinstance(engine.pool, QueuePool) else 0
+
+    @property
+    def masked_url(self) -> str:
+        """The replica URL with the password masked, for logs and stats."""
+        return make_url(self.url).render_as_string(hide_password=True)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Health and pool state, with the password masked in the URL."""
+        return {
+            "url": self.masked_url,
+            "healthy": self.healthy,
+            "lag_seconds": self.lag_seconds,
+            "error": self.error,
+            "pool": get_pool_stats(self.engine),
+        }
+
+
+class ReplicaRouter:
+    """Pick a healthy read replica per session, or None to use the primary."""
+
+    def __init__(
+        self,
+        replicas: List[Replica],
+        balancing: str = "round_robin",
+        max_lag_seconds: float = 5.0,
+        check_interval_seconds: float = 5.0,
+        lag_probe: Callable[[Connection], float] = replica_lag_seconds,
+    ):
+        if balancing not in BALANCING_STRATEGIES:
+            raise ValueError(
+                f"Unknown balancing strategy {balancing!r}, use one of {BALANCING_STRATEGIES}"
+            )
+        self.replicas = replicas
+        self.balancing = balancing
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.lag_probe = lag_probe
+        self.primary_fallbacks = 0
+        self.pinned_reads = 0
+        self._pinned_until = 0.0
+        self._turn = count()
+        self._lock = threading.Lock()
+
+    def _is_due(self, replica: Replica, now: float) -> bool:
+        return not replica.checking and (
+            replica.checked_at is None or now - replica.checked_at >= self.check_interval_seconds
+        )
+
+    def needs_check(self) -> bool:
+        """Whether a replica's health check is due (cheap, no I/O)."""
+        now = time.monotonic()
+        return any(self._is_due(replica, now) for replica in self.replicas)
+
+    def check(self) -> None:
+        """Health check the replicas that are due; concurrent callers skip claimed ones."""
+        with self._lock:
+            now = time.monotonic()
+            due = [replica for replica in self.replicas if self._is_due(replica, now)]
+            for replica in due:
+                replica.checking = True
+        for replica in due:
+            self._check(replica)
+
+    def _check(self, replica: Replica) -> None:
+        try:
+            with replica.engine.connect() as connection:
+                lag = self.lag_probe(connection)
+            replica.lag_seconds = lag
+            replica.healthy = lag <= self.max_lag_seconds
+            replica.error = None if replica.healthy else f"Lagging {lag:.1f}s behind the primary"
+        except Exception as e:
+            replica.healthy = False
+            replica.lag_seconds = None
+            replica.error = str(e)
+        finally:
+            replica.checked_at = time.monotonic()
+            replica.checking = False
+
+    def pin_primary(self) -> None:
+        """Send reads to the primary until healthy replicas have replayed a write."""
+        self._pinned_until = time.monotonic() + self.max_lag_seconds
+
+    def pick(self, is_async: bool = False) -> Optional[Replica]:
+        """The replica for the next read session, or None to fall back to the primary."""
+        if self.replicas and time.monotonic() < self._pinned_until:
+            self.pinned_reads += 1
+            return None
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            self.primary_fallbacks += 1
+            return None
+        if self.balancing == "least_connections":
+            return min(healthy, key=lambda replica: replica.checked_out(is_async))
+        return healthy[next(self._turn) % len(healthy)]
+
+    def stats(self) -> Dict[str, Any]:
+        """Balancing strategy, primary read counts and per-replica health."""
+        return {
+            "balancing": self.balancing,
+            "max_lag_seconds": self.max_lag_seconds,
+            "primary_fallbacks": self.primary_fallbacks,
+            "pinned_reads": self.pinned_reads,
+            "replicas": [replica.as_dict() for replica in self.replicas],
+        }
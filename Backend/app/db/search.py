@@ -0,0 +1,192 @@
+"""
+Full-text search over course and lecture names and descriptions.
+
+PostgreSQL: courses and lectures carry a generated `search_vector` tsvector
+column with a partial GIN index on live rows (migration e2b7d4f1a6c3), queried
+with plainto_tsquery and ranked with ts_rank_cd.
+
+SQLite: one FTS5 table (catalog_fts) kept in sync by triggers on both tables.
+It is created with the schema (Base.metadata.create_all), so the test suite
+and the benchmarks can search too; ranked with bm25.
+
+Both backends match documents containing every query term and weigh names
+above descriptions. Ranks are only comparable within one backend.
+
+Matching uses the index and is cheap, but ranking reads every matching
+document, so a query matching most of the catalog would grow with it. Only
+the newest max_candidates matches are ranked, which bounds the cost of broad
+queries at any catalog size.
+"""
+
+import re
+from typing import List
+
+from sqlalchemy import (
+    DDL,
+    Float,
+    Integer,
+    Select,
+    cast,
+    column,
+    event,
+    func,
+    literal,
+    literal_column,
+    select,
+    table,
+    union_all,
+)
+
+from app.db.models.course import Course
+from app.db.models.lecture import Lecture
+
+# Text search configuration of the generated tsvector columns
+SEARCH_CONFIG = "spanish"
+# bm25 weight of a name match relative to a description match (SQLite)
+NAME_WEIGHT = 10.0
+
+SEARCHABLE_TABLES = ("courses", "lectures")
+
+# SQLite keeps courses and lectures in one FTS5 table so bm25 ranks share term
+# statistics and are comparable. Its rowid encodes the source row:
+# id * 2 + SQLITE_KINDS[table].
+SQLITE_SEARCH_TABLE = "catalog_fts"
+SQLITE_KINDS = {"courses": 0, "lectures": 1}
+
+
+def _sqlite_rowid(table_name: str, row: str) -> str:
+    return f"{row}.id * 2 + {SQLITE_KINDS[table_name]}"
+
+
+def _sqlite_ddl(name: str) -> List[str]:
+    """Shared FTS5 table plus the triggers syncing name/description of a table."""
+    fts = SQLITE_SEARCH_TABLE
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"name, description, tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_search_ai AFTER INSERT ON {name} BEGIN "
+        f"INSERT INTO {fts}(rowid, name, description) "
+        f"VALUES ({_sqlite_rowid(name, 'new')}, new.name, new.description); END",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_search_ad AFTER DELETE ON {name} BEGIN "
+        f"DELETE FROM {fts} WHERE rowid = {_sqlite_rowid(name, 'old')}; END",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_search_au "
+        f"AFTER UPDATE OF name, description ON {name} BEGIN "
+        f"UPDATE {fts} SET name = new.name, description = new.description "
+        f"WHERE rowid = {_sqlite_rowid(name, 'old')}; END",
+    ]
+
+
+# Statements creating the SQLite search table and triggers (also used by the migration)
+SQLITE_SEARCH_DDL = {name: _sqlite_ddl(name) for name in SEARCHABLE_TABLES}
+
+for _model in (Course, Lecture):
+    for _statement in SQLITE_SEARCH_DDL[_model.__tablename__]:
+        event.listen(_model.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+    event.listen(
+        _model.__table__,
+        "after_drop",
+        DDL(f"DROP TABLE IF EXISTS {SQLITE_SEARCH_TABLE}").execute_if(dialect="sqlite"),
+    )
+
+
+def search_terms(query: str) -> List[str]:
+    """Split a user query into search terms (words), dropping punctuation."""
+    return re.findall(r"\w+", query)
+
+
+def _hit_columns(kind: str, model, course_id, rank) -> list:
+    return [
+        literal(kind).label("type"),
+        model.id.label("id"),
+        course_id.label("course_id"),
+        Course.slug.label("course_slug"),
+        model.name.label("name"),
+        model.description.label("description"),
+        model.slug.label("slug"),
+        rank.label("rank"),
+    ]
+
+
+def _postgresql_hits(terms: List[str], max_candidates: int) -> List[Select]:
+    # Imported here: the postgresql dialect package is slow to import and only
+    # needed once a PostgreSQL engine serves a search
+    from sqlalchemy.dialects.postgresql import REGCONFIG, TSVECTOR
+
+    tsquery = func.plainto_tsquery(cast(literal(SEARCH_CONFIG), REGCONFIG), " ".join(terms))
+    statements = []
+    for kind, model in (("course", Course), ("lecture", Lecture)):
+        vector = literal_column(f"{model.__tablename__}.search_vector", TSVECTOR)
+        rank = func.ts_rank_cd(vector, tsquery, type_=Float)
+        course_id = Course.id if model is Course else Lecture.course_id
+        candidates = (
+            select(model.id)
+            .where(vector.bool_op("@@")(tsquery))
+            .order_by(model.id.desc())
+            .limit(max_candidates)
+        )
+        statement = select(*_hit_columns(kind, model, course_id, rank)).where(
+            model.id.in_(candidates)
+        )
+        if model is Lecture:
+            statement = statement.join(Course, Course.id == Lecture.course_id)
+        statements.append(statement)
+    return statements
+
+
+def _sqlite_hits(terms: List[str], max_candidates: int) -> List[Select]:
+    match = " ".join(f'"{term}"' for term in terms)
+    fts = table(SQLITE_SEARCH_TABLE, column("rowid", Integer))
+    fts_column = literal_column(SQLITE_SEARCH_TABLE)
+    # Rowid of the oldest candidate; FTS5 applies rowid ranges while matching
+    oldest_candidate = func.coalesce(
+        select(fts.c.rowid)
+        .where(fts_column.op("MATCH")(match))
+        .order_by(fts.c.rowid.desc())
+        .limit(1)
+        .offset(max_candidates - 1)
+        .scalar_subquery(),
+        0,
+    )
+    # One pass over the index for both kinds (the CTE is materialized once)
+    matches = (
+        select(fts.c.rowid, (-func.bm25(fts_column, NAME_WEIGHT, 1.0, type_=Float)).label("rank"))
+        .where(fts_column.op("MATCH")(match))
+        .where(fts.c.rowid >= oldest_candidate)
+        .cte("matches")
+    )
+    statements = []
+    for kind, model in (("course", Course), ("lecture", Lecture)):
+        course_id = Course.id if model is Course else Lecture.course_id
+        statement = (
+            select(*_hit_columns(kind, model, course_id, matches.c.rank))
+            .select_from(matches)
+            .join(model, model.id == matches.c.rowid.op("/")(2))
+            .where(matches.c.rowid.op("%")(2) == SQLITE_KINDS[model.__tablename__])
+        )
+        if model is Lecture:
+            statement = statement.join(Course, Course.id == Lecture.course_id)
+        statements.append(statement)
+    return statements
+
+
+def search_statement(
+    dialect: str, terms: List[str], limit: int, offset: int, max_candidates: int
+) -> Select:
+    """
+    Build the ranked search over courses and lectures for one page of hits.
+    Fetches one extra row to know whether a next page exists.
+    """
+    if dialect == "postgresql":
+        statements = _postgresql_hits(terms, max_candidates)
+    elif dialect == "sqlite":
+        statements = _sqlite_hits(terms, max_candidates)
+    else:
+        raise NotImplementedError(f"Full-text search is not supported on {dialect}")
+
+    hits = union_all(*statements).subquery("hits")
+    return (
+        select(hits)
+        .order_by(hits.c.rank.desc(), hits.c.type, hits.c.id)
+        .limit(limit + 1)
+        .offset(offset)
+    )
@@ -7,7 +7,7 @@ import asyncio
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import get_settings
-from app.db.models import Teacher, Course, Lecture, CourseTeacher
+from app.db.models import Teacher, Course, Lecture, CourseTeacher, CourseReadModel
 
 
 def create_sample_data():
@@ -21,6 +21,7 @@ def create_sample_data():
     with SessionLocal() as session:
         # Clear existing data (for development only)
         print("🗑️  Clearing existing data...")
+        session.query(CourseReadModel).delete()
         session.query(CourseTeacher).delete()
         session.query(Lecture).delete()
         session.query(Course).delete()
@@ -0,0 +1,61 @@
+"""
+Global soft-delete filtering.
+
+Every ORM select executed through a Session, including relationship lazy and
+selectin loads, excludes soft-deleted rows of models that inherit
+SoftDeleteMixin. Statements can opt out with
+execution_options(include_deleted=True), e.g. to restore a deleted row.
+
+Adding the criterion copies the statement, so its cache key is generated
+again on every execution. Statements built once and executed many times
+attach it up front with with_soft_delete_criteria() instead.
+"""
+
+from sqlalchemy import Column, DateTime, Executable, event
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+from sqlalchemy.orm.util import LoaderCriteriaOption
+
+
+class SoftDeleteMixin:
+    """Models whose rows are soft deleted by setting deleted_at."""
+
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+
+SOFT_DELETE_CRITERIA = with_loader_criteria(
+    SoftDeleteMixin,
+    lambda cls: cls.deleted_at.is_(None),
+    include_aliases=True,
+)
+
+
+def with_soft_delete_criteria(statement: Executable) -> Executable:
+    """Attach the soft-delete criterion once, so executions skip adding it."""
+    return statement.options(SOFT_DELETE_CRITERIA).execution_options(
+        soft_delete_criteria=True
+    )
+
+
+def _needs_criteria(execute_state: ORMExecuteState) -> bool:
+    if not execute_state.is_select or execute_state.is_column_load:
+        return False
+    if execute_state.execution_options.get("include_deleted", False):
+        return False
+    if execute_state.execution_options.get("soft_delete_criteria", False):
+        return False
+    if execute_state.is_relationship_load:
+        # Eager and lazy loads inherit the criterion of the query that loaded
+        # the parent; only lazy loads from objects added or refreshed in the
+        # session (which carry no load options) need it added here
+        parent = execute_state.lazy_loaded_from
+        return parent is not None and not any(
+            isinstance(option, LoaderCriteriaOption) for option in parent.load_options
+        )
+    return True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_soft_deleted(execute_state: ORMExecuteState) -> None:
+    """Add the deleted_at IS NULL criterion to every soft-deletable entity."""
+    if _needs_criteria(execute_state):
+        execute_state.statement = execute_state.statement.options(SOFT_DELETE_CRITERIA)
@@ -0,0 +1,204 @@
+"""
+Large-scale synthetic catalog for capacity testing.
+
+Unlike app/db/seed.py, rows are generated in batches and bulk loaded: with
+PostgreSQL COPY (psycopg2) or, on other databases, executemany inserts. A
+catalog with millions of lectures loads in minutes. Generation is seeded, so
+the same parameters always produce the same catalog.
+"""
+
+import csv
+import io
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import create_engine, delete, func, insert, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.config import get_settings
+from app.db.course_read_model import refresh_all_course_read_models
+from app.db.models import Course, CourseReadModel, CourseTeacher, Lecture, Teacher
+
+# Rows per COPY / executemany round trip
+BATCH_SIZE = 10_000
+
+TOPICS = [
+    "Programación", "Diseño", "Introducción a", "Análisis de", "Gestión de",
+    "Fundamentos de", "Desarrollo con", "Administración de", "Fotografía con",
+]
+SUBJECTS = [
+    "Python", "React", "JavaScript", "bases de datos", "algoritmos", "redes",
+    "marketing digital", "finanzas personales", "inteligencia artificial",
+    "videojuegos", "producción audiovisual", "Node.js", "FastAPI",
+]
+LEVELS = ["básico", "intermedio", "avanzado", "práctico", "profesional"]
+LESSONS = [
+    "Introducción", "Configuración del entorno", "Conceptos clave", "Primeros pasos",
+    "Buenas prácticas", "Errores comunes", "Proyecto práctico", "Optimización",
+    "Pruebas", "Despliegue", "Repaso", "Cierre del curso",
+]
+FIRST_NAMES = ["Juan", "María", "Carlos", "Ana", "David", "Lucía", "Jorge", "Sofía"]
+LAST_NAMES = ["Pérez", "González", "Rodríguez", "Martínez", "López", "Gómez", "Díaz"]
+
+Row = Tuple[Any, ...]
+
+
+def _batches(rows: Iterable[Row]) -> Iterator[List[Row]]:
+    batch: List[Row] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _copy_batch(connection: Connection, table: str, columns: Sequence[str], batch: List[Row]) -> None:
+    """Load a batch with COPY ... FROM STDIN (None is written as an unquoted NULL)."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(batch)
+    buffer.seek(0)
+    cursor = connection.connection.driver_connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer
+        )
+    finally:
+        cursor.close()
+
+
+def _bulk_load(connection: Connection, model: Any, columns: Sequence[str], rows: Iterable[Row]) -> int:
+    """Bulk load rows (tuples in column order) in batches; returns the row count."""
+    use_copy = connection.dialect.name == "postgresql" and connection.dialect.driver == "psycopg2"
+    count = 0
+    for batch in _batches(rows):
+        if use_copy:
+            _copy_batch(connection, model.__tablename__, columns, batch)
+        else:
+            connection.execute(insert(model), [dict(zip(columns, row)) for row in batch])
+        count += len(batch)
+    return count
+
+
+def _clear(connection: Connection) -> None:
+    """Remove the existing catalog (for development only)."""
+    if connection.dialect.name == "postgresql":
+        connection.execute(text(
+            "TRUNCATE course_read_models, course_teacher, lectures, courses, teachers "
+            "RESTART IDENTITY"
+        ))
+        return
+    for model in (CourseReadModel, CourseTeacher, Lecture, Course, Teacher):
+        connection.execute(delete(model))
+
+
+def _reset_sequences(connection: Connection) -> None:
+    """Move PostgreSQL id sequences past the explicitly loaded ids."""
+    if connection.dialect.name != "postgresql":
+        return
+    for model in (Teacher, Course, Lecture):
+        table = model.__tablename__
+        connection.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"(SELECT COALESCE(MAX(id), 0) + 1 FROM {table}), false)"
+        ))
+
+
+def create_synthetic_catalog(
+    courses: int = 1_000,
+    lectures_per_course: int = 100,
+    teachers_per_course: int = 2,
+    deleted_fraction: float = 0.0,
+    engine: Optional[Engine] = None,
+    seed: int = 42,
+) -> Dict[str, int]:
+    """
+    Replace the catalog with a synthetic one of the requested size.
+
+    Teachers are shared between courses (one per ten courses, at least
+    teachers_per_course). deleted_fraction of the teachers, courses and
+    lectures are soft-deleted. Returns the number of rows loaded per table.
+    """
+    if not 0 <= deleted_fraction <= 1:
+        raise ValueError("deleted_fraction must be between 0 and 1")
+    if engine is None:
+        engine = create_engine(get_settings().DATABASE_URL)
+
+    rng = random.Random(seed)
+    teachers = max(teachers_per_course, courses // 10, 1)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def deleted_at(created_at: datetime) -> Optional[datetime]:
+        return created_at + timedelta(days=30) if rng.random() < deleted_fraction else None
+
+    def teacher_rows() -> Iterator[Row]:
+        for id in range(1, teachers + 1):
+            created_at = start + timedelta(minutes=id)
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            yield (id, name, f"teacher{id}@platzi.com", created_at, created_at,
+                   deleted_at(created_at))
+
+    def course_rows() -> Iterator[Row]:
+        for id in range(1, courses + 1):
+            created_at = start + timedelta(minutes=id)
+            subject = rng.choice(SUBJECTS)
+            name = f"{rng.choice(TOPICS)} {subject} {rng.choice(LEVELS)}"
+            description = (
+                f"Aprende {subject} paso a paso con proyectos reales. "
+                f"Curso número {id} del catálogo de Platziflix."
+            )
+            yield (id, name, description, f"https://static.platzi.com/media/courses/{id}.png",
+                   f"curso-{id}", created_at, created_at, deleted_at(created_at))
+
+    def course_teacher_rows() -> Iterator[Row]:
+        for course_id in range(1, courses + 1):
+            for teacher_id in rng.sample(range(1, teachers + 1), teachers_per_course):
+                yield (course_id, teacher_id)
+
+    def lecture_rows() -> Iterator[Row]:
+        id = 0
+        for course_id in range(1, courses + 1):
+            created_at = start + timedelta(minutes=course_id)
+            for n in range(1, lectures_per_course + 1):
+                id += 1
+                name = f"{rng.choice(LESSONS)} {n}"
+                description = f"Clase {n} del curso {course_id}: {name.lower()}."
+                yield (id, course_id, name, description, f"clase-{n}",
+                       f"https://videos.platzi.com/{course_id}/{n}", created_at, created_at,
+                       deleted_at(created_at))
+
+    timestamps = ("created_at", "updated_at", "deleted_at")
+    counts: Dict[str, int] = {}
+    with engine.begin() as connection:
+        print("🗑️  Clearing existing data...")
+        _clear(connection)
+
+        print(f"👨‍🏫 Loading {teachers} teachers...")
+        counts["teachers"] = _bulk_load(
+            connection, Teacher, ("id", "name", "email", *timestamps), teacher_rows()
+        )
+        print(f"📚 Loading {courses} courses...")
+        counts["courses"] = _bulk_load(
+            connection, Course,
+            ("id", "name", "description", "thumbnail", "slug", *timestamps), course_rows(),
+        )
+        print("🔗 Loading course-teacher relationships...")
+        counts["course_teacher"] = _bulk_load(
+            connection, CourseTeacher, ("course_id", "teacher_id"), course_teacher_rows()
+        )
+        print(f"🎥 Loading {courses * lectures_per_course} lectures...")
+        counts["lectures"] = _bulk_load(
+            connection, Lecture,
+            ("id", "course_id", "name", "description", "slug", "video_url", *timestamps),
+            lecture_rows(),
+        )
+        _reset_sequences(connection)
+
+        print("🧱 Rebuilding course read models...")
+        refresh_all_course_read_models(connection)
+        counts["course_read_models"] = connection.execute(
+            select(func.count()).select_from(CourseReadModel)
+        ).scalar_one()
+    return counts
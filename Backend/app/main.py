@@ -1,13 +1,94 @@
+import asyncio
 from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, List, Optional, Union
 
-from fastapi import Depends, FastAPI, HTTPException
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.core.config import Settings, get_settings
-from app.db.base import get_db
+from app.core.etag import etag_matches, make_etag, variant_etag
+from app.core.metrics import MetricsMiddleware, get_metrics_registry, render_gauges
+from app.db.base import SessionLocal, get_async_engine, get_db, get_engine, get_read_router
+from app.db.pool import PoolTimeoutError, get_pool_stats
+from app.schemas import (
+    CourseBatch,
+    CourseDetail,
+    CoursePage,
+    CourseSummary,
+    LectureBatch,
+    LectureDetail,
+    SearchPage,
+    SuggestPage,
+)
+from app.services.concurrency import run_service_call
+from app.services.course_cache import (
+    get_catalog_cache,
+    get_response_body_cache,
+    get_shared_catalog_cache,
+    replica_lag_bound,
+)
 from app.services.course_service import CourseService, get_course_service
+from app.services.pagination import InvalidCursorError
+from app.services.suggest import get_suggest_index, load_suggest_index, suggest
+
+# The compression backends and the warm-up are imported where they are used,
+# keeping them off the import path of the app (app/tests/test_startup.py)
+
+
+def _load_suggest_index() -> int:
+    with SessionLocal(bind=get_engine()) as db:
+        return load_suggest_index(db)
+
+
+async def _prepare_worker(settings: Settings) -> None:
+    """
+    Load the suggest index and warm up, then report ready (GET /ready).
+
+    Failed steps are retried with exponential backoff; until they succeed
+    the worker is not ready, unless WARMUP_READY_ON_FAILURE.
+    """
+    from app.services.warmup import get_warmup_status, warm_up
+
+    status = get_warmup_status()
+    status.start()
+    suggest_loaded = False
+    warmed_up = not settings.WARMUP_ENABLED
+    delay = settings.WARMUP_RETRY_BACKOFF_SECONDS
+    while True:
+        errors = []
+        if not suggest_loaded:
+            try:
+                titles = await run_in_threadpool(_load_suggest_index)
+                status.summary["suggest_titles"] = titles
+                suggest_loaded = True
+                print(f"🔎 Suggest index: {titles} titles")
+            except Exception as e:
+                errors.append(f"suggest index: {e}")
+                print(f"⚠️ Suggest index not loaded: {e}")
+        if not warmed_up:
+            try:
+                status.summary.update(await warm_up(settings))
+                warmed_up = True
+                print(f"🔥 Warm-up: {status.summary['connections']} connections, "
+                      f"{status.summary['service_calls']} service calls")
+                for reason in status.summary["skipped_replicas"]:
+                    print(f"⚠️ Warm-up skipped replica {reason}")
+            except Exception as e:
+                errors.append(f"warm-up: {e}")
+                print(f"⚠️ Warm-up failed: {e}")
+        status.finish("; ".join(errors) or None, settings.WARMUP_READY_ON_FAILURE)
+        if not errors:
+            print(f"✅ Ready in {status.duration_seconds:.2f}s")
+            return
+        print(f"🔁 Retrying startup work in {delay:.1f}s")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, settings.WARMUP_RETRY_MAX_BACKOFF_SECONDS)
 
 
 @asynccontextmanager
@@ -18,10 +99,22 @@ async def lifespan(app: FastAPI):
     print(f"🚀 Starting {settings.PROJECT_NAME} v{settings.VERSION}")
     print(f"📊 Environment: {settings.ENVIRONMENT}")
     print(f"🔧 Debug mode: {settings.DEBUG}")
+    # In the background, so /health answers while /ready waits for it
+    preparation = asyncio.create_task(_prepare_worker(settings))
     
     yield
     
-    # Shutdown
+    # Shutdown: stop taking traffic before releasing resources
+    from app.services.warmup import get_warmup_status
+
+    get_warmup_status().ready = False
+    preparation.cancel()
+    async_engine = get_async_engine()
+    if async_engine is not None:
+        await async_engine.dispose()
+    for replica in get_read_router().replicas:
+        if replica.async_engine is not None:
+            await replica.async_engine.dispose()
     print(f"👋 Shutting down {settings.PROJECT_NAME}")
 
 
@@ -35,6 +128,7 @@ app = FastAPI(
     description="Plataforma de cursos online Platziflix",
     debug=settings.DEBUG,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -46,6 +140,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress the remaining responses; catalog routes serve precompressed bodies
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.COMPRESSION_MIN_SIZE,
+    compresslevel=settings.COMPRESSION_GZIP_LEVEL,
+)
+
+# Outermost, so latency covers every other middleware
+app.add_middleware(
+    MetricsMiddleware,
+    repeat_warning_threshold=settings.QUERY_REPEAT_WARNING_THRESHOLD,
+)
+
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    """Answer 503 when no database connection frees up within the pool timeout."""
+    return ORJSONResponse(
+        status_code=503,
+        content={"detail": "Database connection pool exhausted"},
+        headers={"Retry-After": "1"},
+    )
+
 
 @app.get("/")
 async def root():
@@ -70,8 +187,24 @@ async def health_check():
     }
 
 
+@app.get("/ready")
+async def readiness_check():
+    """
+    Readiness probe for load balancers: 503 until this worker has loaded
+    the suggest index and finished warming up (retried until they succeed),
+    and again while shutting down.
+    """
+    from app.services.warmup import get_warmup_status
+
+    status = get_warmup_status()
+    return ORJSONResponse(
+        status_code=200 if status.ready else 503,
+        content={"status": "ready" if status.ready else "not_ready", **status.as_dict()},
+    )
+
+
 @app.get("/db-test")
-async def db_test(db: Session = Depends(get_db)):
+def db_test(db: Session = Depends(get_db)):
     """Test database connection."""
     try:
         # Test database connection by executing a simple query
@@ -88,48 +221,373 @@ async def db_test(db: Session = Depends(get_db)):
         }
 
 
-@app.get("/courses")
-async def get_courses(course_service: CourseService = Depends(get_course_service)):
-    """Get all courses."""
+@app.get("/cache-stats")
+async def cache_stats():
+    """Catalog cache counters and hit ratios per tier."""
+    cache = get_catalog_cache()
+    body_cache = get_response_body_cache()
+    shared_cache = get_shared_catalog_cache()
+    return {
+        "enabled": settings.CACHE_ENABLED,
+        "local": {
+            "entries": len(cache),
+            "max_entries": cache.max_entries,
+            "ttl_seconds": cache.ttl_seconds,
+            **cache.stats.as_dict()
+        },
+        "bodies": {
+            "entries": len(body_cache),
+            "max_entries": body_cache.max_entries,
+            **body_cache.stats.as_dict()
+        },
+        "shared": {
+            "backend": settings.SHARED_CACHE_BACKEND,
+            "ttl_seconds": shared_cache.ttl_seconds,
+            **shared_cache.stats.as_dict()
+        } if shared_cache else None
+    }
+
+
+@app.get("/pool-stats")
+async def pool_stats():
+    """Live connection pool occupancy, checkout wait histogram and timeouts."""
+    async_engine = get_async_engine()
+    read_router = get_read_router()
+    return {
+        "sync": get_pool_stats(get_engine()),
+        "async": get_pool_stats(async_engine.sync_engine) if async_engine else None,
+        "read_replicas": read_router.stats() if read_router.replicas else None
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Request, database and pool metrics in the Prometheus text format."""
+    pools = {"sync": get_pool_stats(get_engine())}
+    async_engine = get_async_engine()
+    if async_engine is not None:
+        pools["async"] = get_pool_stats(async_engine.sync_engine)
+
+    body = get_metrics_registry().render()
+    for name, key, help_text in (
+        ("db_pool_checked_out", "checked_out", "Connections currently checked out."),
+        ("db_pool_overflow", "overflow", "Overflow connections currently open."),
+        ("db_pool_checkout_timeouts", "timeouts", "Checkouts that timed out waiting for a connection."),
+    ):
+        body += render_gauges(name, help_text, {
+            (("engine", engine_name),): stats[key]
+            for engine_name, stats in pools.items()
+            if key in stats
+        })
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
+
+
+@app.get("/compression-stats")
+async def compression_stats():
+    """Compression ratio and CPU cost per content coding of catalog responses."""
+    from app.core.compression import get_compressor
+
+    compressor = get_compressor()
+    return {
+        "min_size": compressor.min_size,
+        "encodings": {
+            encoding: stats.as_dict() for encoding, stats in compressor.stats.items()
+        }
+    }
+
+
+def _etag_headers(etag: str) -> dict:
+    """Headers sent with every catalog response so clients revalidate."""
+    return {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+
+
+async def _catalog_response(
+    request: Request,
+    course_service: CourseService,
+    etag: str,
+    load: Callable[[], Awaitable[Optional[Any]]],
+    not_found_detail: str,
+) -> Response:
+    """
+    Render a catalog resource identified by a strong ETag.
+
+    Returns 304 when the client already has it (in any content coding),
+    otherwise the orjson-encoded body in the negotiated coding. The encoded
+    body and its compressed variants are cached under the ETag (only for the
+    replica lag bound when course_service reads a replica).
+    """
+    from app.core.compression import EncodedBody, get_compressor
+
+    compressor = get_compressor()
+    if_none_match = request.headers.get("if-none-match")
+    for encoding in (None, *compressor.encodings):
+        if etag_matches(if_none_match, variant_etag(etag, encoding)):
+            return Response(
+                status_code=304, headers=_etag_headers(variant_etag(etag, encoding))
+            )
+
+    body_cache = get_response_body_cache()
+    hit, encoded = body_cache.get(etag)
+    if not hit:
+        value = await load()
+        if value is None:
+            raise HTTPException(status_code=404, detail=not_found_detail)
+        encoded = EncodedBody(orjson.dumps(value))
+        body_cache.set(etag, encoded, ttl_seconds=replica_lag_bound(course_service))
+
+    body, encoding = encoded.variant(
+        compressor.negotiate(request.headers.get("accept-encoding")), compressor
+    )
+    headers = _etag_headers(variant_etag(etag, encoding))
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(body, media_type="application/json", headers=headers)
+
+
+def _batch_keys(raw: str, convert: Callable[[str], Any], max_size: int, name: str) -> List[Any]:
+    """
+    Parse a comma-separated batch parameter into unique keys, keeping their order.
+    Raises 400 when it is empty, malformed or larger than max_size.
+    """
+    try:
+        keys = list(dict.fromkeys(convert(key.strip()) for key in raw.split(",") if key.strip()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name}")
+    if not keys:
+        raise HTTPException(status_code=400, detail=f"At least one of {name} is required")
+    if len(keys) > max_size:
+        raise HTTPException(status_code=400, detail=f"At most {max_size} {name} per request")
+    return keys
+
+
+@app.get("/courses", response_model=Union[List[CourseSummary], CoursePage])
+async def get_courses(
+    request: Request,
+    limit: Optional[int] = Query(default=None, ge=1, le=settings.COURSES_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    course_service: CourseService = Depends(get_course_service),
+):
+    """
+    Get courses.
+
+    Passing limit and/or cursor returns a keyset-paginated page
+    ({"items": [...], "next_cursor": ...}); without them the full
+    list is returned for compatibility with existing clients.
+    Supports conditional GET through ETag / If-None-Match.
+    """
+    try:
+        version = await run_service_call(course_service.get_courses_version)
+
+        if limit is None and cursor is None:
+            return await _catalog_response(
+                request,
+                course_service,
+                make_etag("courses", version),
+                lambda: run_service_call(course_service.get_courses),
+                "Courses not found",
+            )
+
+        limit = limit or settings.COURSES_PAGE_SIZE
+        return await _catalog_response(
+            request,
+            course_service,
+            make_etag("courses_page", limit, cursor, version),
+            lambda: run_service_call(course_service.get_courses_page, limit, cursor),
+            "Courses not found",
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except PoolTimeoutError:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching courses: {str(e)}")
+
+
+@app.get("/courses/batch", response_model=CourseBatch)
+async def get_courses_batch(
+    request: Request,
+    slugs: str = Query(description="Comma-separated course slugs"),
+    course_service: CourseService = Depends(get_course_service),
+):
+    """
+    Get several course details in one request.
+
+    Resolved with a fixed number of queries regardless of how many slugs are
+    requested. Items keep the request order; missing slugs are reported per
+    item with an error instead of failing the batch.
+    Supports conditional GET through ETag / If-None-Match.
+    """
+    requested = _batch_keys(slugs, str, settings.COURSES_BATCH_MAX_SIZE, "slugs")
+
+    async def load_batch():
+        courses = await run_service_call(course_service.get_courses_by_slugs, requested)
+        return {
+            "items": [
+                {"slug": slug, "course": courses[slug], "error": None}
+                if slug in courses
+                else {"slug": slug, "course": None, "error": "Course not found"}
+                for slug in requested
+            ]
+        }
+
     try:
-        courses = course_service.get_courses()
-        return courses
+        versions = await run_service_call(course_service.get_courses_versions, requested)
+
+        return await _catalog_response(
+            request,
+            course_service,
+            make_etag("courses_batch", requested, versions),
+            load_batch,
+            "Courses not found",
+        )
+    except PoolTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching courses: {str(e)}")
 
 
-@app.get("/courses/{slug}")
-async def get_course(slug: str, course_service: CourseService = Depends(get_course_service)):
-    """Get a course by slug."""
+@app.get("/courses/{slug}", response_model=CourseDetail)
+async def get_course(
+    slug: str, request: Request, course_service: CourseService = Depends(get_course_service)
+):
+    """Get a course by slug. Supports conditional GET through ETag / If-None-Match."""
     try:
-        course = course_service.get_course_by_slug(slug)
+        version = await run_service_call(course_service.get_course_version, slug)
         
-        if not course:
+        if not version:
             raise HTTPException(status_code=404, detail="Course not found")
         
-        return course
-    except HTTPException:
+        return await _catalog_response(
+            request,
+            course_service,
+            make_etag("course", slug, version),
+            lambda: run_service_call(course_service.get_course_by_slug, slug),
+            "Course not found",
+        )
+    except (HTTPException, PoolTimeoutError):
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching course: {str(e)}")
 
 
-@app.get("/lectures/{lecture_id}")
-async def get_lecture(lecture_id: int, course_service: CourseService = Depends(get_course_service)):
-    """Get a specific lecture by lecture ID."""
+@app.get("/lectures", response_model=LectureBatch)
+async def get_lectures(
+    request: Request,
+    ids: str = Query(description="Comma-separated lecture IDs"),
+    course_service: CourseService = Depends(get_course_service),
+):
+    """
+    Get several lectures in one request (e.g. neighbours the player prefetches).
+
+    Resolved with a single IN query. Items keep the request order; missing IDs
+    are reported per item with an error instead of failing the batch.
+    Supports conditional GET through ETag / If-None-Match.
+    """
+    requested = _batch_keys(ids, int, settings.LECTURES_BATCH_MAX_SIZE, "ids")
+
     try:
-        lecture = course_service.get_lecture_by_id(lecture_id)
+        lectures = {
+            lecture["id"]: lecture
+            for lecture in await run_service_call(course_service.get_lectures_by_ids, requested)
+        }
+        batch = {
+            "items": [
+                {"id": lecture_id, "lecture": lectures[lecture_id], "error": None}
+                if lecture_id in lectures
+                else {"id": lecture_id, "lecture": None, "error": "Lecture not found"}
+                for lecture_id in requested
+            ]
+        }
+
+        async def load_batch():
+            return batch
+
+        # The rows are already loaded, so the ETag hashes the response itself
+        return await _catalog_response(
+            request, course_service, make_etag("lectures", batch), load_batch, "Lectures not found"
+        )
+    except PoolTimeoutError:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching lectures: {str(e)}")
+
+
+@app.get("/lectures/{lecture_id}", response_model=LectureDetail)
+async def get_lecture(
+    lecture_id: int, request: Request, course_service: CourseService = Depends(get_course_service)
+):
+    """Get a specific lecture by lecture ID. Supports conditional GET through ETag / If-None-Match."""
+    try:
+        version = await run_service_call(course_service.get_lecture_version, lecture_id)
         
-        if not lecture:
+        if not version:
             raise HTTPException(status_code=404, detail="Lecture not found")
         
-        return lecture
-    except HTTPException:
+        return await _catalog_response(
+            request,
+            course_service,
+            make_etag("lecture", lecture_id, version),
+            lambda: run_service_call(course_service.get_lecture_by_id, lecture_id),
+            "Lecture not found",
+        )
+    except (HTTPException, PoolTimeoutError):
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching lecture: {str(e)}")
 
 
+@app.get("/search", response_model=SearchPage)
+async def search(
+    request: Request,
+    q: str = Query(min_length=1, max_length=200, description="Words to search for"),
+    limit: Optional[int] = Query(default=None, ge=1, le=settings.SEARCH_MAX_PAGE_SIZE),
+    offset: int = Query(default=0, ge=0, le=settings.SEARCH_MAX_OFFSET),
+    course_service: CourseService = Depends(get_course_service),
+):
+    """
+    Full-text search over course and lecture names and descriptions.
+
+    Hits contain every word of q and are ranked best first, names weighing
+    more than descriptions; pass next_offset back to fetch the following page.
+    Supports conditional GET through ETag / If-None-Match.
+    """
+    limit = limit or settings.SEARCH_PAGE_SIZE
+
+    try:
+        page = await run_service_call(course_service.search, q, limit, offset)
+
+        async def load_page():
+            return page
+
+        # The hits are already loaded, so the ETag hashes the response itself
+        return await _catalog_response(
+            request, course_service, make_etag("search", page), load_page, "No results"
+        )
+    except PoolTimeoutError:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching: {str(e)}")
+
+
+@app.get("/suggest", response_model=SuggestPage)
+async def get_suggestions(
+    q: str = Query(min_length=1, max_length=200, description="Prefix typed so far"),
+    limit: Optional[int] = Query(default=None, ge=1, le=settings.SUGGEST_MAX_LIMIT),
+):
+    """
+    Search-as-you-type suggestions: courses and lectures with a word sequence in
+    their name starting with q, accents and case ignored. Served from memory,
+    on the event loop, without a database round trip.
+    """
+    return {"items": suggest(q, limit or settings.SUGGEST_LIMIT)}
+
+
+@app.get("/suggest-stats")
+async def suggest_stats():
+    """Size and approximate memory footprint of the suggestion index."""
+    return get_suggest_index().stats()
+
+
 if __name__ == "__main__":
     import uvicorn
     
@@ -0,0 +1,35 @@
+"""Response schemas for the API contracts (specs/00_contracts.md)."""
+
+from .course import (
+    CourseBatch,
+    CourseBatchItem,
+    CourseDetail,
+    CoursePage,
+    CourseSummary,
+    LectureBatch,
+    LectureBatchItem,
+    LectureDetail,
+    LectureSummary,
+    SearchHit,
+    SearchPage,
+    SuggestHit,
+    SuggestPage,
+    TeacherSummary,
+)
+
+__all__ = [
+    "CourseBatch",
+    "CourseBatchItem",
+    "CourseDetail",
+    "CoursePage",
+    "CourseSummary",
+    "LectureBatch",
+    "LectureBatchItem",
+    "LectureDetail",
+    "LectureSummary",
+    "SearchHit",
+    "SearchPage",
+    "SuggestHit",
+    "SuggestPage",
+    "TeacherSummary",
+]
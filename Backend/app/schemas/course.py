@@ -0,0 +1,115 @@
+"""Response models for the course, course detail, lecture, search and suggest contracts."""
+
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel
+
+
+class CourseSummary(BaseModel):
+    """Item of GET /courses."""
+
+    id: int
+    name: str
+    description: str
+    thumbnail: str
+    slug: str
+
+
+class CoursePage(BaseModel):
+    """Keyset-paginated GET /courses?limit=&cursor= response."""
+
+    items: List[CourseSummary]
+    next_cursor: Optional[str] = None
+
+
+class TeacherSummary(BaseModel):
+    """Teacher entry of a course detail."""
+
+    id: int
+    name: str
+
+
+class LectureSummary(BaseModel):
+    """Lecture entry of a course detail."""
+
+    id: int
+    name: str
+    description: str
+    slug: str
+
+
+class CourseDetail(CourseSummary):
+    """GET /courses/{slug} response."""
+
+    teacher_id: List[TeacherSummary]
+    lectures: List[LectureSummary]
+
+
+class CourseBatchItem(BaseModel):
+    """One requested slug of GET /courses/batch: the course or why it is missing."""
+
+    slug: str
+    course: Optional[CourseDetail] = None
+    error: Optional[str] = None
+
+
+class CourseBatch(BaseModel):
+    """GET /courses/batch response, in request order."""
+
+    items: List[CourseBatchItem]
+
+
+class LectureDetail(LectureSummary):
+    """GET /lectures/{lecture_id} response."""
+
+    video_url: str
+
+
+class LectureBatchItem(BaseModel):
+    """One requested ID of GET /lectures: the lecture or why it is missing."""
+
+    id: int
+    lecture: Optional[LectureDetail] = None
+    error: Optional[str] = None
+
+
+class LectureBatch(BaseModel):
+    """GET /lectures response, in request order."""
+
+    items: List[LectureBatchItem]
+
+
+class SearchHit(BaseModel):
+    """Course or lecture matching a GET /search query."""
+
+    type: Literal["course", "lecture"]
+    id: int
+    course_id: int
+    course_slug: str
+    name: str
+    description: str
+    slug: str
+    rank: float
+
+
+class SearchPage(BaseModel):
+    """GET /search response, best matches first."""
+
+    items: List[SearchHit]
+    next_offset: Optional[int] = None
+
+
+class SuggestHit(BaseModel):
+    """Course or lecture whose name matches a GET /suggest prefix."""
+
+    type: Literal["course", "lecture"]
+    id: int
+    course_id: int
+    name: str
+    slug: str
+
+
+class SuggestPage(BaseModel):
+    """GET /suggest response."""
+
+    items: List[SuggestHit]
@@ -0,0 +1,130 @@
+"""
+Production server launcher.
+
+Usage (from the Backend directory):
+    python -m app.server
+
+Starts uvicorn with WEB_CONCURRENCY worker processes (one per available CPU by
+default), uvloop and httptools when installed, and the listen backlog and
+keep-alive timeout from the settings. Each worker's connection pools are
+sized so that all workers together stay within DATABASE_MAX_CONNECTIONS.
+
+On SIGTERM or SIGINT each worker first reports not ready (GET /ready answers
+503) while it keeps serving for SERVER_DRAIN_SECONDS, long enough for the load
+balancer's readiness checks to take it out of rotation. Then uvicorn stops
+accepting connections, closes idle keep-alive connections and gives in-flight
+requests SERVER_GRACEFUL_TIMEOUT seconds to finish before the workers run
+their shutdown and exit. A second signal skips the remaining drain time.
+"""
+
+import importlib.util
+import os
+import sys
+import threading
+from types import FrameType
+from typing import Any, Dict, Optional
+
+import uvicorn
+from uvicorn.supervisors import Multiprocess
+
+from app.core.config import Settings, get_settings
+from app.db.pool import get_pool_limits
+
+# Exit status uvicorn uses when the server failed to start
+STARTUP_FAILURE = 3
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on, honouring affinity masks and container cpusets."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # Not available on macOS and Windows
+        return os.cpu_count() or 1
+
+
+def worker_count(settings: Settings) -> int:
+    """WEB_CONCURRENCY, or one worker per available CPU when it is 0."""
+    return settings.WEB_CONCURRENCY if settings.WEB_CONCURRENCY > 0 else available_cpus()
+
+
+def _implementation(choice: str, fast: str, fallback: str, setting: str) -> str:
+    """Resolve "auto" to the fast implementation when it is installed."""
+    if choice == "auto":
+        return fast if importlib.util.find_spec(fast) is not None else fallback
+    if choice not in (fast, fallback):
+        raise ValueError(f"Unknown {setting} {choice!r}, use auto, {fast} or {fallback}")
+    return choice
+
+
+def uvicorn_options(settings: Settings) -> Dict[str, Any]:
+    """Keyword arguments for uvicorn.run() in production."""
+    return {
+        "host": settings.HOST,
+        "port": settings.PORT,
+        "workers": worker_count(settings),
+        "loop": _implementation(settings.SERVER_LOOP, "uvloop", "asyncio", "SERVER_LOOP"),
+        "http": _implementation(settings.SERVER_HTTP, "httptools", "h11", "SERVER_HTTP"),
+        "backlog": settings.SERVER_BACKLOG,
+        "timeout_keep_alive": settings.SERVER_KEEPALIVE_SECONDS,
+        "timeout_graceful_shutdown": settings.SERVER_GRACEFUL_TIMEOUT,
+    }
+
+
+class DrainingServer(uvicorn.Server):
+    """uvicorn Server that reports not ready for drain_seconds before shutting down."""
+
+    def __init__(self, config: uvicorn.Config, drain_seconds: float):
+        super().__init__(config)
+        self.drain_seconds = drain_seconds
+        self._drain_timer: Optional[threading.Timer] = None
+
+    def handle_exit(self, sig: int, frame: Optional[FrameType]) -> None:
+        if self._drain_timer is not None or self.drain_seconds <= 0:
+            # Already draining (or draining disabled): shut down now
+            if self._drain_timer is not None:
+                self._drain_timer.cancel()
+            super().handle_exit(sig, frame)
+            return
+
+        # Runs in the worker process that serves /ready
+        from app.services.warmup import get_warmup_status
+
+        get_warmup_status().ready = False
+        self._drain_timer = threading.Timer(
+            self.drain_seconds, super().handle_exit, (sig, frame)
+        )
+        self._drain_timer.daemon = True
+        self._drain_timer.start()
+
+
+def serve(app: str, options: Dict[str, Any], drain_seconds: float) -> None:
+    """uvicorn.run() with a DrainingServer in every worker."""
+    config = uvicorn.Config(app, **options)
+    server = DrainingServer(config, drain_seconds)
+    if config.workers > 1:
+        Multiprocess(config, target=server.run, sockets=[config.bind_socket()]).run()
+    else:
+        server.run()
+    if not server.started and config.workers == 1:
+        sys.exit(STARTUP_FAILURE)
+
+
+def main() -> None:
+    settings = get_settings()
+    options = uvicorn_options(settings)
+    workers = options["workers"]
+    # Fails before any worker starts when the connection budget is too small
+    pool_size, max_overflow = get_pool_limits(settings, workers)
+    # Workers read their settings from the environment: pin the resolved count
+    # so their pools are sized for it (app.db.pool.get_pool_options)
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+
+    print(f"🚀 {workers} workers on {settings.HOST}:{settings.PORT} "
+          f"({options['loop']}, {options['http']}), "
+          f"pools of {pool_size}+{max_overflow} connections per engine")
+    serve("app.main:app", options, settings.SERVER_DRAIN_SECONDS)
+
+
+if __name__ == "__main__":
+    main()
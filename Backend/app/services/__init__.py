@@ -1,5 +1,39 @@
 """Services package for business logic."""
 
-from .course_service import CourseService, get_course_service
+from .concurrency import run_service_call
+from .course_cache import (
+    CachedCourseService,
+    get_catalog_cache,
+    get_response_body_cache,
+    get_shared_catalog_cache,
+    replica_lag_bound,
+)
+from .suggest import get_suggest_index, load_suggest_index, suggest
+from .course_service import (
+    AsyncCourseService,
+    CourseService,
+    get_async_course_service,
+    get_cached_course_service,
+    get_course_service,
+    get_database_course_service,
+    get_sync_course_service,
+)
 
-__all__ = ["CourseService", "get_course_service"] 
\ No newline at end of file
+__all__ = [
+    "AsyncCourseService",
+    "CachedCourseService",
+    "CourseService",
+    "get_async_course_service",
+    "get_cached_course_service",
+    "get_catalog_cache",
+    "get_course_service",
+    "get_database_course_service",
+    "get_response_body_cache",
+    "get_shared_catalog_cache",
+    "get_suggest_index",
+    "get_sync_course_service",
+    "load_suggest_index",
+    "replica_lag_bound",
+    "run_service_call",
+    "suggest",
+]
@@ -0,0 +1,16 @@
+"""Helpers to call sync or async services from async routes."""
+
+import inspect
+from typing import Any, Callable
+
+from fastapi.concurrency import run_in_threadpool
+
+
+async def run_service_call(method: Callable[..., Any], *args: Any) -> Any:
+    """
+    Call a service method without blocking the event loop.
+    Async methods are awaited; sync methods run in the threadpool.
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(*args)
+    return await run_in_threadpool(method, *args)
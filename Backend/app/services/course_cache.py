@@ -0,0 +1,319 @@
+"""
+Response cache layer for the catalog read endpoints.
+
+Entries are invalidated by the commits of ORM Sessions in this process; the
+shared tier is invalidated for every worker at the same time. Unit of work
+changes invalidate the entries built from the changed rows; insert(),
+update() and delete() statements executed through a Session (including
+Query.update() and bulk updates) invalidate the whole catalog, as their
+rows are not known without querying. Other workers' in-process entries are
+not invalidated: they may serve the previous data for up to
+CACHE_TTL_SECONDS after a write. Writes outside a Session (raw SQL on a
+Connection, other applications) invalidate nothing and show up once entries
+expire, at most SHARED_CACHE_TTL_SECONDS + CACHE_TTL_SECONDS later with the
+shared tier enabled.
+"""
+
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.core.cache import LRUTTLCache
+from app.core.shared_cache import InMemoryCacheBackend, RedisCacheBackend, SharedCache
+from app.core.config import get_settings
+from app.db.base import REPLICA_LAG_BOUND, get_read_router
+from app.db.models.course import Course
+from app.db.models.course_teacher import CourseTeacher
+from app.db.models.lecture import Lecture
+from app.db.models.teacher import Teacher
+from app.services.concurrency import run_service_call
+
+# Tag carried by every cached course listing
+COURSES_TAG = "courses"
+# Tag carried by course fingerprints, which depend on all their teachers
+TEACHERS_TAG = "teachers"
+# Tag carried by search results, which any course or lecture change can affect
+SEARCH_TAG = "search"
+# Tag carried by every entry, for writes whose rows are not known
+CATALOG_TAG = "catalog"
+
+# Tables the cached catalog responses are built from
+_CATALOG_TABLES = {
+    Course.__table__,
+    CourseTeacher.__table__,
+    Lecture.__table__,
+    Teacher.__table__,
+}
+
+
+@lru_cache
+def get_catalog_cache() -> LRUTTLCache:
+    """Get the process-wide catalog cache."""
+    settings = get_settings()
+    return LRUTTLCache(
+        max_entries=settings.CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.CACHE_TTL_SECONDS,
+    )
+
+
+@lru_cache
+def get_response_body_cache() -> LRUTTLCache:
+    """
+    Get the process-wide cache of encoded response bodies.
+
+    Keys are strong ETags, which change whenever the representation does, so
+    entries never need invalidation; LRU and TTL only bound memory.
+    """
+    settings = get_settings()
+    return LRUTTLCache(
+        max_entries=settings.CACHE_MAX_ENTRIES if settings.CACHE_ENABLED else 0,
+        ttl_seconds=settings.CACHE_TTL_SECONDS,
+    )
+
+
+@lru_cache
+def get_shared_catalog_cache() -> Optional[SharedCache]:
+    """Get the shared catalog cache tier configured in settings, if any."""
+    settings = get_settings()
+    if settings.SHARED_CACHE_BACKEND == "none":
+        return None
+    if settings.SHARED_CACHE_BACKEND == "memory":
+        backend = InMemoryCacheBackend()
+    elif settings.SHARED_CACHE_BACKEND == "redis":
+        backend = RedisCacheBackend(settings.SHARED_CACHE_URL)
+    else:
+        raise ValueError(f"Unknown SHARED_CACHE_BACKEND: {settings.SHARED_CACHE_BACKEND}")
+    return SharedCache(
+        backend,
+        ttl_seconds=settings.SHARED_CACHE_TTL_SECONDS,
+        prefix=settings.SHARED_CACHE_PREFIX,
+    )
+
+
+class CachedCourseService:
+    """
+    Wrap a CourseService or AsyncCourseService with the catalog cache tiers.
+
+    Lookups go to the in-process cache first, then to the optional shared tier
+    (filling the local cache on a hit), then to the database. Entries are keyed
+    per endpoint and arguments and tagged with the rows they were built from,
+    so committed writes to those rows invalidate them.
+
+    Values read from a replica may predate a write that was already
+    invalidated, so they are kept only in the in-process cache and only for
+    the replica lag bound; the shared tier only stores primary reads.
+    """
+
+    def __init__(
+        self, service: Any, cache: LRUTTLCache, shared_cache: Optional[SharedCache] = None
+    ):
+        self.service = service
+        self.cache = cache
+        self.shared_cache = shared_cache
+
+    async def get_courses(self) -> List[Dict[str, Any]]:
+        """Get all courses (not deleted), cached."""
+        return await self._cached(
+            ("courses",), self.service.get_courses, (), lambda courses: {COURSES_TAG}
+        )
+
+    async def get_courses_page(self, limit: int, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Get one page of courses, cached per (limit, cursor)."""
+        return await self._cached(
+            ("courses_page", limit, cursor),
+            self.service.get_courses_page,
+            (limit, cursor),
+            lambda page: {COURSES_TAG},
+        )
+
+    async def get_course_by_slug(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Get a course detail by slug, cached."""
+        return await self._cached(
+            ("course", slug), self.service.get_course_by_slug, (slug,), _course_detail_tags
+        )
+
+    async def get_courses_by_slugs(self, slugs: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several course details, cached per slug list."""
+        return await self._cached(
+            ("courses_by_slugs", tuple(slugs)),
+            self.service.get_courses_by_slugs,
+            (slugs,),
+            lambda courses: {COURSES_TAG}.union(
+                *(_course_detail_tags(course) for course in courses.values())
+            ),
+        )
+
+    async def get_lecture_by_id(self, lecture_id: int) -> Optional[Dict[str, Any]]:
+        """Get a lecture detail by ID, cached."""
+        return await self._cached(
+            ("lecture", lecture_id),
+            self.service.get_lecture_by_id,
+            (lecture_id,),
+            lambda lecture: {f"lecture:{lecture['id']}"},
+        )
+
+    async def get_lectures_by_ids(self, lecture_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get several lectures, cached per ID list."""
+        # Tagged with every requested ID so creating a missing lecture invalidates it
+        return await self._cached(
+            ("lectures", tuple(lecture_ids)),
+            self.service.get_lectures_by_ids,
+            (lecture_ids,),
+            lambda lectures: {f"lecture:{lecture_id}" for lecture_id in lecture_ids},
+        )
+
+    async def search(self, query: str, limit: int, offset: int = 0) -> Dict[str, Any]:
+        """Search courses and lectures, cached per (query, limit, offset)."""
+        return await self._cached(
+            ("search", query, limit, offset),
+            self.service.search,
+            (query, limit, offset),
+            lambda page: {SEARCH_TAG},
+        )
+
+    async def get_courses_version(self) -> Dict[str, Any]:
+        """Get the course list fingerprint, cached."""
+        return await self._cached(
+            ("courses_version",),
+            self.service.get_courses_version,
+            (),
+            lambda version: {COURSES_TAG},
+        )
+
+    async def get_course_version(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Get a course detail fingerprint, cached."""
+        return await self._cached(
+            ("course_version", slug),
+            self.service.get_course_version,
+            (slug,),
+            lambda version: {f"course:{version['id']}", TEACHERS_TAG},
+        )
+
+    async def get_courses_versions(self, slugs: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the fingerprints of several course details, cached per slug list."""
+        # COURSES_TAG also covers slugs that do not exist yet
+        return await self._cached(
+            ("courses_versions", tuple(slugs)),
+            self.service.get_courses_versions,
+            (slugs,),
+            lambda versions: {COURSES_TAG, TEACHERS_TAG} | {
+                f"course:{version['id']}" for version in versions.values()
+            },
+        )
+
+    async def get_lecture_version(self, lecture_id: int) -> Optional[Dict[str, Any]]:
+        """Get a lecture fingerprint, cached."""
+        return await self._cached(
+            ("lecture_version", lecture_id),
+            self.service.get_lecture_version,
+            (lecture_id,),
+            lambda version: {f"lecture:{version['id']}"},
+        )
+
+    async def _cached(
+        self,
+        key: Hashable,
+        method: Callable[..., Any],
+        args: tuple,
+        tags_for: Callable[[Any], Set[str]],
+    ) -> Any:
+        hit, value = self.cache.get(key)
+        if hit:
+            return value
+
+        if self.shared_cache is not None:
+            hit, value = await run_in_threadpool(self.shared_cache.get, key)
+            if hit:
+                self.cache.set(key, value, tags_for(value) | {CATALOG_TAG})
+                return value
+
+        value = await run_service_call(method, *args)
+        # Misses (None) are not cached so new rows show up immediately
+        if value is not None:
+            tags = tags_for(value) | {CATALOG_TAG}
+            lag_bound = replica_lag_bound(self.service)
+            self.cache.set(key, value, tags, ttl_seconds=lag_bound)
+            if self.shared_cache is not None and lag_bound is None:
+                await run_in_threadpool(self.shared_cache.set, key, value, tags)
+        return value
+
+
+def replica_lag_bound(service: Any) -> Optional[float]:
+    """
+    How stale a (cached) course service's reads may be: the replica lag
+    bound when its session reads a replica, None on the primary.
+    """
+    service = getattr(service, "service", service)
+    db = getattr(service, "db", None)
+    return db.info.get(REPLICA_LAG_BOUND) if db is not None else None
+
+
+def _course_detail_tags(course: Dict[str, Any]) -> Set[str]:
+    """Tags for a course detail: the course itself and its teachers."""
+    return {f"course:{course['id']}"} | {
+        f"teacher:{teacher['id']}" for teacher in course["teacher_id"]
+    }
+
+
+def _course_tags(instance: Any) -> Set[str]:
+    """Tags of the course a lecture or course_teacher row belongs to, and of any it left."""
+    previous = inspect(instance).attrs.course_id.history.deleted
+    return {
+        f"course:{course_id}"
+        for course_id in (instance.course_id, *previous)
+        if course_id is not None
+    }
+
+
+def _tags_for_instance(instance: Any) -> Set[str]:
+    """Cache tags affected by a change to an ORM instance."""
+    if isinstance(instance, Course):
+        return {COURSES_TAG, SEARCH_TAG, f"course:{instance.id}"}
+    if isinstance(instance, Lecture):
+        return {f"lecture:{instance.id}", SEARCH_TAG} | _course_tags(instance)
+    if isinstance(instance, Teacher):
+        return {f"teacher:{instance.id}", TEACHERS_TAG}
+    if isinstance(instance, CourseTeacher):
+        return _course_tags(instance)
+    return set()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_catalog_changes(session: Session, flush_context: Any) -> None:
+    """Remember which cache tags the flushed changes touch."""
+    tags = session.info.setdefault("catalog_cache_tags", set())
+    for instance in chain(session.new, session.dirty, session.deleted):
+        tags |= _tags_for_instance(instance)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_statement_catalog_changes(execute_state: ORMExecuteState) -> None:
+    """Invalidate the whole catalog for insert(), update() and delete() statements."""
+    if not (execute_state.is_insert or execute_state.is_update or execute_state.is_delete):
+        return
+    if execute_state.statement.table in _CATALOG_TABLES:
+        execute_state.session.info.setdefault("catalog_cache_tags", set()).add(CATALOG_TAG)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_catalog_cache(session: Session) -> None:
+    """Invalidate cached responses once the changes are committed."""
+    tags = session.info.pop("catalog_cache_tags", None)
+    if not tags:
+        return
+    # Replicas may not have the change yet: read from the primary meanwhile
+    get_read_router().pin_primary()
+    get_catalog_cache().invalidate_tags(tags)
+    shared_cache = get_shared_catalog_cache()
+    if shared_cache is not None:
+        shared_cache.invalidate_tags(tags)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_catalog_changes(session: Session) -> None:
+    """Forget collected tags for changes that were rolled back."""
+    session.info.pop("catalog_cache_tags", None)
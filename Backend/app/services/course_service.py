@@ -1,12 +1,159 @@
 """Course service for business logic related to courses."""
 
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session, joinedload
-from app.db.models.course import Course
-from app.db.models.lecture import Lecture
-from app.db.models.teacher import Teacher
-from app.db.base import get_db
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
 from fastapi import Depends
+from sqlalchemy import Executable, RowMapping, Select, bindparam, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.base import get_async_read_db, get_read_db
+from app.db.models.course_read_model import CourseReadModel
+from app.db.models.lecture import Lecture
+from app.db.search import search_statement, search_terms
+from app.db.soft_delete import with_soft_delete_criteria
+from app.services.course_cache import (
+    CachedCourseService,
+    get_catalog_cache,
+    get_shared_catalog_cache,
+)
+from app.services.pagination import decode_cursor, encode_cursor
+
+# Lecture contract columns selected by the read path. Rows come back as
+# lightweight RowMappings instead of hydrated ORM entities.
+LECTURE_DETAIL_COLUMNS = (
+    Lecture.id,
+    Lecture.name,
+    Lecture.description,
+    Lecture.slug,
+    Lecture.video_url,
+)
+
+
+# The read queries are built once, at import time, with bound parameters:
+# executing them skips statement construction and reuses their memoized
+# cache key, so each call only binds values and looks up the compiled SQL.
+# The soft-delete criterion is attached up front for the same reason.
+
+COURSES_STATEMENT = with_soft_delete_criteria(
+    select(CourseReadModel.summary)
+    .order_by(CourseReadModel.created_at.desc())
+)
+
+# One page of course list rows, newest first; fetches one extra row to know
+# whether a next page exists
+COURSES_PAGE_STATEMENT = with_soft_delete_criteria(
+    select(CourseReadModel.summary, CourseReadModel.created_at, CourseReadModel.course_id)
+    .order_by(CourseReadModel.created_at.desc(), CourseReadModel.course_id.desc())
+    .limit(bindparam("limit"))
+)
+
+# The following page, keyset-paginated from a cursor position
+COURSES_PAGE_AFTER_STATEMENT = COURSES_PAGE_STATEMENT.where(
+    tuple_(CourseReadModel.created_at, CourseReadModel.course_id)
+    < tuple_(
+        bindparam("created_at", type_=CourseReadModel.created_at.type),
+        bindparam("course_id", type_=CourseReadModel.course_id.type),
+    )
+)
+
+COURSE_BY_SLUG_STATEMENT = with_soft_delete_criteria(
+    select(CourseReadModel.detail).where(CourseReadModel.slug == bindparam("slug"))
+)
+
+COURSES_BY_SLUGS_STATEMENT = with_soft_delete_criteria(
+    select(CourseReadModel.slug, CourseReadModel.detail)
+    .where(CourseReadModel.slug.in_(bindparam("slugs", expanding=True)))
+)
+
+LECTURE_BY_ID_STATEMENT = with_soft_delete_criteria(
+    select(*LECTURE_DETAIL_COLUMNS).where(Lecture.id == bindparam("lecture_id"))
+)
+
+LECTURES_BY_IDS_STATEMENT = with_soft_delete_criteria(
+    select(*LECTURE_DETAIL_COLUMNS)
+    .where(Lecture.id.in_(bindparam("lecture_ids", expanding=True)))
+)
+
+# Fingerprint queries used to build ETags (no row payloads)
+COURSES_VERSION_STATEMENT = with_soft_delete_criteria(
+    select(
+        func.max(CourseReadModel.refreshed_at).label("refreshed_at"),
+        func.count(CourseReadModel.course_id).label("courses"),
+    )
+)
+
+COURSE_VERSION_STATEMENT = with_soft_delete_criteria(
+    select(CourseReadModel.course_id.label("id"), CourseReadModel.version)
+    .where(CourseReadModel.slug == bindparam("slug"))
+)
+
+COURSES_VERSIONS_STATEMENT = with_soft_delete_criteria(
+    select(CourseReadModel.slug, CourseReadModel.course_id.label("id"), CourseReadModel.version)
+    .where(CourseReadModel.slug.in_(bindparam("slugs", expanding=True)))
+)
+
+LECTURE_VERSION_STATEMENT = with_soft_delete_criteria(
+    select(Lecture.id, Lecture.updated_at).where(Lecture.id == bindparam("lecture_id"))
+)
+
+
+def _courses_page_query(limit: int, cursor: Optional[str]) -> Tuple[Executable, Dict[str, Any]]:
+    """Statement and parameters of one page of course list rows."""
+    if not cursor:
+        return COURSES_PAGE_STATEMENT, {"limit": limit + 1}
+    created_at, course_id = decode_cursor(cursor)
+    return COURSES_PAGE_AFTER_STATEMENT, {
+        "limit": limit + 1, "created_at": created_at, "course_id": course_id
+    }
+
+
+def _version(row: Optional[RowMapping]) -> Optional[Dict[str, Any]]:
+    """
+    Convert a fingerprint row into a JSON-safe dict (None when missing), so the
+    ETag is the same whether it comes from the database or a shared cache.
+    """
+    if not row:
+        return None
+    return {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in row.items()
+    }
+
+
+def _versions_by_slug(rows: List[RowMapping]) -> Dict[str, Dict[str, Any]]:
+    """Map fingerprint rows to {slug: {"id", "version"}}."""
+    return {row["slug"]: {"id": row["id"], "version": row["version"]} for row in rows}
+
+
+def _courses_page(rows: List[RowMapping], limit: int) -> Dict[str, Any]:
+    """Build the paginated course list response from read model rows."""
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(page[-1]["created_at"], page[-1]["course_id"])
+
+    return {
+        "items": [row["summary"] for row in page],
+        "next_cursor": next_cursor
+    }
+
+
+def _search_statement(db: Any, terms: List[str], limit: int, offset: int) -> Select:
+    """Build the search query for the dialect the session is bound to."""
+    return search_statement(
+        db.get_bind().dialect.name, terms, limit, offset, get_settings().SEARCH_MAX_CANDIDATES
+    )
+
+
+def _search_page(rows: List[RowMapping], limit: int, offset: int) -> Dict[str, Any]:
+    """Build the paginated search response from ranked hit rows."""
+    return {
+        "items": [dict(row) for row in rows[:limit]],
+        "next_offset": offset + limit if len(rows) > limit else None,
+    }
 
 
 class CourseService:
@@ -19,104 +166,209 @@ class CourseService:
     def get_courses(self) -> List[Dict[str, Any]]:
         """
         Get all courses (not deleted).
-        
+
         Returns a list of courses with id, name, description, thumbnail, and slug.
         """
-        courses = (
-            self.db.query(Course)
-            .filter(Course.deleted_at.is_(None))
-            .order_by(Course.created_at.desc())
-            .all()
-        )
-        
-        return [
-            {
-                "id": course.id,
-                "name": course.name,
-                "description": course.description,
-                "thumbnail": course.thumbnail,
-                "slug": course.slug
-            }
-            for course in courses
-        ]
+        return list(self.db.execute(COURSES_STATEMENT).scalars())
+
+    def get_courses_page(self, limit: int, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get one page of courses (not deleted) using keyset pagination.
+
+        Returns {"items": [...], "next_cursor": str | None}; pass next_cursor back
+        to fetch the following page.
+        """
+        rows = self.db.execute(*_courses_page_query(limit, cursor)).mappings().all()
+
+        return _courses_page(rows, limit)
 
     def get_course_by_slug(self, slug: str) -> Optional[Dict[str, Any]]:
         """
         Get a course by its slug with detailed information.
-        
+
         Returns course with id, name, description, thumbnail, slug, teacher_id array, and lectures array.
         """
-        course = (
-            self.db.query(Course)
-            .options(
-                joinedload(Course.teachers),
-                joinedload(Course.lectures)
-            )
-            .filter(Course.slug == slug)
-            .filter(Course.deleted_at.is_(None))
-            .first()
-        )
-        
-        if not course:
-            return None
-            
-        # Get teachers with their information
-        teachers = [
-            {
-                "id": teacher.id,
-                "name": teacher.name
-            }
-            for teacher in course.teachers
-            if teacher.deleted_at is None
-        ]
-        
-        # Get lectures (only non-deleted)
-        lectures = [
-            {
-                "id": lecture.id,
-                "name": lecture.name,
-                "description": lecture.description,
-                "slug": lecture.slug
-            }
-            for lecture in course.lectures
-            if lecture.deleted_at is None
-        ]
-        
-        return {
-            "id": course.id,
-            "name": course.name,
-            "description": course.description,
-            "thumbnail": course.thumbnail,
-            "slug": course.slug,
-            "teacher_id": teachers,
-            "lectures": lectures
-        }
+        return self.db.execute(COURSE_BY_SLUG_STATEMENT, {"slug": slug}).scalar()
+
+    def get_courses_by_slugs(self, slugs: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several course details with a single query.
+
+        Returns {slug: detail} for the slugs that exist; missing slugs are absent.
+        """
+        return dict(self.db.execute(COURSES_BY_SLUGS_STATEMENT, {"slugs": slugs}).all())
 
     def get_lecture_by_id(self, lecture_id: int) -> Optional[Dict[str, Any]]:
         """
         Get a specific lecture by its ID.
-        
+
         Returns lecture with id, name, description, slug, video_url.
         """
-        lecture = (
-            self.db.query(Lecture)
-            .filter(Lecture.id == lecture_id)
-            .filter(Lecture.deleted_at.is_(None))
-            .first()
+        lecture = self.db.execute(
+            LECTURE_BY_ID_STATEMENT, {"lecture_id": lecture_id}
+        ).mappings().first()
+
+        if not lecture:
+            return None
+
+        return dict(lecture)
+
+    def get_lectures_by_ids(self, lecture_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Get several lectures with a single query.
+
+        Returns the lectures that exist, in no particular order; missing IDs are absent.
+        """
+        rows = self.db.execute(
+            LECTURES_BY_IDS_STATEMENT, {"lecture_ids": lecture_ids}
+        ).mappings().all()
+        return [dict(row) for row in rows]
+
+    def search(self, query: str, limit: int, offset: int = 0) -> Dict[str, Any]:
+        """
+        Full-text search over course and lecture names and descriptions.
+
+        Returns {"items": [...], "next_offset": int | None}, best matches first.
+        """
+        terms = search_terms(query)
+        if not terms:
+            return _search_page([], limit, offset)
+        statement = _search_statement(self.db, terms, limit, offset)
+        return _search_page(self.db.execute(statement).mappings().all(), limit, offset)
+
+    def get_courses_version(self) -> Dict[str, Any]:
+        """Get the fingerprint of the course list, used to build its ETag."""
+        return _version(self.db.execute(COURSES_VERSION_STATEMENT).mappings().one())
+
+    def get_course_version(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Get the fingerprint of a course detail, or None if it does not exist."""
+        return _version(
+            self.db.execute(COURSE_VERSION_STATEMENT, {"slug": slug}).mappings().first()
+        )
+
+    def get_courses_versions(self, slugs: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the fingerprints of several course details ({slug: {"id", "version"}})."""
+        return _versions_by_slug(
+            self.db.execute(COURSES_VERSIONS_STATEMENT, {"slugs": slugs}).mappings().all()
         )
-        
+
+    def get_lecture_version(self, lecture_id: int) -> Optional[Dict[str, Any]]:
+        """Get the fingerprint of a lecture, or None if it does not exist."""
+        return _version(
+            self.db.execute(
+                LECTURE_VERSION_STATEMENT, {"lecture_id": lecture_id}
+            ).mappings().first()
+        )
+
+
+class AsyncCourseService:
+    """Async counterpart of CourseService with the same contract."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize the course service with an async database session."""
+        self.db = db
+
+    async def get_courses(self) -> List[Dict[str, Any]]:
+        """Get all courses (not deleted), newest first."""
+        result = await self.db.execute(COURSES_STATEMENT)
+
+        return list(result.scalars())
+
+    async def get_courses_page(self, limit: int, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Get one page of courses (not deleted) using keyset pagination."""
+        result = await self.db.execute(*_courses_page_query(limit, cursor))
+
+        return _courses_page(result.mappings().all(), limit)
+
+    async def get_course_by_slug(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Get a course by its slug with teachers and lectures."""
+        result = await self.db.execute(COURSE_BY_SLUG_STATEMENT, {"slug": slug})
+        return result.scalar()
+
+    async def get_courses_by_slugs(self, slugs: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several course details with a single query."""
+        result = await self.db.execute(COURSES_BY_SLUGS_STATEMENT, {"slugs": slugs})
+        return dict(result.all())
+
+    async def get_lecture_by_id(self, lecture_id: int) -> Optional[Dict[str, Any]]:
+        """Get a specific lecture by its ID."""
+        result = await self.db.execute(LECTURE_BY_ID_STATEMENT, {"lecture_id": lecture_id})
+        lecture = result.mappings().first()
+
         if not lecture:
             return None
-            
-        return {
-            "id": lecture.id,
-            "name": lecture.name,
-            "description": lecture.description,
-            "slug": lecture.slug,
-            "video_url": lecture.video_url
-        }
 
+        return dict(lecture)
+
+    async def get_lectures_by_ids(self, lecture_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get several lectures with a single query."""
+        result = await self.db.execute(
+            LECTURES_BY_IDS_STATEMENT, {"lecture_ids": lecture_ids}
+        )
+        return [dict(row) for row in result.mappings().all()]
+
+    async def search(self, query: str, limit: int, offset: int = 0) -> Dict[str, Any]:
+        """Full-text search over course and lecture names and descriptions."""
+        terms = search_terms(query)
+        if not terms:
+            return _search_page([], limit, offset)
+        statement = _search_statement(self.db, terms, limit, offset)
+        result = await self.db.execute(statement)
+        return _search_page(result.mappings().all(), limit, offset)
+
+    async def get_courses_version(self) -> Dict[str, Any]:
+        """Get the fingerprint of the course list, used to build its ETag."""
+        result = await self.db.execute(COURSES_VERSION_STATEMENT)
+        return _version(result.mappings().one())
+
+    async def get_course_version(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Get the fingerprint of a course detail, or None if it does not exist."""
+        result = await self.db.execute(COURSE_VERSION_STATEMENT, {"slug": slug})
+        return _version(result.mappings().first())
+
+    async def get_courses_versions(self, slugs: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the fingerprints of several course details."""
+        result = await self.db.execute(COURSES_VERSIONS_STATEMENT, {"slugs": slugs})
+        return _versions_by_slug(result.mappings().all())
 
-def get_course_service(db: Session = Depends(get_db)) -> CourseService:
+    async def get_lecture_version(self, lecture_id: int) -> Optional[Dict[str, Any]]:
+        """Get the fingerprint of a lecture, or None if it does not exist."""
+        result = await self.db.execute(
+            LECTURE_VERSION_STATEMENT, {"lecture_id": lecture_id}
+        )
+        return _version(result.mappings().first())
+
+
+def get_sync_course_service(db: Session = Depends(get_read_db)) -> CourseService:
     """Dependency to get CourseService instance."""
-    return CourseService(db) 
\ No newline at end of file
+    return CourseService(db)
+
+
+async def get_async_course_service(
+    db: AsyncSession = Depends(get_async_read_db),
+) -> AsyncCourseService:
+    """Dependency to get AsyncCourseService instance."""
+    return AsyncCourseService(db)
+
+
+# Uncached service provider, selected by the configured database mode
+get_database_course_service = (
+    get_async_course_service
+    if get_settings().DATABASE_ASYNC
+    else get_sync_course_service
+)
+
+
+async def get_cached_course_service(
+    service: Any = Depends(get_database_course_service),
+) -> CachedCourseService:
+    """Dependency to get the course service wrapped with the catalog cache."""
+    return CachedCourseService(service, get_catalog_cache(), get_shared_catalog_cache())
+
+
+# Dependency used by the routes
+get_course_service = (
+    get_cached_course_service
+    if get_settings().CACHE_ENABLED
+    else get_database_course_service
+)
@@ -0,0 +1,107 @@
+"""
+Search-as-you-type suggestions served from an in-memory prefix index.
+
+The index holds the names of live courses and lectures. It is loaded at
+startup (lifespan) and updated from the changes committed through this
+process's sessions; writes made by other processes show up on the next load.
+"""
+
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.core.prefix_index import PrefixIndex
+from app.db.models.course import Course
+from app.db.models.lecture import Lecture
+
+
+# Fields of the indexed payloads, stored as tuples to keep the index small
+SUGGEST_FIELDS = ("type", "id", "course_id", "name", "slug")
+
+
+@lru_cache
+def get_suggest_index() -> PrefixIndex:
+    """Get the process-wide suggestion index."""
+    return PrefixIndex()
+
+
+def _course_item(id: int, name: str, slug: str) -> Tuple[Hashable, str, tuple]:
+    return ("course", id), name, ("course", id, id, name, slug)
+
+
+def _lecture_item(id: int, course_id: int, name: str, slug: str) -> Tuple[Hashable, str, tuple]:
+    return ("lecture", id), name, ("lecture", id, course_id, name, slug)
+
+
+def load_suggest_index(db: Session) -> int:
+    """Rebuild the suggestion index from the live catalog; returns the title count."""
+    courses = db.execute(select(Course.id, Course.name, Course.slug))
+    lectures = db.execute(select(Lecture.id, Lecture.course_id, Lecture.name, Lecture.slug))
+    index = get_suggest_index()
+    index.load(chain(
+        (_course_item(*row) for row in courses),
+        (_lecture_item(*row) for row in lectures),
+    ))
+    return len(index)
+
+
+def suggest(query: str, limit: int) -> List[Dict[str, Any]]:
+    """Courses and lectures whose name has a word sequence starting with query."""
+    index = get_suggest_index()
+    # Lectures of deleted courses stay indexed but hidden, so a restore shows them again
+    items = index.search(query, limit, lambda item: ("course", item[2]) in index)
+    return [dict(zip(SUGGEST_FIELDS, item)) for item in items]
+
+
+def _snapshot(instance: Any) -> Optional[Tuple[Hashable, Optional[tuple]]]:
+    """(key, item or None to remove) for a flushed course or lecture."""
+    if isinstance(instance, Course):
+        key, live = ("course", instance.id), (instance.id, instance.name, instance.slug)
+    elif isinstance(instance, Lecture):
+        key = ("lecture", instance.id)
+        live = (instance.id, instance.course_id, instance.name, instance.slug)
+    else:
+        return None
+    return key, None if instance.deleted_at is not None else live
+
+
+def _apply(changes: Iterable[Tuple[Hashable, Optional[tuple]]]) -> None:
+    index = get_suggest_index()
+    for key, values in changes:
+        if values is None:
+            index.discard(key)
+        elif key[0] == "course":
+            index.put(*_course_item(*values))
+        else:
+            index.put(*_lecture_item(*values))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_suggest_changes(session: Session, flush_context: Any) -> None:
+    """Snapshot flushed courses and lectures (attributes expire on commit)."""
+    changes = session.info.setdefault("suggest_changes", {})
+    for instance in chain(session.new, session.dirty):
+        snapshot = _snapshot(instance)
+        if snapshot is not None:
+            changes[snapshot[0]] = snapshot[1]
+    for instance in session.deleted:
+        snapshot = _snapshot(instance)
+        if snapshot is not None:
+            changes[snapshot[0]] = None
+
+
+@event.listens_for(Session, "after_commit")
+def _update_suggest_index(session: Session) -> None:
+    """Apply committed changes to the suggestion index."""
+    changes = session.info.pop("suggest_changes", None)
+    if changes:
+        _apply(changes.items())
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_suggest_changes(session: Session) -> None:
+    """Forget snapshots of changes that were rolled back."""
+    session.info.pop("suggest_changes", None)
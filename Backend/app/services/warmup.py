@@ -0,0 +1,208 @@
+"""
+Startup warm-up of a worker before it reports ready.
+
+Pre-opens pool connections, runs every read query of the course service once
+(compiling its statements on each read engine) and prefills the catalog cache
+with the hottest entries: the course list, its first page and the first
+WARMUP_HOT_COURSES courses with their first lecture.
+
+Replicas that are down or lagging are skipped, as on the request path, so
+they never keep a worker from becoming ready.
+"""
+
+import time
+from contextlib import AsyncExitStack, ExitStack
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import Settings
+from app.db.base import (
+    AsyncSessionLocal,
+    SessionLocal,
+    get_async_engine,
+    get_engine,
+    get_read_router,
+)
+from app.db.search import search_terms
+from app.services.concurrency import run_service_call
+from app.services.course_cache import (
+    CachedCourseService,
+    get_catalog_cache,
+    get_shared_catalog_cache,
+)
+from app.services.course_service import AsyncCourseService, CourseService
+
+
+class WarmupStatus:
+    """Readiness of this worker: ready once startup work has succeeded."""
+
+    def __init__(self) -> None:
+        self.ready = False
+        self.started_at: Optional[float] = None
+        self.duration_seconds: Optional[float] = None
+        self.summary: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+        self.attempts = 0
+
+    def start(self) -> None:
+        """Mark the worker as warming up."""
+        self.ready = False
+        self.started_at = time.perf_counter()
+        self.duration_seconds = None
+        self.summary = {}
+        self.error = None
+        self.attempts = 0
+
+    def finish(self, error: Optional[str] = None, ready_on_failure: bool = False) -> None:
+        """
+        Record the outcome of an attempt at the startup work. The worker is
+        ready once it succeeds; a failed attempt keeps it not ready unless
+        ready_on_failure.
+        """
+        if self.started_at is not None:
+            self.duration_seconds = time.perf_counter() - self.started_at
+        self.attempts += 1
+        self.error = error
+        self.ready = error is None or ready_on_failure
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Readiness, warm-up duration, attempts, error and summary counts."""
+        return {
+            "ready": self.ready,
+            "duration_seconds": self.duration_seconds,
+            "attempts": self.attempts,
+            "error": self.error,
+            **self.summary,
+        }
+
+
+@lru_cache
+def get_warmup_status() -> WarmupStatus:
+    """Get the process-wide warm-up status."""
+    return WarmupStatus()
+
+
+def _pool_target(pool: Any, count: int) -> int:
+    # Connections beyond pool_size are closed on release, so opening more is wasted
+    return min(count, pool.size()) if isinstance(pool, QueuePool) else min(count, 1)
+
+
+def open_connections(target: Engine, count: int) -> int:
+    """Check out up to count connections at once so the pool keeps them open."""
+    count = _pool_target(target.pool, count)
+    with ExitStack() as stack:
+        for _ in range(count):
+            stack.enter_context(target.connect())
+    return count
+
+
+async def open_async_connections(target: AsyncEngine, count: int) -> int:
+    """Async variant of open_connections()."""
+    count = _pool_target(target.sync_engine.pool, count)
+    async with AsyncExitStack() as stack:
+        for _ in range(count):
+            await stack.enter_async_context(target.connect())
+    return count
+
+
+async def run_catalog_queries(service: Any, hot_courses: int, page_size: int) -> int:
+    """
+    Call every read method of a (sync, async or cached) course service once.
+    Returns the number of calls made.
+    """
+    calls = 0
+
+    async def call(method: Any, *args: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        return await run_service_call(method, *args)
+
+    await call(service.get_courses_version)
+    courses = await call(service.get_courses)
+    await call(service.get_courses_page, page_size)
+
+    slugs = [course["slug"] for course in courses[:hot_courses]]
+    lecture_ids: List[int] = []
+    for slug in slugs:
+        await call(service.get_course_version, slug)
+        course = await call(service.get_course_by_slug, slug)
+        if course and course["lectures"]:
+            lecture_ids.append(course["lectures"][0]["id"])
+    for lecture_id in lecture_ids:
+        await call(service.get_lecture_version, lecture_id)
+        await call(service.get_lecture_by_id, lecture_id)
+
+    if lecture_ids:
+        await call(service.get_lectures_by_ids, lecture_ids)
+    if slugs:
+        await call(service.get_courses_versions, slugs)
+        await call(service.get_courses_by_slugs, slugs)
+        await call(service.search, " ".join(search_terms(courses[0]["name"])[:1]), page_size)
+    return calls
+
+
+async def warm_up(settings: Settings) -> Dict[str, Any]:
+    """
+    Warm the connection pools, statement caches and catalog cache.
+
+    The primary prefills the cache: replica reads may predate writes that were
+    already invalidated, so they must not fill it (CachedCourseService). Each
+    healthy replica then runs the queries once; a replica that fails is
+    skipped with a warning instead of failing the warm-up.
+    """
+    engine, async_engine, read_router = get_engine(), get_async_engine(), get_read_router()
+    count = settings.WARMUP_POOL_CONNECTIONS
+    connections = await run_in_threadpool(open_connections, engine, count)
+    if async_engine is not None:
+        connections += await open_async_connections(async_engine, count)
+    queries = await _warm_engine(
+        async_engine if settings.DATABASE_ASYNC else engine, True, settings
+    )
+
+    if read_router.replicas:
+        await run_in_threadpool(read_router.check)
+    engines, skipped = 1, []
+    for replica in read_router.replicas:
+        if not replica.healthy:
+            skipped.append(f"{replica.masked_url}: {replica.error}")
+            continue
+        try:
+            if replica.async_engine is not None:
+                connections += await open_async_connections(replica.async_engine, count)
+            else:
+                connections += await run_in_threadpool(open_connections, replica.engine, count)
+            queries += await _warm_engine(
+                replica.async_engine if settings.DATABASE_ASYNC else replica.engine,
+                False,
+                settings,
+            )
+            engines += 1
+        except Exception as e:
+            skipped.append(f"{replica.masked_url}: {e}")
+    return {
+        "connections": connections,
+        "engines": engines,
+        "service_calls": queries,
+        "skipped_replicas": skipped,
+    }
+
+
+async def _warm_engine(target: Any, prefill_cache: bool, settings: Settings) -> int:
+    if settings.DATABASE_ASYNC:
+        async with AsyncSessionLocal(bind=target) as db:
+            return await _warm_service(AsyncCourseService(db), prefill_cache, settings)
+    with SessionLocal(bind=target) as db:
+        return await _warm_service(CourseService(db), prefill_cache, settings)
+
+
+async def _warm_service(service: Any, prefill_cache: bool, settings: Settings) -> int:
+    if prefill_cache and settings.CACHE_ENABLED:
+        service = CachedCourseService(service, get_catalog_cache(), get_shared_catalog_cache())
+    return await run_catalog_queries(
+        service, settings.WARMUP_HOT_COURSES, settings.COURSES_PAGE_SIZE
+    )
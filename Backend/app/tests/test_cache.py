@@ -0,0 +1,282 @@
+"""Tests for the catalog response cache."""
+
+import pytest
+from datetime import datetime
+from sqlalchemy import update
+from app.main import app
+from app.core.cache import LRUTTLCache
+from app.core.shared_cache import InMemoryCacheBackend, SharedCache
+from app.db.models.course import Course
+from app.db.models.lecture import Lecture
+from app.services import course_cache
+from app.services.course_cache import (
+    CachedCourseService,
+    get_catalog_cache,
+    get_response_body_cache,
+)
+from app.services.course_service import (
+    CourseService,
+    get_cached_course_service,
+    get_course_service,
+    get_database_course_service,
+)
+from app.tests.test_courses import client, db_session, db_data  # noqa: F401
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUTTLCache:
+    """Test cases for LRUTTLCache."""
+
+    def test_hit_and_miss_counters(self):
+        """Test that lookups are counted as hits or misses."""
+        cache = LRUTTLCache(max_entries=2, ttl_seconds=60)
+
+        assert cache.get("a") == (False, None)
+        cache.set("a", 1)
+        assert cache.get("a") == (True, 1)
+
+        stats = cache.stats.as_dict()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = LRUTTLCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now the least recently used
+        cache.set("c", 3)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.get("c") == (True, 3)
+        assert cache.stats.evictions == 1
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries are dropped once their TTL has passed."""
+        clock = FakeClock()
+        cache = LRUTTLCache(max_entries=2, ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 9.9
+        assert cache.get("a") == (True, 1)
+        clock.now = 10
+        assert cache.get("a") == (False, None)
+        assert cache.stats.expirations == 1
+        assert len(cache) == 0
+
+    def test_invalidate_tags(self):
+        """Test that invalidating a tag drops only the entries carrying it."""
+        cache = LRUTTLCache(max_entries=10, ttl_seconds=60)
+        cache.set("list", [1, 2], tags={"courses"})
+        cache.set("detail", {"id": 1}, tags={"course:1", "teacher:1"})
+        cache.set("other", {"id": 2}, tags={"course:2"})
+
+        assert cache.invalidate_tags({"teacher:1"}) == 1
+        assert cache.get("detail") == (False, None)
+        assert cache.get("list") == (True, [1, 2])
+        assert cache.get("other") == (True, {"id": 2})
+        assert cache.stats.invalidations == 1
+
+
+@pytest.fixture
+def cached_client(client, db_session, db_data):
+    """Route the endpoints through the cached service for the current db mode."""
+    app.dependency_overrides[get_database_course_service] = (
+        app.dependency_overrides[get_course_service]
+    )
+    app.dependency_overrides[get_course_service] = get_cached_course_service
+    get_catalog_cache().clear()
+    yield client
+    get_catalog_cache().clear()
+
+
+class TestCachedEndpointsIntegration:
+    """Integration test cases for cached catalog endpoints."""
+
+    def test_repeat_requests_hit_cache(self, cached_client):
+        """Test that repeated requests are served from the cache."""
+        first = cached_client.get("/courses")
+        second = cached_client.get("/courses")
+
+        assert first.json() == second.json()
+        # Both requests look up the list fingerprint (ETag); the list itself is
+        # only loaded once, the repeat is served from the encoded body cache
+        stats = cached_client.get("/cache-stats").json()
+        assert stats["local"]["hits"] == 1
+        assert stats["local"]["misses"] == 2
+        assert stats["bodies"]["hits"] == 1
+        assert stats["bodies"]["misses"] == 1
+
+    def test_course_update_invalidates_list_and_detail(self, cached_client, db_session):
+        """Test that committing a course change invalidates its cached responses."""
+        cached_client.get("/courses")
+        cached_client.get("/courses/curso-de-react")
+
+        course = db_session.query(Course).filter(Course.slug == "curso-de-react").first()
+        course.name = "Curso de React Avanzado"
+        db_session.commit()
+
+        courses = cached_client.get("/courses").json()
+        assert "Curso de React Avanzado" in [c["name"] for c in courses]
+        assert cached_client.get("/courses/curso-de-react").json()["name"] == (
+            "Curso de React Avanzado"
+        )
+
+    def test_lecture_soft_delete_invalidates_course_and_lecture(self, cached_client, db_session):
+        """Test that soft deleting a lecture invalidates the course and lecture entries."""
+        assert len(cached_client.get("/courses/curso-de-react").json()["lectures"]) == 2
+        assert cached_client.get("/lectures/1").status_code == 200
+
+        lecture = db_session.query(Lecture).filter(Lecture.id == 1).first()
+        lecture.deleted_at = datetime.now()
+        db_session.commit()
+
+        assert len(cached_client.get("/courses/curso-de-react").json()["lectures"]) == 1
+        assert cached_client.get("/lectures/1").status_code == 404
+
+    def test_moved_lecture_invalidates_both_courses(self, cached_client, db_session):
+        """Test that moving a lecture invalidates the course it left and the one it joined."""
+        assert len(cached_client.get("/courses/curso-de-react").json()["lectures"]) == 2
+        assert len(cached_client.get("/courses/curso-de-python").json()["lectures"]) == 1
+
+        lecture = db_session.query(Lecture).filter(Lecture.id == 3).first()
+        lecture.course_id = 1
+        db_session.commit()
+
+        assert len(cached_client.get("/courses/curso-de-react").json()["lectures"]) == 3
+        assert cached_client.get("/courses/curso-de-python").json()["lectures"] == []
+
+    def test_update_statement_invalidates_catalog(self, cached_client, db_session):
+        """Test that update() statements run through a Session invalidate cached reads."""
+        assert "Curso de Python" in [c["name"] for c in cached_client.get("/courses").json()]
+        etag = cached_client.get("/courses/curso-de-python").headers["etag"]
+
+        db_session.execute(update(Course).where(Course.id == 2).values(name="Curso de Python 3"))
+        db_session.commit()
+
+        courses = cached_client.get("/courses").json()
+        assert "Curso de Python 3" in [c["name"] for c in courses]
+        response = cached_client.get("/courses/curso-de-python")
+        assert response.json()["name"] == "Curso de Python 3"
+        assert response.headers["etag"] != etag
+
+    def test_query_update_invalidates_catalog(self, cached_client, db_session):
+        """Test that Query.update() invalidates the cached lecture."""
+        assert cached_client.get("/lectures/3").status_code == 200
+
+        db_session.query(Lecture).filter(Lecture.id == 3).update(
+            {Lecture.deleted_at: datetime.now()}
+        )
+        db_session.commit()
+
+        assert cached_client.get("/lectures/3").status_code == 404
+        assert cached_client.get("/courses/curso-de-python").json()["lectures"] == []
+
+    def test_rolled_back_changes_keep_cache(self, cached_client, db_session):
+        """Test that rolled back changes do not invalidate cached entries."""
+        cached_client.get("/courses")
+
+        course = db_session.query(Course).filter(Course.slug == "curso-de-react").first()
+        course.name = "Nombre temporal"
+        db_session.flush()
+        db_session.rollback()
+
+        cached_client.get("/courses")
+        assert get_catalog_cache().stats.hits == 1
+        assert get_response_body_cache().stats.hits == 1
+
+
+class FailingBackend:
+    """Backend that is always unavailable."""
+
+    def get(self, key):
+        raise ConnectionError("cache down")
+
+    def set(self, key, value, ttl_seconds, tags):
+        raise ConnectionError("cache down")
+
+    def invalidate_tags(self, tags):
+        raise ConnectionError("cache down")
+
+
+@pytest.fixture
+def shared_cache(monkeypatch):
+    """Shared tier backed by the in-memory stand-in, wired into the commit hook."""
+    cache = SharedCache(InMemoryCacheBackend(), ttl_seconds=60, prefix="test")
+    monkeypatch.setattr(course_cache, "get_shared_catalog_cache", lambda: cache)
+    get_catalog_cache().clear()
+    yield cache
+    get_catalog_cache().clear()
+
+
+class TestSharedCache:
+    """Test cases for the shared cache tier."""
+
+    def test_roundtrip_serializes_values(self):
+        """Test that values come back equal after serialization."""
+        cache = SharedCache(InMemoryCacheBackend(), ttl_seconds=60, prefix="test")
+        value = {"id": 1, "teacher_id": [{"id": 1, "name": "Juan Pérez"}]}
+
+        cache.set(("course", "curso-de-react"), value, {"course:1"})
+
+        assert cache.get(("course", "curso-de-react")) == (True, value)
+        assert cache.get(("course", "otro")) == (False, None)
+        assert cache.invalidate_tags({"course:1"}) == 1
+        assert cache.get(("course", "curso-de-react")) == (False, None)
+        assert cache.stats.as_dict()["hit_ratio"] == pytest.approx(1 / 3)
+
+    def test_backend_errors_degrade_to_misses(self):
+        """Test that an unavailable backend is counted and treated as a miss."""
+        cache = SharedCache(FailingBackend(), ttl_seconds=60, prefix="test")
+
+        cache.set("key", 1)
+        assert cache.get("key") == (False, None)
+        assert cache.invalidate_tags({"tag"}) == 0
+        assert cache.stats.errors == 3
+
+
+class TestSharedCacheIntegration:
+    """Integration test cases for the two cache tiers."""
+
+    @pytest.mark.asyncio
+    async def test_workers_share_payloads(self, db_session, db_data, shared_cache):
+        """Test that a second worker is served from the shared tier."""
+        worker_a = CachedCourseService(
+            CourseService(db_session), LRUTTLCache(10, 60), shared_cache
+        )
+        worker_b_local = LRUTTLCache(10, 60)
+        worker_b = CachedCourseService(CourseService(db_session), worker_b_local, shared_cache)
+
+        course = await worker_a.get_course_by_slug("curso-de-react")
+        db_session.close()  # worker B must not need the database
+
+        assert await worker_b.get_course_by_slug("curso-de-react") == course
+        assert shared_cache.stats.hits == 1
+        assert worker_b_local.stats.misses == 1
+        assert await worker_b.get_course_by_slug("curso-de-react") == course
+        assert worker_b_local.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_commit_invalidates_shared_tier(self, db_session, db_data, shared_cache):
+        """Test that committed changes drop the shared entries too."""
+        service = CachedCourseService(CourseService(db_session), get_catalog_cache(), shared_cache)
+        await service.get_courses()
+
+        course = db_session.query(Course).filter(Course.slug == "curso-de-react").first()
+        course.name = "Curso de React Avanzado"
+        db_session.commit()
+
+        assert shared_cache.get(("courses",)) == (False, None)
+        courses = await service.get_courses()
+        assert "Curso de React Avanzado" in [c["name"] for c in courses]
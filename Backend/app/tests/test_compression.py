@@ -0,0 +1,94 @@
+"""Tests for response compression."""
+
+import gzip
+
+import pytest
+
+from app.core import compression
+from app.core.compression import Compressor, EncodedBody
+from app.tests.test_courses import client, db_session, db_data  # noqa: F401
+
+
+@pytest.fixture
+def compressor(monkeypatch):
+    """Compress every catalog body regardless of size."""
+    compressor = Compressor(min_size=0, gzip_level=6, brotli_quality=5)
+    monkeypatch.setattr(compression, "get_compressor", lambda: compressor)
+    return compressor
+
+
+class TestCompressor:
+    """Test cases for content coding negotiation and compression."""
+
+    def test_negotiate_prefers_highest_weight(self):
+        """Test that q-values and wildcards are honored."""
+        compressor = Compressor(min_size=0, gzip_level=6, brotli_quality=5)
+        compressor.encodings = ("br", "gzip")
+
+        assert compressor.negotiate(None) is None
+        assert compressor.negotiate("identity") is None
+        assert compressor.negotiate("gzip, deflate") == "gzip"
+        assert compressor.negotiate("gzip, br") == "br"
+        assert compressor.negotiate("br;q=0.5, gzip") == "gzip"
+        assert compressor.negotiate("*;q=0.8, br;q=0") == "gzip"
+        assert compressor.negotiate("gzip;q=0") is None
+
+    def test_encoded_body_compresses_each_variant_once(self):
+        """Test that variants are cached and small bodies stay uncompressed."""
+        compressor = Compressor(min_size=100, gzip_level=6, brotli_quality=5)
+        encoded = EncodedBody(b'{"name":"Curso de React"}' * 10)
+
+        first, encoding = encoded.variant("gzip", compressor)
+        second, _ = encoded.variant("gzip", compressor)
+
+        assert encoding == "gzip"
+        assert first is second
+        assert gzip.decompress(first) == encoded.identity
+        assert compressor.stats["gzip"].responses == 1
+        assert compressor.stats["gzip"].as_dict()["ratio"] < 1
+        assert EncodedBody(b"{}").variant("gzip", compressor) == (b"{}", None)
+
+
+class TestCompressedEndpointsIntegration:
+    """Integration test cases for compressed catalog responses."""
+
+    def test_gzip_response(self, client, db_session, db_data, compressor):
+        """Test that the course list is served gzip-encoded when accepted."""
+        identity = client.get("/courses", headers={"Accept-Encoding": "identity"})
+        response = client.get("/courses", headers={"Accept-Encoding": "gzip"})
+
+        assert identity.headers.get("content-encoding") is None
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] != identity.headers["etag"]
+        assert response.json() == identity.json()
+
+    def test_conditional_get_with_variant_etag(self, client, db_session, db_data, compressor):
+        """Test that the ETag of a compressed variant revalidates."""
+        response = client.get("/courses/curso-de-react", headers={"Accept-Encoding": "gzip"})
+
+        revalidated = client.get(
+            "/courses/curso-de-react",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]},
+        )
+
+        assert revalidated.status_code == 304
+        assert revalidated.headers["etag"] == response.headers["etag"]
+
+    def test_brotli_response(self, client, db_session, db_data, compressor):
+        """Test that brotli is preferred when installed and accepted."""
+        pytest.importorskip("brotli")
+
+        response = client.get("/courses", headers={"Accept-Encoding": "gzip, br"})
+
+        assert response.headers["content-encoding"] == "br"
+        assert [course["slug"] for course in response.json()]
+
+    def test_compression_stats(self, client, db_session, db_data, compressor):
+        """Test that ratio and CPU cost are reported per coding."""
+        client.get("/courses", headers={"Accept-Encoding": "gzip"})
+        client.get("/courses", headers={"Accept-Encoding": "gzip"})
+
+        stats = client.get("/compression-stats").json()["encodings"]["gzip"]
+        assert stats["responses"] == 1
+        assert 0 < stats["ratio"] < 1
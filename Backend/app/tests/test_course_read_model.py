@@ -0,0 +1,147 @@
+"""Tests for the denormalized course read model."""
+
+from datetime import datetime
+from sqlalchemy import delete, update
+from app.db.course_read_model import refresh_all_course_read_models
+from app.db.models.course import Course
+from app.db.models.course_read_model import CourseReadModel
+from app.db.models.course_teacher import CourseTeacher
+from app.db.models.lecture import Lecture
+from app.db.models.teacher import Teacher
+from app.tests.test_courses import db_session, db_data  # noqa: F401
+
+
+def _read_model(db_session, slug):
+    """Fetch the read model row of a course by slug."""
+    db_session.expire_all()
+    return db_session.query(CourseReadModel).filter(CourseReadModel.slug == slug).first()
+
+
+class TestCourseReadModel:
+    """Test cases for read model maintenance on write."""
+
+    def test_rows_created_on_commit(self, db_session, db_data):
+        """Test that committed courses get pre-assembled rows."""
+        row = _read_model(db_session, "curso-de-react")
+
+        assert row.summary == {
+            "id": 1,
+            "name": "Curso de React",
+            "description": "Curso de React",
+            "thumbnail": "https://via.placeholder.com/150",
+            "slug": "curso-de-react"
+        }
+        assert [teacher["id"] for teacher in row.detail["teacher_id"]] == [1, 2]
+        assert [lecture["id"] for lecture in row.detail["lectures"]] == [1, 2]
+
+    def test_soft_deleted_course_row_removed(self, db_session, db_data):
+        """Test that soft deleting a course removes its row."""
+        course = db_session.query(Course).filter(Course.id == 1).first()
+        course.deleted_at = datetime.now()
+        db_session.commit()
+
+        assert _read_model(db_session, "curso-de-react") is None
+        assert _read_model(db_session, "curso-de-python") is not None
+
+    def test_lecture_change_refreshes_course(self, db_session, db_data):
+        """Test that lecture writes rebuild the course detail and version."""
+        version = _read_model(db_session, "curso-de-react").version
+
+        lecture = db_session.query(Lecture).filter(Lecture.id == 2).first()
+        lecture.name = "Clase 2: Hooks"
+        db_session.add(Lecture(
+            id=4, course_id=1, name="Clase 3", description="Clase 3",
+            slug="clase-3", video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        ))
+        db_session.commit()
+
+        row = _read_model(db_session, "curso-de-react")
+        assert [lecture["name"] for lecture in row.detail["lectures"]] == [
+            "Clase 1", "Clase 2: Hooks", "Clase 3"
+        ]
+        assert row.version != version
+
+    def test_moved_lecture_leaves_old_course(self, db_session, db_data):
+        """Test that moving a lecture rebuilds both the course it left and the one it joined."""
+        db_session.get(Lecture, 2).course_id = 2
+        db_session.commit()
+
+        assert [l["id"] for l in _read_model(db_session, "curso-de-react").detail["lectures"]] == [1]
+        assert [l["id"] for l in _read_model(db_session, "curso-de-python").detail["lectures"]] == [2, 3]
+
+    def test_update_statement_refreshes_course(self, db_session, db_data):
+        """Test that update() statements executed through the session rebuild the rows."""
+        db_session.execute(update(Course).where(Course.id == 2).values(name="Python 3"))
+        db_session.commit()
+
+        assert _read_model(db_session, "curso-de-python").summary["name"] == "Python 3"
+
+    def test_bulk_query_update_moves_lectures(self, db_session, db_data):
+        """Test that a bulk query().update() moving lectures rebuilds both courses."""
+        db_session.query(Lecture).filter(Lecture.course_id == 1).update(
+            {Lecture.course_id: 2}, synchronize_session=False
+        )
+        db_session.commit()
+
+        assert _read_model(db_session, "curso-de-react").detail["lectures"] == []
+        assert [l["id"] for l in _read_model(db_session, "curso-de-python").detail["lectures"]] == [1, 2, 3]
+
+    def test_bulk_update_by_primary_key(self, db_session, db_data):
+        """Test that bulk updates by primary key rebuild the old and new courses."""
+        db_session.execute(update(Lecture), [{"id": 3, "course_id": 1, "name": "Python en React"}])
+        db_session.commit()
+
+        assert [l["id"] for l in _read_model(db_session, "curso-de-react").detail["lectures"]] == [1, 2, 3]
+        assert _read_model(db_session, "curso-de-python").detail["lectures"] == []
+
+    def test_delete_statements_refresh_courses(self, db_session, db_data):
+        """Test that delete() statements on lectures and course_teacher rebuild the rows."""
+        db_session.execute(delete(Lecture).where(Lecture.id == 1))
+        db_session.execute(delete(CourseTeacher).where(CourseTeacher.teacher_id == 2))
+        db_session.commit()
+
+        detail = _read_model(db_session, "curso-de-react").detail
+        assert [lecture["id"] for lecture in detail["lectures"]] == [2]
+        assert [teacher["id"] for teacher in detail["teacher_id"]] == [1]
+
+    def test_teacher_change_refreshes_all_their_courses(self, db_session, db_data):
+        """Test that teacher writes rebuild every course they teach."""
+        db_session.add(CourseTeacher(course_id=2, teacher_id=1))
+        db_session.commit()
+
+        teacher = db_session.query(Teacher).filter(Teacher.id == 1).first()
+        teacher.deleted_at = datetime.now()
+        db_session.commit()
+
+        assert [t["id"] for t in _read_model(db_session, "curso-de-react").detail["teacher_id"]] == [2]
+        assert [t["id"] for t in _read_model(db_session, "curso-de-python").detail["teacher_id"]] == [3]
+
+    def test_deleted_teacher_leaves_their_courses(self, db_session, db_data):
+        """Test that hard deleting a teacher rebuilds the courses they taught."""
+        db_session.add(CourseTeacher(course_id=2, teacher_id=1))
+        db_session.commit()
+
+        db_session.delete(db_session.query(Teacher).filter(Teacher.id == 1).first())
+        db_session.commit()
+
+        assert [t["id"] for t in _read_model(db_session, "curso-de-react").detail["teacher_id"]] == [2]
+        assert [t["id"] for t in _read_model(db_session, "curso-de-python").detail["teacher_id"]] == [3]
+
+    def test_rollback_leaves_rows_untouched(self, db_session, db_data):
+        """Test that rolled back writes do not touch the read model."""
+        course = db_session.query(Course).filter(Course.id == 1).first()
+        course.name = "Nombre temporal"
+        db_session.flush()
+        db_session.rollback()
+
+        assert _read_model(db_session, "curso-de-react").summary["name"] == "Curso de React"
+
+    def test_refresh_all_rebuilds_rows(self, db_session, db_data):
+        """Test that a full refresh recreates missing rows."""
+        db_session.query(CourseReadModel).delete()
+        db_session.commit()
+
+        refresh_all_course_read_models(db_session)
+        db_session.commit()
+
+        assert db_session.query(CourseReadModel).count() == 2
@@ -1,13 +1,23 @@
 """Tests for course endpoints."""
 
 import pytest
+from contextlib import contextmanager
 from unittest.mock import Mock, patch
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
+from app.core.config import get_settings
+from app.core.metrics import track_queries
 from app.main import app
-from app.services.course_service import CourseService, get_course_service
-from app.db.base import Base, get_db
+from app.services.course_cache import get_response_body_cache
+from app.services.course_service import (
+    CourseService,
+    get_async_course_service,
+    get_course_service,
+    get_sync_course_service,
+)
+from app.db.base import Base, get_async_db, get_async_database_url, get_db
 from app.db.models.course import Course
 from app.db.models.lecture import Lecture
 from app.db.models.teacher import Teacher
@@ -20,6 +30,12 @@ TEST_DATABASE_URL = "sqlite:///./test_integration.db"
 test_engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
 
+# Async engine over the same database file, used by the async mode
+test_async_engine = create_async_engine(get_async_database_url(TEST_DATABASE_URL))
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=test_async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 def override_get_db():
     """Override database dependency for integration tests."""
@@ -30,10 +46,37 @@ def override_get_db():
         db.close()
 
 
+async def override_get_async_db():
+    """Override async database dependency for integration tests."""
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
 @pytest.fixture
 def client():
-    """Create a test client."""
-    return TestClient(app)
+    """Create a test client with an empty encoded body cache."""
+    get_response_body_cache().clear()
+    yield TestClient(app)
+    get_response_body_cache().clear()
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Assert that the block issues at most max_queries SQL statements and
+    never repeats one (the signature of an N+1 lazy load).
+    """
+    @contextmanager
+    def budget(max_queries):
+        with track_queries() as usage:
+            yield usage
+        statements = "\n".join(usage.statements)
+        assert usage.queries <= max_queries, (
+            f"{usage.queries} queries over a budget of {max_queries}:\n{statements}"
+        )
+        assert not usage.repeated(), f"Repeated statements (N+1?):\n{usage.repeated()}"
+
+    return budget
 
 
 @pytest.fixture
@@ -90,17 +133,21 @@ def sample_course_detail():
     }
 
 
-@pytest.fixture
-def db_session():
-    """Create a database session for integration tests."""
+@pytest.fixture(params=["sync", "async"])
+def db_session(request):
+    """Create a database session for integration tests, once per database mode."""
     # Create the database tables
     Base.metadata.create_all(bind=test_engine)
     
     # Create session
     session = TestingSessionLocal()
     
-    # Override the dependency
+    # Override the dependencies for the requested mode
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_course_service] = (
+        get_async_course_service if request.param == "async" else get_sync_course_service
+    )
     
     try:
         yield session
@@ -658,4 +705,334 @@ class TestGetCourseBySlugIntegration:
         assert response.status_code == 200
         course = response.json()
         assert len(course["lectures"]) == 1  # Only one lecture should remain
-        assert course["lectures"][0]["id"] == 2  # Should be the second lecture 
\ No newline at end of file
+        assert course["lectures"][0]["id"] == 2  # Should be the second lecture 
+
+@pytest.fixture
+def paginated_courses(db_session):
+    """Create courses with known created_at values, including a timestamp tie."""
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    courses = [
+        Course(
+            id=course_id,
+            name=f"Curso {course_id}",
+            description=f"Curso {course_id}",
+            thumbnail="https://via.placeholder.com/150",
+            slug=f"curso-{course_id}",
+            created_at=base.replace(hour=12 + min(course_id, 4))
+        )
+        for course_id in range(1, 6)
+    ]
+    db_session.add_all(courses)
+    db_session.commit()
+
+    # Newest first; courses 4 and 5 share created_at so id breaks the tie
+    return ["curso-5", "curso-4", "curso-3", "curso-2", "curso-1"]
+
+
+class TestGetCoursesPaginationIntegration:
+    """Integration test cases for keyset pagination on GET /courses."""
+
+    def test_pages_cover_all_courses_in_order(self, client, paginated_courses):
+        """Test that following next_cursor walks every course exactly once."""
+        slugs = []
+        cursor = None
+
+        while True:
+            params = {"limit": 1}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get("/courses", params=params)
+            assert response.status_code == 200
+            page = response.json()
+            assert len(page["items"]) <= 1
+            slugs.extend(course["slug"] for course in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert slugs == paginated_courses
+
+    def test_last_page_has_no_cursor(self, client, paginated_courses):
+        """Test that a page covering the remaining courses has no next_cursor."""
+        response = client.get("/courses", params={"limit": 10})
+
+        assert response.status_code == 200
+        page = response.json()
+        assert [course["slug"] for course in page["items"]] == paginated_courses
+        assert page["next_cursor"] is None
+
+    def test_pagination_skips_soft_deleted_courses(self, client, db_session, paginated_courses):
+        """Test that soft deleted courses are not returned in pages."""
+        course_to_delete = db_session.query(Course).filter(Course.slug == "curso-4").first()
+        course_to_delete.deleted_at = datetime.now()
+        db_session.commit()
+
+        response = client.get("/courses", params={"limit": 10})
+
+        assert response.status_code == 200
+        assert [course["slug"] for course in response.json()["items"]] == [
+            "curso-5", "curso-3", "curso-2", "curso-1"
+        ]
+
+    def test_invalid_cursor(self, client, paginated_courses):
+        """Test that a malformed cursor is rejected with 400."""
+        response = client.get("/courses", params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+
+    def test_limit_above_maximum(self, client, paginated_courses):
+        """Test that limit is bounded by COURSES_MAX_PAGE_SIZE."""
+        response = client.get("/courses", params={"limit": 10_000})
+
+        assert response.status_code == 422
+
+
+class TestConditionalGet:
+    """Test cases for ETag / If-None-Match support on catalog endpoints."""
+
+    def test_not_modified_skips_loading_body(self, client, mock_course_service, sample_course_detail):
+        """Test that a matching If-None-Match returns 304 without loading the course."""
+        mock_course_service.get_course_version.return_value = {"id": 1, "updated_at": "v1"}
+        mock_course_service.get_course_by_slug.return_value = sample_course_detail
+        app.dependency_overrides[get_course_service] = lambda: mock_course_service
+
+        try:
+            first = client.get("/courses/curso-de-react")
+            etag = first.headers["etag"]
+            second = client.get("/courses/curso-de-react", headers={"If-None-Match": etag})
+
+            assert first.status_code == 200
+            assert second.status_code == 304
+            assert second.content == b""
+            assert second.headers["etag"] == etag
+            mock_course_service.get_course_by_slug.assert_called_once_with("curso-de-react")
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_missing_course_skips_loading_body(self, client, mock_course_service):
+        """Test that a missing fingerprint returns 404 without loading the course."""
+        mock_course_service.get_course_version.return_value = None
+        app.dependency_overrides[get_course_service] = lambda: mock_course_service
+
+        try:
+            response = client.get("/courses/non-existent-course")
+
+            assert response.status_code == 404
+            mock_course_service.get_course_by_slug.assert_not_called()
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_courses_etag_roundtrip_integration(self, client, db_session, db_data):
+        """Test 304 for an unchanged list and a new ETag after an update."""
+        etag = client.get("/courses").headers["etag"]
+
+        assert client.get("/courses", headers={"If-None-Match": etag}).status_code == 304
+
+        course = db_session.query(Course).filter(Course.slug == "curso-de-python").first()
+        course.name = "Curso de Python 3"
+        course.updated_at = datetime(2100, 1, 1)
+        db_session.commit()
+
+        response = client.get("/courses", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_course_etag_changes_with_lectures_integration(self, client, db_session, db_data):
+        """Test that soft deleting a lecture changes the course ETag."""
+        etag = client.get("/courses/curso-de-react").headers["etag"]
+
+        lecture = db_session.query(Lecture).filter(Lecture.id == 1).first()
+        lecture.deleted_at = datetime.now()
+        db_session.commit()
+
+        response = client.get("/courses/curso-de-react", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert len(response.json()["lectures"]) == 1
+
+    def test_course_etag_changes_with_teachers_integration(self, client, db_session, db_data):
+        """Test that updating a teacher changes the course ETag."""
+        etag = client.get("/courses/curso-de-react").headers["etag"]
+
+        teacher = db_session.query(Teacher).filter(Teacher.id == 1).first()
+        teacher.name = "Juan Pérez García"
+        teacher.updated_at = datetime(2100, 1, 1)
+        db_session.commit()
+
+        response = client.get("/courses/curso-de-react", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["teacher_id"][0]["name"] == "Juan Pérez García"
+
+    def test_lecture_etag_integration(self, client, db_session, db_data):
+        """Test conditional GET on a lecture, including weak and list forms."""
+        etag = client.get("/lectures/1").headers["etag"]
+
+        for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+            response = client.get("/lectures/1", headers={"If-None-Match": header})
+            assert response.status_code == 304
+
+
+class TestGetCoursesBatchIntegration:
+    """Integration tests for GET /courses/batch."""
+
+    def test_batch_keeps_request_order_and_reports_missing(self, client, db_session, db_data):
+        """Test that items follow the request order and missing slugs are reported per item."""
+        response = client.get(
+            "/courses/batch", params={"slugs": "curso-de-python,non-existent-course,curso-de-react"}
+        )
+
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert [item["slug"] for item in items] == [
+            "curso-de-python", "non-existent-course", "curso-de-react"
+        ]
+        assert items[0]["course"]["lectures"][0]["slug"] == "intro-python"
+        assert items[0]["error"] is None
+        assert items[1] == {"slug": "non-existent-course", "course": None, "error": "Course not found"}
+        assert len(items[2]["course"]["teacher_id"]) == 2
+
+    def test_batch_matches_single_course_detail(self, client, db_session, db_data):
+        """Test that batch items are the same payload as GET /courses/{slug}."""
+        single = client.get("/courses/curso-de-react").json()
+        batch = client.get("/courses/batch", params={"slugs": "curso-de-react"}).json()
+
+        assert batch["items"][0]["course"] == single
+
+    def test_batch_deduplicates_slugs(self, client, db_session, db_data):
+        """Test that repeated slugs are returned once."""
+        response = client.get(
+            "/courses/batch", params={"slugs": "curso-de-react, curso-de-react,curso-de-python"}
+        )
+
+        assert [item["slug"] for item in response.json()["items"]] == [
+            "curso-de-react", "curso-de-python"
+        ]
+
+    def test_batch_skips_soft_deleted_courses(self, client, db_session, db_data):
+        """Test that soft-deleted courses are reported as missing."""
+        course = db_session.query(Course).filter(Course.id == 2).first()
+        course.deleted_at = datetime.now()
+        db_session.commit()
+
+        response = client.get("/courses/batch", params={"slugs": "curso-de-python"})
+
+        assert response.json()["items"][0]["error"] == "Course not found"
+
+    @pytest.mark.parametrize("slugs", ["", " , ,"])
+    def test_batch_requires_slugs(self, client, db_session, slugs):
+        """Test that an empty slug list is rejected."""
+        response = client.get("/courses/batch", params={"slugs": slugs})
+
+        assert response.status_code == 400
+
+    def test_batch_above_maximum(self, client, db_session):
+        """Test that batches above COURSES_BATCH_MAX_SIZE are rejected."""
+        slugs = ",".join(f"curso-{n}" for n in range(get_settings().COURSES_BATCH_MAX_SIZE + 1))
+
+        response = client.get("/courses/batch", params={"slugs": slugs})
+
+        assert response.status_code == 400
+
+    def test_batch_etag_roundtrip(self, client, db_session, db_data):
+        """Test conditional GET on a batch and its invalidation by a course change."""
+        params = {"slugs": "curso-de-react,curso-de-python"}
+        etag = client.get("/courses/batch", params=params).headers["etag"]
+
+        response = client.get("/courses/batch", params=params, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        course = db_session.query(Course).filter(Course.id == 2).first()
+        course.name = "Curso de Python Avanzado"
+        db_session.commit()
+
+        response = client.get("/courses/batch", params=params, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["items"][1]["course"]["name"] == "Curso de Python Avanzado"
+
+
+class TestGetLecturesBatchIntegration:
+    """Integration tests for GET /lectures?ids=..."""
+
+    def test_batch_keeps_request_order_and_reports_missing(self, client, db_session, db_data):
+        """Test that items follow the request order and missing IDs are reported per item."""
+        response = client.get("/lectures", params={"ids": "3,999,1"})
+
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert [item["id"] for item in items] == [3, 999, 1]
+        assert items[0]["lecture"]["slug"] == "intro-python"
+        assert items[1] == {"id": 999, "lecture": None, "error": "Lecture not found"}
+        assert items[2]["lecture"] == client.get("/lectures/1").json()
+
+    def test_batch_skips_soft_deleted_lectures(self, client, db_session, db_data):
+        """Test that soft-deleted lectures are reported as missing."""
+        lecture = db_session.query(Lecture).filter(Lecture.id == 2).first()
+        lecture.deleted_at = datetime.now()
+        db_session.commit()
+
+        response = client.get("/lectures", params={"ids": "1,2"})
+
+        assert [item["error"] for item in response.json()["items"]] == [None, "Lecture not found"]
+
+    @pytest.mark.parametrize("ids", ["", "1,two", " , "])
+    def test_batch_rejects_invalid_ids(self, client, db_session, ids):
+        """Test that empty or non-numeric ID lists are rejected."""
+        response = client.get("/lectures", params={"ids": ids})
+
+        assert response.status_code == 400
+
+    def test_batch_above_maximum(self, client, db_session):
+        """Test that batches above LECTURES_BATCH_MAX_SIZE are rejected."""
+        ids = ",".join(str(n) for n in range(get_settings().LECTURES_BATCH_MAX_SIZE + 1))
+
+        response = client.get("/lectures", params={"ids": ids})
+
+        assert response.status_code == 400
+
+    def test_batch_etag_roundtrip(self, client, db_session, db_data):
+        """Test conditional GET on a batch and its invalidation by a new lecture."""
+        params = {"ids": "1,4"}
+        etag = client.get("/lectures", params=params).headers["etag"]
+
+        response = client.get("/lectures", params=params, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        db_session.add(Lecture(
+            id=4, course_id=2, name="Clase 4", description="Clase 4", slug="clase-4",
+            video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        ))
+        db_session.commit()
+
+        response = client.get("/lectures", params=params, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["items"][1]["lecture"]["slug"] == "clase-4"
+
+
+class TestQueryBudgets:
+    """Maximum SQL statements per endpoint (uncached service, both database modes)."""
+
+    @pytest.mark.parametrize("path, max_queries", [
+        ("/courses", 2),
+        ("/courses?limit=2", 2),
+        ("/courses/curso-de-react", 2),
+        ("/courses/non-existent-course", 1),
+        ("/lectures/1", 2),
+        ("/lectures/999", 1),
+        ("/courses/batch?slugs=curso-de-react", 2),
+        ("/courses/batch?slugs=curso-de-react,curso-de-python,non-existent-course", 2),
+        ("/lectures?ids=1", 1),
+        ("/lectures?ids=3,1,2,999", 1),
+        ("/search?q=clase", 1),
+    ])
+    def test_endpoint_query_budget(self, client, db_session, db_data, query_budget, path, max_queries):
+        """Test that each endpoint stays within its query budget."""
+        with query_budget(max_queries):
+            response = client.get(path)
+
+        assert response.status_code in (200, 404)
+
+    def test_budget_detects_lazy_loads(self, db_session, db_data, query_budget):
+        """Test that lazy-loading a relationship per row is reported."""
+        with pytest.raises(AssertionError, match="N\\+1"):
+            with query_budget(10):
+                for course in db_session.query(Course).all():
+                    list(course.teachers)
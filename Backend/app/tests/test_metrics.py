@@ -0,0 +1,122 @@
+"""Tests for the /metrics endpoint."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.metrics import Histogram, MetricsMiddleware, MetricsRegistry, get_metrics_registry
+from app.tests.test_courses import client, db_session, db_data  # noqa: F401
+
+
+@pytest.fixture
+def metrics_client(client):
+    """Client with empty request metrics."""
+    get_metrics_registry().clear()
+    yield client
+    get_metrics_registry().clear()
+
+
+def _value(body, sample):
+    """Return the value of an exact sample line from an exposition body."""
+    for line in body.splitlines():
+        name, _, value = line.rpartition(" ")
+        if name == sample:
+            return float(value)
+    raise AssertionError(f"{sample} not found in metrics")
+
+
+class TestMetricsRegistry:
+    """Test cases for the metrics registry."""
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test that observations count in every bucket they fit."""
+        histogram = Histogram((0.1, 1))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+
+        lines = list(histogram.samples("latency", (("route", "/courses"),)))
+
+        assert lines == [
+            'latency_bucket{route="/courses",le="0.1"} 1',
+            'latency_bucket{route="/courses",le="1"} 2',
+            'latency_bucket{route="/courses",le="+Inf"} 2',
+            'latency_sum{route="/courses"} 0.55',
+            'latency_count{route="/courses"} 2',
+        ]
+
+    def test_render_declares_types(self):
+        """Test that every family has HELP and TYPE lines."""
+        body = MetricsRegistry().render()
+
+        assert "# TYPE http_requests_total counter" in body
+        assert "# TYPE http_request_duration_seconds histogram" in body
+        assert "http_requests_in_flight 0" in body
+
+
+class TestMetricsEndpointIntegration:
+    """Integration test cases for request and database metrics."""
+
+    def test_requests_are_labelled_by_route_template(self, metrics_client, db_session, db_data):
+        """Test that latency and status are recorded per route template, not raw path."""
+        metrics_client.get("/courses/curso-de-react")
+        metrics_client.get("/courses/curso-de-python")
+        metrics_client.get("/courses/no-existe")
+
+        body = metrics_client.get("/metrics").text
+
+        route = 'method="GET",route="/courses/{slug}"'
+        assert _value(body, f'http_requests_total{{{route},status="200"}}') == 2
+        assert _value(body, f'http_requests_total{{{route},status="404"}}') == 1
+        assert _value(body, f"http_request_duration_seconds_count{{{route}}}") == 3
+        assert "curso-de-react" not in body
+
+    def test_database_usage_is_attributed_to_requests(self, metrics_client, db_session, db_data):
+        """Test that SQL statements are counted per request in both database modes."""
+        metrics_client.get("/lectures/1")
+
+        body = metrics_client.get("/metrics").text
+
+        route = 'method="GET",route="/lectures/{lecture_id}"'
+        # One fingerprint query and one lecture query
+        assert _value(body, f"http_request_db_queries_sum{{{route}}}") == 2
+        assert _value(body, f"http_request_db_duration_seconds_sum{{{route}}}") > 0
+        assert _value(body, "db_queries_total") >= 2
+
+    def test_unmatched_paths_share_one_label(self, metrics_client):
+        """Test that unknown paths do not create a label per path."""
+        metrics_client.get("/does-not-exist")
+
+        body = metrics_client.get("/metrics").text
+
+        assert _value(
+            body, 'http_requests_total{method="GET",route="<unmatched>",status="404"}'
+        ) == 1
+
+    def test_content_type(self, metrics_client):
+        """Test that the exposition content type is served."""
+        response = metrics_client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "db_pool_checked_out" in response.text
+
+
+class TestRepeatedStatementWarning:
+    """Test cases for N+1 warnings in production."""
+
+    def test_repeated_statements_are_logged(self, caplog):
+        """Test that a request repeating a statement is logged as a possible N+1."""
+        engine = create_engine("sqlite://")
+        demo = FastAPI()
+        demo.add_middleware(MetricsMiddleware, repeat_warning_threshold=3)
+
+        @demo.get("/items")
+        def items():
+            with engine.connect() as connection:
+                return [connection.execute(text("SELECT :id"), {"id": i}).scalar() for i in range(3)]
+
+        with caplog.at_level("WARNING", logger="app.core.metrics"):
+            TestClient(demo).get("/items")
+
+        assert "GET /items issued the same statement 3 times (possible N+1): SELECT ?" in caplog.text
@@ -0,0 +1,171 @@
+"""Tests for connection pool configuration and instrumentation."""
+
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import Settings
+from app.db.base import Base, get_db
+from app.db.pool import (
+    InstrumentedQueuePool,
+    PoolTimeoutError,
+    get_pool_limits,
+    get_pool_options,
+    get_pool_stats,
+)
+from app.main import app
+from app.services.course_service import get_course_service, get_sync_course_service
+from app.tests.test_courses import TEST_DATABASE_URL, client  # noqa: F401
+
+POOL_TIMEOUT = 0.05
+
+
+@pytest.fixture
+def pool_engine():
+    """Engine with a single-connection pool that gives up after POOL_TIMEOUT."""
+    engine = create_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=POOL_TIMEOUT,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def pool_client(client, pool_engine):
+    """Route the endpoints through the single-connection pool."""
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=pool_engine)
+
+    def override_get_db():
+        with SessionLocal() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_course_service] = get_sync_course_service
+    yield client
+    app.dependency_overrides.clear()
+
+
+class TestPoolOptions:
+    """Test cases for pool settings."""
+
+    def test_settings_are_applied(self):
+        """Test that pool settings reach create_engine()."""
+        settings = Settings(DATABASE_POOL_SIZE=3, DATABASE_MAX_OVERFLOW=1, DATABASE_POOL_TIMEOUT=2)
+
+        options = get_pool_options(settings, "postgresql://user:password@db/platziflix")
+
+        assert options["poolclass"] is InstrumentedQueuePool
+        assert options["pool_size"] == 3
+        assert options["max_overflow"] == 1
+        assert options["pool_timeout"] == 2
+        assert options["pool_pre_ping"] is True
+
+    def test_in_memory_sqlite_keeps_default_pool(self):
+        """Test that in-memory SQLite is not given a QueuePool."""
+        assert get_pool_options(Settings(), "sqlite://") == {}
+
+    def test_pools_share_the_connection_budget(self):
+        """Test that all engines of all workers stay within DATABASE_MAX_CONNECTIONS."""
+        settings = Settings(
+            DATABASE_POOL_SIZE=5, DATABASE_MAX_OVERFLOW=10, DATABASE_MAX_CONNECTIONS=90
+        )
+
+        assert get_pool_limits(settings, workers=4) == (5, 10)
+        assert get_pool_limits(settings, workers=8) == (5, 6)
+        assert get_pool_limits(settings, workers=32) == (2, 0)
+
+    def test_default_budget_is_finite(self):
+        """Test that pools are sized from PostgreSQL's default limit unless configured."""
+        assert Settings().DATABASE_MAX_CONNECTIONS == 90
+        assert get_pool_limits(Settings(), workers=1) == (5, 10)
+        assert get_pool_limits(Settings(), workers=16) == (5, 0)
+        assert get_pool_limits(Settings(DATABASE_ASYNC=True), workers=16) == (2, 0)
+
+    def test_async_mode_counts_both_engines(self):
+        """Test that in async mode each worker's budget is split over two engines."""
+        settings = Settings(DATABASE_ASYNC=True, DATABASE_MAX_CONNECTIONS=40)
+
+        assert get_pool_limits(settings, workers=4) == (5, 0)
+
+    def test_budget_below_one_connection_per_engine(self):
+        """Test that too many workers for the connection budget are rejected."""
+        settings = Settings(DATABASE_MAX_CONNECTIONS=3)
+
+        with pytest.raises(ValueError, match="WEB_CONCURRENCY"):
+            get_pool_limits(settings, workers=4)
+
+    def test_options_sized_for_web_concurrency(self):
+        """Test that engines are sized for the WEB_CONCURRENCY workers."""
+        settings = Settings(WEB_CONCURRENCY=4, DATABASE_MAX_CONNECTIONS=24)
+
+        options = get_pool_options(settings, "postgresql://user:password@db/platziflix")
+
+        assert (options["pool_size"], options["max_overflow"]) == (5, 1)
+
+
+class TestPoolSaturation:
+    """Test cases for behavior when the pool runs out of connections."""
+
+    def test_checkout_times_out_and_is_counted(self, pool_engine):
+        """Test that a checkout beyond capacity waits pool_timeout, then fails."""
+        before = get_pool_stats(pool_engine)
+        held = pool_engine.connect()
+
+        stats = get_pool_stats(pool_engine)
+        assert stats["checked_out"] == 1
+        assert stats["checked_in"] == 0
+
+        with pytest.raises(PoolTimeoutError):
+            pool_engine.connect()
+
+        held.close()
+        with pool_engine.connect() as connection:
+            assert connection.execute(text("SELECT 1")).scalar() == 1
+
+        stats = get_pool_stats(pool_engine)
+        assert stats["checkouts"] - before["checkouts"] == 2
+        assert stats["timeouts"] - before["timeouts"] == 1
+        # The timed out checkout waited at least pool_timeout
+        slow = stats["wait_ms_buckets"]["+Inf"] - stats["wait_ms_buckets"]["25"]
+        assert slow == 1
+
+    def test_waiting_request_gets_released_connection(self, pool_engine):
+        """Test that a queued checkout is served as soon as a connection is returned."""
+        held = pool_engine.connect()
+        release = threading.Timer(POOL_TIMEOUT / 5, held.close)
+        release.start()
+
+        with pool_engine.connect() as connection:
+            assert connection.execute(text("SELECT 1")).scalar() == 1
+        release.join()
+
+        assert get_pool_stats(pool_engine)["timeouts"] == 0
+
+    def test_exhausted_pool_returns_503(self, pool_client, pool_engine):
+        """Test that requests fail fast with 503 while every connection is busy."""
+        held = pool_engine.connect()
+
+        response = pool_client.get("/courses")
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+        assert response.json() == {"detail": "Database connection pool exhausted"}
+
+        held.close()
+        assert pool_client.get("/courses").status_code == 200
+
+    def test_pool_stats_endpoint(self, client):
+        """Test that live pool stats are published."""
+        response = client.get("/pool-stats")
+
+        assert response.status_code == 200
+        assert "sync" in response.json()
@@ -0,0 +1,245 @@
+"""Tests for read replica routing, against a primary and replicas in separate SQLite files."""
+
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+from app.db import base
+from app.core.shared_cache import InMemoryCacheBackend, SharedCache
+from app.db.base import Base, get_async_database_url, get_async_replica_db, get_db, get_replica_db
+from app.db.models.course import Course
+from app.db.replicas import Replica, ReplicaRouter
+from app.main import app
+from app.services import course_cache, course_service
+from app.services.course_cache import get_catalog_cache, get_response_body_cache
+from app.services.course_service import (
+    get_cached_course_service,
+    get_course_service,
+    get_database_course_service,
+    get_sync_course_service,
+)
+from app.tests.test_courses import client  # noqa: F401
+
+
+def _database(path, course_name):
+    """Create a database file holding one course named course_name."""
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add(Course(
+            id=1, name=course_name, description="Curso de React",
+            thumbnail="https://via.placeholder.com/150", slug="curso-de-react",
+        ))
+        session.commit()
+    return engine
+
+
+def _replica(engine, async_engine=None):
+    return Replica(str(engine.url), engine, async_engine)
+
+
+@pytest.fixture
+def databases(tmp_path):
+    """A primary and two replicas whose course names tell them apart."""
+    engines = {
+        name: _database(tmp_path / f"{name}.db", f"Curso de React ({name})")
+        for name in ("primary", "replica_a", "replica_b")
+    }
+    yield engines
+    for engine in engines.values():
+        engine.dispose()
+
+
+class TestReplicaRouter:
+    """Test cases for replica selection and health checks."""
+
+    def test_round_robin(self, databases):
+        """Test that healthy replicas take turns."""
+        a, b = _replica(databases["replica_a"]), _replica(databases["replica_b"])
+        router = ReplicaRouter([a, b])
+        router.check()
+
+        assert [router.pick() for _ in range(4)] == [a, b, a, b]
+
+    def test_least_connections(self, databases):
+        """Test that the replica with fewer checked-out connections is picked."""
+        a, b = _replica(databases["replica_a"]), _replica(databases["replica_b"])
+        router = ReplicaRouter([a, b], balancing="least_connections")
+        router.check()
+
+        with databases["replica_a"].connect():
+            assert router.pick() is b
+        with databases["replica_b"].connect():
+            assert router.pick() is a
+
+    def test_lagging_replica_is_skipped(self, databases):
+        """Test that replicas lagging past the threshold are skipped."""
+        a, b = _replica(databases["replica_a"]), _replica(databases["replica_b"])
+        lags = {a.url: 30.0, b.url: 1.0}
+        router = ReplicaRouter(
+            [a, b], max_lag_seconds=5, lag_probe=lambda connection: lags[str(connection.engine.url)]
+        )
+        router.check()
+
+        assert [router.pick() for _ in range(3)] == [b, b, b]
+        assert a.lag_seconds == 30.0
+        assert "Lagging" in a.error
+
+    def test_unreachable_replicas_fall_back_to_primary(self, tmp_path):
+        """Test that with no healthy replica the primary is used and counted."""
+        missing = create_engine(f"sqlite:///{tmp_path}/missing/replica.db")
+        router = ReplicaRouter([_replica(missing)])
+        router.check()
+
+        assert router.pick() is None
+        assert router.stats()["primary_fallbacks"] == 1
+        assert router.stats()["replicas"][0]["healthy"] is False
+        assert router.stats()["replicas"][0]["error"]
+
+    def test_checks_run_once_per_interval(self, databases):
+        """Test that health checks are throttled by the check interval."""
+        probes = []
+        router = ReplicaRouter(
+            [_replica(databases["replica_a"])],
+            check_interval_seconds=60,
+            lag_probe=lambda connection: probes.append(1) or 0.0,
+        )
+
+        assert router.needs_check()
+        router.check()
+        router.check()
+
+        assert len(probes) == 1
+        assert not router.needs_check()
+
+    def test_pinned_reads_go_to_primary(self, databases):
+        """Test that pinning sends reads to the primary for the lag window only."""
+        a = _replica(databases["replica_a"])
+        router = ReplicaRouter([a], max_lag_seconds=0.1)
+        router.check()
+
+        router.pin_primary()
+        assert router.pick() is None
+        assert router.stats()["pinned_reads"] == 1
+        time.sleep(0.15)
+        assert router.pick() is a
+        assert router.primary_fallbacks == 0
+
+    def test_unknown_balancing_rejected(self):
+        """Test that unknown strategies are rejected."""
+        with pytest.raises(ValueError):
+            ReplicaRouter([], balancing="random")
+
+
+@pytest.fixture
+def routed_client(client, databases, monkeypatch):
+    """Route the catalog reads through a router over replica_a, with databases["primary"] as primary."""
+    router = ReplicaRouter([_replica(databases["replica_a"])], check_interval_seconds=60)
+    monkeypatch.setattr(base, "get_read_router", lambda: router)
+    monkeypatch.setattr(base, "get_engine", lambda: databases["primary"])
+    app.dependency_overrides[get_db] = get_replica_db
+    app.dependency_overrides[get_course_service] = get_sync_course_service
+    yield client, router
+    app.dependency_overrides.clear()
+
+
+class TestReplicaRouting:
+    """Integration tests for catalog reads served from replicas."""
+
+    def _course_name(self, client):
+        return client.get("/courses/curso-de-react").json()["name"]
+
+    def test_reads_served_by_replica(self, routed_client):
+        """Test that GET traffic reads from the healthy replica."""
+        client, router = routed_client
+
+        assert self._course_name(client) == "Curso de React (replica_a)"
+
+    def test_falls_back_to_primary_when_replica_lags(self, routed_client):
+        """Test that a replica lagging past the threshold sends reads to the primary."""
+        client, router = routed_client
+        router.lag_probe = lambda connection: 60.0
+
+        assert self._course_name(client) == "Curso de React (primary)"
+        assert router.primary_fallbacks == 1
+
+    @pytest.mark.asyncio
+    async def test_async_session_bound_to_replica(self, databases, monkeypatch):
+        """Test that async read sessions use the replica's async engine."""
+        url = str(databases["replica_a"].url)
+        async_engine = create_async_engine(get_async_database_url(url))
+        replica = _replica(databases["replica_a"], async_engine)
+        router = ReplicaRouter([replica])
+        monkeypatch.setattr(base, "get_read_router", lambda: router)
+
+        sessions = get_async_replica_db()
+        db = await sessions.__anext__()
+        try:
+            assert db.bind is async_engine
+            assert (await db.get(Course, 1)).name == "Curso de React (replica_a)"
+        finally:
+            await sessions.aclose()
+            await async_engine.dispose()
+
+
+@pytest.fixture
+def cached_routed_client(client, databases, monkeypatch):
+    """
+    Cached catalog reads routed over replica_a, which never replays the
+    primary's writes (a replica lagging behind the primary).
+    """
+    router = ReplicaRouter(
+        [_replica(databases["replica_a"])], max_lag_seconds=0.2, check_interval_seconds=60
+    )
+    shared_cache = SharedCache(InMemoryCacheBackend(), ttl_seconds=60, prefix="test")
+    monkeypatch.setattr(base, "get_read_router", lambda: router)
+    monkeypatch.setattr(course_cache, "get_read_router", lambda: router)
+    monkeypatch.setattr(course_cache, "get_shared_catalog_cache", lambda: shared_cache)
+    monkeypatch.setattr(course_service, "get_shared_catalog_cache", lambda: shared_cache)
+    monkeypatch.setattr(base, "get_engine", lambda: databases["primary"])
+    app.dependency_overrides[get_db] = get_replica_db
+    app.dependency_overrides[get_database_course_service] = get_sync_course_service
+    app.dependency_overrides[get_course_service] = get_cached_course_service
+    get_catalog_cache().clear()
+    yield client, router, shared_cache
+    app.dependency_overrides.clear()
+    get_catalog_cache().clear()
+
+
+class TestReplicaCacheConsistency:
+    """Integration tests for cache fills from replicas behind the primary."""
+
+    def _course_name(self, client):
+        return client.get("/courses/curso-de-react").json()["name"]
+
+    def test_write_then_read_through_lagging_replica(self, cached_routed_client, databases):
+        """Test that reads after a write skip the lagging replica and fill no stale entries."""
+        client, router, shared_cache = cached_routed_client
+        assert self._course_name(client) == "Curso de React (replica_a)"
+
+        with sessionmaker(bind=databases["primary"])() as session:
+            session.get(Course, 1).name = "Curso de React (actualizado)"
+            session.commit()
+
+        assert self._course_name(client) == "Curso de React (actualizado)"
+        assert self._course_name(client) == "Curso de React (actualizado)"
+        assert router.pinned_reads > 0
+        assert shared_cache.get(("course", "curso-de-react")) == (
+            True, client.get("/courses/curso-de-react").json()
+        )
+
+    def test_replica_reads_cached_for_lag_bound(self, cached_routed_client):
+        """Test that replica reads stay out of the shared tier and expire after the lag bound."""
+        client, router, shared_cache = cached_routed_client
+
+        assert self._course_name(client) == "Curso de React (replica_a)"
+        assert self._course_name(client) == "Curso de React (replica_a)"
+        assert get_catalog_cache().stats.hits == 1
+        assert shared_cache.get(("course", "curso-de-react")) == (False, None)
+
+        time.sleep(0.25)
+        assert self._course_name(client) == "Curso de React (replica_a)"
+        assert get_catalog_cache().stats.expirations == 2
+        assert get_response_body_cache().stats.expirations == 1
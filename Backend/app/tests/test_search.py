@@ -0,0 +1,97 @@
+"""Tests for full-text search (GET /search) on the SQLite FTS5 backend."""
+
+from datetime import datetime
+from app.core.config import get_settings
+from app.db.models.course import Course
+from app.db.models.lecture import Lecture
+from app.tests.test_courses import client, db_session, db_data  # noqa: F401
+
+
+def _hits(response):
+    return [(hit["type"], hit["id"]) for hit in response.json()["items"]]
+
+
+class TestSearchIntegration:
+    """Integration tests for ranked, paginated full-text search."""
+
+    def test_search_courses_and_lectures(self, client, db_session, db_data):
+        """Test that matching courses and lectures are returned with their course slug."""
+        response = client.get("/search", params={"q": "python"})
+
+        assert response.status_code == 200
+        assert sorted(_hits(response)) == [("course", 2), ("lecture", 3)]
+        lecture = next(hit for hit in response.json()["items"] if hit["type"] == "lecture")
+        assert lecture["course_id"] == 2
+        assert lecture["course_slug"] == "curso-de-python"
+        assert lecture["slug"] == "intro-python"
+
+    def test_search_requires_every_term(self, client, db_session, db_data):
+        """Test that hits contain all the words of the query."""
+        assert _hits(client.get("/search", params={"q": "python react"})) == []
+        assert _hits(client.get("/search", params={"q": "curso react"})) == [("course", 1)]
+
+    def test_search_folds_accents_and_case(self, client, db_session, db_data):
+        """Test that unaccented, lowercase queries match accented text."""
+        response = client.get("/search", params={"q": "INTRODUCCION"})
+
+        assert _hits(response) == [("lecture", 3)]
+
+    def test_name_matches_rank_above_description_matches(self, client, db_session, db_data):
+        """Test that a name match outranks a description-only match."""
+        db_session.add(Lecture(
+            id=4, course_id=2, name="Componentes", description="Componentes de React",
+            slug="componentes", video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        ))
+        db_session.commit()
+
+        response = client.get("/search", params={"q": "react"})
+
+        assert _hits(response) == [("course", 1), ("lecture", 4)]
+        ranks = [hit["rank"] for hit in response.json()["items"]]
+        assert ranks[0] > ranks[1]
+
+    def test_search_pagination(self, client, db_session, db_data):
+        """Test that pages are disjoint and next_offset chains them."""
+        first = client.get("/search", params={"q": "clase", "limit": 1}).json()
+        assert first["next_offset"] == 1
+
+        second = client.get("/search", params={"q": "clase", "limit": 1, "offset": 1}).json()
+        assert second["next_offset"] is None
+        assert {first["items"][0]["id"], second["items"][0]["id"]} == {1, 2}
+
+    def test_search_skips_soft_deleted_rows(self, client, db_session, db_data):
+        """Test that deleted lectures, and lectures of deleted courses, are not returned."""
+        db_session.get(Lecture, 1).deleted_at = datetime.now()
+        db_session.get(Course, 2).deleted_at = datetime.now()
+        db_session.commit()
+
+        assert _hits(client.get("/search", params={"q": "clase"})) == [("lecture", 2)]
+        assert _hits(client.get("/search", params={"q": "python"})) == []
+
+    def test_search_follows_updates(self, client, db_session, db_data):
+        """Test that renamed rows are found by their new name only."""
+        course = db_session.get(Course, 2)
+        course.name = course.description = "Curso de Django"
+        db_session.commit()
+
+        assert _hits(client.get("/search", params={"q": "django"})) == [("course", 2)]
+        assert ("course", 2) not in _hits(client.get("/search", params={"q": "python"}))
+
+    def test_search_ranks_newest_candidates_only(self, client, db_session, db_data, monkeypatch):
+        """Test that broad queries only rank the newest SEARCH_MAX_CANDIDATES matches."""
+        monkeypatch.setattr(get_settings(), "SEARCH_MAX_CANDIDATES", 1)
+
+        assert _hits(client.get("/search", params={"q": "clase"})) == [("lecture", 2)]
+
+    def test_search_without_terms(self, client, db_session, db_data):
+        """Test that a query without words returns no hits."""
+        response = client.get("/search", params={"q": "!!!"})
+
+        assert response.status_code == 200
+        assert response.json() == {"items": [], "next_offset": None}
+
+    def test_search_validates_parameters(self, client, db_session):
+        """Test that empty queries and out-of-range pages are rejected."""
+        assert client.get("/search", params={"q": ""}).status_code == 422
+        assert client.get("/search", params={"q": "python", "limit": 0}).status_code == 422
+        assert client.get("/search", params={"q": "python", "offset": -1}).status_code == 422
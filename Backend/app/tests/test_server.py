@@ -0,0 +1,128 @@
+"""Tests for the production server launcher."""
+
+import signal
+import time
+
+import pytest
+import uvicorn
+
+from app import server
+from app.core.config import Settings
+from app.services.warmup import get_warmup_status
+
+
+class TestServerOptions:
+    """Test cases for the uvicorn options derived from settings."""
+
+    def test_one_worker_per_cpu_by_default(self, monkeypatch):
+        """Test that WEB_CONCURRENCY=0 starts one worker per available CPU."""
+        monkeypatch.setattr(server, "available_cpus", lambda: 6)
+
+        assert server.uvicorn_options(Settings(WEB_CONCURRENCY=0))["workers"] == 6
+        assert server.uvicorn_options(Settings(WEB_CONCURRENCY=3))["workers"] == 3
+
+    def test_auto_prefers_installed_implementations(self, monkeypatch):
+        """Test that auto picks uvloop/httptools only when they are installed."""
+        installed = set()
+        monkeypatch.setattr(
+            server.importlib.util, "find_spec", lambda name: object() if name in installed else None
+        )
+
+        options = server.uvicorn_options(Settings())
+        assert (options["loop"], options["http"]) == ("asyncio", "h11")
+
+        installed.update({"uvloop", "httptools"})
+        options = server.uvicorn_options(Settings())
+        assert (options["loop"], options["http"]) == ("uvloop", "httptools")
+
+    def test_explicit_implementation(self):
+        """Test that an explicit choice is kept and an unknown one rejected."""
+        assert server.uvicorn_options(Settings(SERVER_LOOP="asyncio"))["loop"] == "asyncio"
+
+        with pytest.raises(ValueError, match="SERVER_HTTP"):
+            server.uvicorn_options(Settings(SERVER_HTTP="gunicorn"))
+
+    def test_tuning_settings_applied(self):
+        """Test that backlog, keep-alive and graceful shutdown reach uvicorn."""
+        options = server.uvicorn_options(Settings(
+            SERVER_BACKLOG=512, SERVER_KEEPALIVE_SECONDS=90, SERVER_GRACEFUL_TIMEOUT=10
+        ))
+
+        assert options["backlog"] == 512
+        assert options["timeout_keep_alive"] == 90
+        assert options["timeout_graceful_shutdown"] == 10
+
+    def test_main_pins_worker_count_for_workers(self, monkeypatch):
+        """Test that the launcher exports the resolved worker count before starting uvicorn."""
+        runs = []
+        monkeypatch.setattr(
+            server, "serve", lambda app, options, drain_seconds: runs.append((app, options))
+        )
+        monkeypatch.setattr(server, "get_settings", lambda: Settings(WEB_CONCURRENCY=0))
+        monkeypatch.setattr(server, "available_cpus", lambda: 3)
+        monkeypatch.setenv("WEB_CONCURRENCY", "0")
+
+        server.main()
+
+        assert runs[0][0] == "app.main:app"
+        assert runs[0][1]["workers"] == 3
+        assert Settings().WEB_CONCURRENCY == 3
+
+    def test_main_rejects_too_small_connection_budget(self, monkeypatch):
+        """Test that no server starts when workers cannot get a connection each."""
+        monkeypatch.setattr(
+            server, "serve", lambda app, options, drain_seconds: pytest.fail("server started")
+        )
+        monkeypatch.setattr(
+            server, "get_settings", lambda: Settings(WEB_CONCURRENCY=8, DATABASE_MAX_CONNECTIONS=4)
+        )
+
+        with pytest.raises(ValueError):
+            server.main()
+
+
+@pytest.fixture
+def ready_status():
+    """A fresh process-wide warm-up status reporting ready."""
+    get_warmup_status.cache_clear()
+    status = get_warmup_status()
+    status.ready = True
+    yield status
+    get_warmup_status.cache_clear()
+
+
+class TestDrainingServer:
+    """Test cases for draining a worker on SIGTERM."""
+
+    def _server(self, drain_seconds):
+        return server.DrainingServer(
+            uvicorn.Config("app.main:app", log_config=None), drain_seconds
+        )
+
+    def test_reports_not_ready_before_shutting_down(self, ready_status):
+        """Test that SIGTERM flips readiness at once and shuts down after the drain time."""
+        draining = self._server(drain_seconds=0.1)
+
+        draining.handle_exit(signal.SIGTERM, None)
+        assert ready_status.ready is False
+        assert draining.should_exit is False
+
+        time.sleep(0.2)
+        assert draining.should_exit is True
+
+    def test_second_signal_shuts_down_now(self, ready_status):
+        """Test that a second signal skips the remaining drain time."""
+        draining = self._server(drain_seconds=60)
+
+        draining.handle_exit(signal.SIGTERM, None)
+        draining.handle_exit(signal.SIGTERM, None)
+
+        assert draining.should_exit is True
+
+    def test_drain_can_be_disabled(self, ready_status):
+        """Test that SERVER_DRAIN_SECONDS=0 shuts down immediately."""
+        draining = self._server(drain_seconds=0)
+
+        draining.handle_exit(signal.SIGTERM, None)
+
+        assert draining.should_exit is True
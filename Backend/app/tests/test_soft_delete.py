@@ -0,0 +1,70 @@
+"""Tests for the global soft-delete criterion."""
+
+from datetime import datetime
+from sqlalchemy import bindparam, event, select
+from sqlalchemy.orm import selectinload
+from app.db.models.course import Course
+from app.db.models.lecture import Lecture
+from app.db.models.teacher import Teacher
+from app.db.soft_delete import with_soft_delete_criteria
+from app.tests.test_courses import db_session, db_data  # noqa: F401
+
+
+def _soft_delete(db_session, model, id):
+    """Soft delete a row and start from a clean identity map."""
+    db_session.get(model, id).deleted_at = datetime.now()
+    db_session.commit()
+    db_session.expunge_all()
+
+
+class TestSoftDeleteCriterion:
+    """Test cases for filtering soft-deleted rows in every ORM query."""
+
+    def test_queries_exclude_deleted_rows(self, db_session, db_data):
+        """Test that entity and column queries skip soft-deleted rows."""
+        _soft_delete(db_session, Course, 2)
+
+        assert [c.slug for c in db_session.query(Course).all()] == ["curso-de-react"]
+        assert db_session.execute(select(Course.id)).scalars().all() == [1]
+        assert db_session.get(Course, 2) is None
+
+    def test_include_deleted_opt_out(self, db_session, db_data):
+        """Test that include_deleted returns soft-deleted rows, e.g. to restore them."""
+        _soft_delete(db_session, Course, 2)
+
+        course = db_session.execute(
+            select(Course).where(Course.id == 2).execution_options(include_deleted=True)
+        ).scalar_one()
+        course.deleted_at = None
+        db_session.commit()
+
+        assert db_session.execute(select(Course.id)).scalars().all() == [1, 2]
+
+    def test_collections_exclude_deleted_children(self, db_session, db_data):
+        """Test that selectin and lazy collection loads skip soft-deleted children."""
+        _soft_delete(db_session, Lecture, 2)
+        _soft_delete(db_session, Teacher, 1)
+
+        course = db_session.execute(
+            select(Course)
+            .where(Course.id == 1)
+            .options(selectinload(Course.teachers), selectinload(Course.lectures))
+        ).scalar_one()
+        assert [teacher.id for teacher in course.teachers] == [2]
+        assert [lecture.id for lecture in course.lectures] == [1]
+
+        # Lazy loads from a refreshed (expired) instance are filtered too
+        db_session.expire(course)
+        assert [lecture.id for lecture in course.lectures] == [1]
+
+    def test_prebuilt_criterion_is_not_added_again(self, db_session, db_data):
+        """Test that statements built with the criterion are filtered and executed as is."""
+        _soft_delete(db_session, Lecture, 2)
+        statement = with_soft_delete_criteria(
+            select(Lecture.id).where(Lecture.course_id == bindparam("course_id"))
+        )
+        executed = []
+        event.listen(db_session, "do_orm_execute", lambda state: executed.append(state.statement))
+
+        assert db_session.execute(statement, {"course_id": 1}).scalars().all() == [1]
+        assert len(executed) == 1 and executed[0] is statement
@@ -0,0 +1,147 @@
+"""Tests for the prefix index and the GET /suggest typeahead."""
+
+import pytest
+from datetime import datetime
+from app.core.prefix_index import PrefixIndex, fold
+from app.db.models.course import Course
+from app.db.models.lecture import Lecture
+from app.services.suggest import get_suggest_index, load_suggest_index
+from app.tests.test_courses import client, db_session, db_data  # noqa: F401
+
+
+@pytest.fixture
+def index():
+    """A small index of accented Spanish titles."""
+    index = PrefixIndex()
+    index.load([
+        (1, "Curso de React", "react"),
+        (2, "Introducción a Python", "python"),
+        (3, "Programación Orientada a Objetos", "poo"),
+    ])
+    return index
+
+
+class TestPrefixIndex:
+    """Test cases for PrefixIndex."""
+
+    def test_fold(self):
+        """Test that folding drops accents and case and collapses spaces."""
+        assert fold("  Introducción   a PYTHON ") == "introduccion a python"
+        assert fold("Diseño") == "diseno"
+
+    def test_matches_any_word_start(self, index):
+        """Test that prefixes match at the start of every word, not inside words."""
+        assert index.search("rea", 10) == ["react"]
+        assert index.search("curso de r", 10) == ["react"]
+        assert index.search("eact", 10) == []
+
+    def test_accent_insensitive(self, index):
+        """Test that accented and unaccented prefixes match alike."""
+        assert index.search("introduccion", 10) == ["python"]
+        assert index.search("PROGRAMACIÓN orient", 10) == ["poo"]
+
+    def test_results_are_unique_and_limited(self, index):
+        """Test that a title matching at several words is returned once, up to limit."""
+        assert index.search("a", 10) == ["poo", "python"]
+        assert index.search("a", 1) == ["poo"]
+        assert index.search("   ", 10) == []
+
+    def test_put_replaces_and_discard_removes(self, index):
+        """Test incremental updates."""
+        index.put(1, "Curso de Vue", "vue")
+        index.put(4, "Álgebra lineal", "algebra")
+        index.discard(2)
+        index.discard(99)
+
+        assert index.search("curso", 10) == ["vue"]
+        assert index.search("react", 10) == []
+        assert index.search("alg", 10) == ["algebra"]
+        assert index.search("python", 10) == []
+        assert len(index) == 3
+
+    def test_accept_filters_payloads(self, index):
+        """Test that rejected payloads are skipped without using up the limit."""
+        assert index.search("a", 1, accept=lambda payload: payload != "poo") == ["python"]
+
+    def test_stats(self, index):
+        """Test the reported counts and memory footprint."""
+        stats = index.stats()
+
+        assert stats["titles"] == 3
+        assert stats["entries"] == 3 + 3 + 4
+        assert stats["memory_bytes"] > 0
+
+
+@pytest.fixture
+def suggest_index(db_session, db_data):
+    """Load the process-wide suggestion index from the test database."""
+    load_suggest_index(db_session)
+    yield get_suggest_index()
+    get_suggest_index().load([])
+
+
+class TestSuggestIntegration:
+    """Integration tests for GET /suggest and the incremental index updates."""
+
+    def _names(self, client, q):
+        return [hit["name"] for hit in client.get("/suggest", params={"q": q}).json()["items"]]
+
+    def test_suggest_courses_and_lectures(self, client, suggest_index):
+        """Test that courses and lectures are suggested with their ids and slugs."""
+        response = client.get("/suggest", params={"q": "intro"})
+
+        assert response.status_code == 200
+        assert response.json()["items"] == [{
+            "type": "lecture", "id": 3, "course_id": 2,
+            "name": "Introducción a Python", "slug": "intro-python",
+        }]
+        assert self._names(client, "curso de") == ["Curso de Python", "Curso de React"]
+
+    def test_suggest_follows_committed_changes(self, client, db_session, suggest_index):
+        """Test that created, renamed and soft-deleted rows update the index on commit."""
+        db_session.add(Lecture(
+            id=4, course_id=1, name="Hooks avanzados", description="Hooks", slug="hooks",
+            video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        ))
+        db_session.get(Course, 1).name = "Curso de React Native"
+        db_session.get(Lecture, 1).deleted_at = datetime.now()
+        db_session.commit()
+
+        assert self._names(client, "hooks") == ["Hooks avanzados"]
+        assert self._names(client, "react") == ["Curso de React Native"]
+        assert self._names(client, "clase") == ["Clase 2"]
+
+    def test_suggest_hides_lectures_of_deleted_courses(self, client, db_session, suggest_index):
+        """Test that soft-deleting a course hides it and its lectures until restored."""
+        course = db_session.get(Course, 2)
+        course.deleted_at = datetime.now()
+        db_session.commit()
+
+        assert self._names(client, "python") == []
+
+        course.deleted_at = None
+        db_session.commit()
+
+        assert sorted(self._names(client, "python")) == [
+            "Curso de Python", "Introducción a Python"
+        ]
+
+    def test_suggest_ignores_rolled_back_changes(self, client, db_session, suggest_index):
+        """Test that flushed but rolled back changes never reach the index."""
+        db_session.get(Course, 1).name = "Curso de Angular"
+        db_session.flush()
+        db_session.rollback()
+
+        assert self._names(client, "angular") == []
+
+    def test_suggest_validates_parameters(self, client, suggest_index):
+        """Test that empty prefixes and out-of-range limits are rejected."""
+        assert client.get("/suggest", params={"q": ""}).status_code == 422
+        assert client.get("/suggest", params={"q": "c", "limit": 0}).status_code == 422
+
+    def test_suggest_stats(self, client, suggest_index):
+        """Test that the index footprint is reported."""
+        stats = client.get("/suggest-stats").json()
+
+        assert stats["titles"] == 5
+        assert stats["memory_bytes"] > 0
@@ -0,0 +1,83 @@
+"""Tests for the synthetic catalog generator."""
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.pool import StaticPool
+from app.db import synthetic_seed
+from app.db.base import Base
+from app.db.models import Course, CourseReadModel, CourseTeacher, Lecture, Teacher
+from app.db.synthetic_seed import create_synthetic_catalog
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """An empty in-memory database, with small batches to exercise batching."""
+    monkeypatch.setattr(synthetic_seed, "BATCH_SIZE", 7)
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def _count(engine, statement):
+    with engine.connect() as connection:
+        return connection.execute(statement).scalar_one()
+
+
+class TestSyntheticCatalog:
+    """Test cases for create_synthetic_catalog."""
+
+    def test_loads_requested_scale(self, engine):
+        """Test row counts, teachers per course and the rebuilt read models."""
+        counts = create_synthetic_catalog(
+            courses=30, lectures_per_course=4, teachers_per_course=3, engine=engine
+        )
+
+        assert counts == {
+            "teachers": 3, "courses": 30, "course_teacher": 90,
+            "lectures": 120, "course_read_models": 30,
+        }
+        assert _count(engine, select(func.count()).select_from(
+            select(CourseTeacher.course_id).group_by(CourseTeacher.course_id)
+            .having(func.count() == 3).subquery()
+        )) == 30
+        assert _count(engine, select(func.count(func.distinct(Course.slug)))) == 30
+
+    def test_soft_deletes_fraction(self, engine):
+        """Test that about deleted_fraction of the rows are soft-deleted."""
+        counts = create_synthetic_catalog(
+            courses=200, lectures_per_course=5, deleted_fraction=0.25, engine=engine
+        )
+
+        deleted_courses = _count(
+            engine, select(func.count()).where(Course.deleted_at.is_not(None))
+        )
+        deleted_lectures = _count(
+            engine, select(func.count()).where(Lecture.deleted_at.is_not(None))
+        )
+        assert 30 <= deleted_courses <= 70
+        assert 200 <= deleted_lectures <= 300
+        assert counts["course_read_models"] == 200 - deleted_courses
+
+    def test_replaces_existing_catalog_deterministically(self, engine):
+        """Test that reruns clear the previous catalog and produce the same rows."""
+        create_synthetic_catalog(courses=10, lectures_per_course=2, engine=engine)
+        with engine.connect() as connection:
+            first = connection.execute(select(Course.name).order_by(Course.id)).scalars().all()
+
+        counts = create_synthetic_catalog(courses=10, lectures_per_course=2, engine=engine)
+
+        with engine.connect() as connection:
+            assert connection.execute(
+                select(Course.name).order_by(Course.id)
+            ).scalars().all() == first
+        assert counts["lectures"] == _count(engine, select(func.count()).select_from(Lecture))
+        assert _count(engine, select(func.count()).select_from(Teacher)) == 2
+        assert _count(engine, select(func.count()).select_from(CourseReadModel)) == 10
+
+    def test_rejects_invalid_fraction(self, engine):
+        """Test that fractions outside [0, 1] are rejected."""
+        with pytest.raises(ValueError):
+            create_synthetic_catalog(courses=1, deleted_fraction=1.5, engine=engine)
@@ -0,0 +1,208 @@
+"""Tests for the startup warm-up and the GET /ready readiness probe."""
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from app import main
+from app.core.config import Settings
+from app.core.shared_cache import InMemoryCacheBackend, SharedCache
+from app.db.base import Base
+from app.db.pool import InstrumentedQueuePool
+from app.db.replicas import Replica, ReplicaRouter
+from app.main import app
+from app.services import warmup
+from app.services.course_cache import CachedCourseService, get_catalog_cache
+from app.services.course_service import CourseService
+from app.services.warmup import get_warmup_status, open_connections, run_catalog_queries
+from app.tests.test_cache import cached_client  # noqa: F401
+from app.tests.test_courses import (  # noqa: F401
+    TEST_DATABASE_URL,
+    client,
+    db_data,
+    db_session,
+    query_budget,
+    test_engine,
+)
+
+
+@pytest.fixture
+def warmup_status():
+    """A fresh process-wide warm-up status."""
+    get_warmup_status.cache_clear()
+    yield get_warmup_status()
+    get_warmup_status.cache_clear()
+
+
+class TestWarmup:
+    """Test cases for the warm-up steps."""
+
+    def test_open_connections_capped_at_pool_size(self):
+        """Test that connections are opened together and kept by the pool."""
+        engine = create_engine(
+            TEST_DATABASE_URL, poolclass=InstrumentedQueuePool, pool_size=3, max_overflow=5
+        )
+        try:
+            assert open_connections(engine, 10) == 3
+            assert engine.pool.checkedin() == 3
+        finally:
+            engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_runs_every_read_query(self, db_session, db_data):
+        """Test that each read method of the service is called for the hot courses."""
+        calls = await run_catalog_queries(CourseService(db_session), hot_courses=1, page_size=20)
+
+        # list version, list, page, then per course version + detail, per
+        # lecture version + detail, and the three batch/search calls
+        assert calls == 3 + 2 + 2 + 4
+
+    @pytest.mark.asyncio
+    async def test_prefills_catalog_cache(self, cached_client, db_session, query_budget):
+        """Test that after warming through the cache, hot requests issue no queries."""
+        service = CachedCourseService(CourseService(db_session), get_catalog_cache(), None)
+        await run_catalog_queries(service, hot_courses=2, page_size=20)
+
+        with query_budget(0):
+            for path in ("/courses", "/courses?limit=20", "/courses/curso-de-react", "/lectures/1"):
+                assert cached_client.get(path).status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_skips_unreachable_replica(self, db_session, db_data, tmp_path, monkeypatch):
+        """Test that a down replica is skipped and the cache is prefilled from the primary."""
+        empty = create_engine(f"sqlite:///{tmp_path}/empty.db")
+        Base.metadata.create_all(bind=empty)
+        missing = create_engine(f"sqlite:///{tmp_path}/missing/replica.db")
+        router = ReplicaRouter([Replica(str(empty.url), empty), Replica(str(missing.url), missing)])
+        shared_cache = SharedCache(InMemoryCacheBackend(), ttl_seconds=60, prefix="test")
+        monkeypatch.setattr(warmup, "get_engine", lambda: test_engine)
+        monkeypatch.setattr(warmup, "get_async_engine", lambda: None)
+        monkeypatch.setattr(warmup, "get_read_router", lambda: router)
+        monkeypatch.setattr(warmup, "get_shared_catalog_cache", lambda: shared_cache)
+        get_catalog_cache().clear()
+        try:
+            summary = await warmup.warm_up(Settings(DATABASE_ASYNC=False))
+        finally:
+            get_catalog_cache().clear()
+            empty.dispose()
+
+        assert summary["engines"] == 2
+        assert len(summary["skipped_replicas"]) == 1
+        assert "missing" in summary["skipped_replicas"][0]
+        # The empty replica served no prefill: the shared entry holds the primary's courses
+        hit, courses = shared_cache.get(("courses",))
+        assert hit and len(courses) == 2
+
+
+class TestReadiness:
+    """Test cases for GET /ready and the lifespan warm-up."""
+
+    def test_not_ready_until_finished(self, client, warmup_status):
+        """Test that /ready answers 503 while warming up and 200 afterwards."""
+        warmup_status.start()
+        assert client.get("/ready").status_code == 503
+        assert client.get("/health").status_code == 200
+
+        warmup_status.summary["connections"] = 5
+        warmup_status.finish()
+        response = client.get("/ready")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+        assert response.json()["connections"] == 5
+
+    def _wait_ready(self, client):
+        for _ in range(100):
+            response = client.get("/ready")
+            if response.status_code == 200:
+                return response
+            time.sleep(0.01)
+        raise AssertionError("worker never became ready")
+
+    def test_lifespan_warms_up_in_background(self, warmup_status, monkeypatch):
+        """Test that the lifespan loads the index, warms up, then reports ready until shutdown."""
+        async def fake_warm_up(settings):
+            return {
+                "connections": 2, "engines": 1, "service_calls": 11, "skipped_replicas": []
+            }
+
+        monkeypatch.setattr(main, "_load_suggest_index", lambda: 3)
+        monkeypatch.setattr(warmup, "warm_up", fake_warm_up)
+
+        with TestClient(app) as client:
+            body = self._wait_ready(client).json()
+
+        assert body["suggest_titles"] == 3
+        assert body["service_calls"] == 11
+        assert body["error"] is None
+        assert get_warmup_status().ready is False
+
+    def test_failed_startup_work_is_retried(self, warmup_status, monkeypatch):
+        """Test that failed steps keep the worker not ready and are retried until they succeed."""
+        failures = {"suggest": 1, "warm_up": 2}
+
+        def flaky_suggest_index():
+            if failures["suggest"]:
+                failures["suggest"] -= 1
+                raise ConnectionError("database down")
+            return 3
+
+        async def flaky_warm_up(settings):
+            if failures["warm_up"]:
+                failures["warm_up"] -= 1
+                raise ConnectionError("database down")
+            return {
+                "connections": 2, "engines": 1, "service_calls": 11, "skipped_replicas": []
+            }
+
+        monkeypatch.setattr(main, "_load_suggest_index", flaky_suggest_index)
+        monkeypatch.setattr(warmup, "warm_up", flaky_warm_up)
+        monkeypatch.setattr(
+            main, "get_settings", lambda: Settings(WARMUP_RETRY_BACKOFF_SECONDS=0.05)
+        )
+
+        with TestClient(app) as client:
+            for _ in range(100):
+                if get_warmup_status().attempts:
+                    break
+                time.sleep(0.01)
+            body = client.get("/ready").json()
+            assert body["status"] == "not_ready"
+            assert "database down" in body["error"]
+            body = self._wait_ready(client).json()
+
+        assert body["attempts"] == 3
+        assert body["error"] is None
+        assert body["suggest_titles"] == 3
+        assert body["service_calls"] == 11
+
+    def test_ready_on_failure(self, warmup_status, monkeypatch):
+        """Test that WARMUP_READY_ON_FAILURE reports ready while the failure is retried."""
+        async def failing_warm_up(settings):
+            raise ConnectionError("database down")
+
+        monkeypatch.setattr(main, "_load_suggest_index", lambda: 0)
+        monkeypatch.setattr(warmup, "warm_up", failing_warm_up)
+        monkeypatch.setattr(main, "get_settings", lambda: Settings(WARMUP_READY_ON_FAILURE=True))
+
+        with TestClient(app) as client:
+            body = self._wait_ready(client).json()
+
+        assert "database down" in body["error"]
+        assert body["attempts"] == 1
+
+    def test_warm_up_can_be_disabled(self, warmup_status, monkeypatch):
+        """Test that WARMUP_ENABLED=false skips the warm-up step."""
+        async def unexpected_warm_up(settings):
+            raise AssertionError("warm-up should not run")
+
+        monkeypatch.setattr(main, "_load_suggest_index", lambda: 0)
+        monkeypatch.setattr(warmup, "warm_up", unexpected_warm_up)
+        monkeypatch.setattr(main, "get_settings", lambda: Settings(WARMUP_ENABLED=False))
+
+        with TestClient(app) as client:
+            body = self._wait_ready(client).json()
+
+        assert body["error"] is None
+        assert "service_calls" not in body
@@ -0,0 +1,106 @@
+"""
+Compare ways of loading a course with its teachers and lectures.
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_collections --lectures 1000 --teachers 5
+"""
+
+import argparse
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.core.metrics import track_queries
+from app.db.course_read_model import refresh_all_course_read_models
+from app.db.models import Course, CourseTeacher, Lecture, Teacher
+from app.services.course_service import CourseService
+from benchmarks.common import create_benchmark_engine, measure, seed_catalog, session_factory
+
+SLUG = "curso-1"
+
+
+def joined(db):
+    """The previous path: joinedload both collections, drop deleted rows in Python."""
+    course = db.execute(
+        select(Course)
+        .options(joinedload(Course.teachers), joinedload(Course.lectures))
+        .where(Course.slug == SLUG)
+        .execution_options(include_deleted=True)
+    ).unique().scalar_one()
+    return (
+        [t for t in course.teachers if t.deleted_at is None],
+        [l for l in course.lectures if l.deleted_at is None],
+    )
+
+
+def selectin(db):
+    """One query per collection, soft-deleted rows filtered in SQL."""
+    course = db.execute(
+        select(Course)
+        .options(selectinload(Course.teachers), selectinload(Course.lectures))
+        .where(Course.slug == SLUG)
+    ).scalar_one()
+    return list(course.teachers), list(course.lectures)
+
+
+def read_model(db):
+    """The current read path: one pre-assembled row."""
+    return CourseService(db).get_course_by_slug(SLUG)
+
+
+def rows_fetched(db):
+    """Rows each variant gets from the database."""
+    joined_rows = db.execute(
+        select(func.count())
+        .select_from(Course)
+        .outerjoin(CourseTeacher, CourseTeacher.course_id == Course.id)
+        .outerjoin(Teacher, Teacher.id == CourseTeacher.teacher_id)
+        .outerjoin(Lecture, Lecture.course_id == Course.id)
+        .where(Course.slug == SLUG)
+        .execution_options(include_deleted=True)
+    ).scalar()
+    teachers = db.execute(select(func.count()).select_from(CourseTeacher)).scalar()
+    lectures = db.execute(select(func.count()).select_from(Lecture)).scalar()
+    return {"joinedload": joined_rows, "selectinload": 1 + teachers + lectures, "read model": 1}
+
+
+def run(lectures: int, teachers: int, deleted_ratio: float, iterations: int) -> None:
+    """Seed one large course and compare the loading strategies."""
+    engine = create_benchmark_engine()
+    seed_catalog(engine, 1, lectures, teachers_per_course=teachers, teachers=teachers)
+    with engine.begin() as connection:
+        connection.execute(
+            update(Lecture)
+            .where(Lecture.id <= int(lectures * deleted_ratio))
+            .values(deleted_at=func.now())
+        )
+        refresh_all_course_read_models(connection)
+    SessionLocal = session_factory(engine)
+
+    with SessionLocal() as db:
+        rows = rows_fetched(db)
+
+    print(f"\nCourse with {lectures} lectures ({deleted_ratio:.0%} soft deleted), {teachers} teachers")
+    print(f"{'variant':<16}{'queries':>9}{'rows':>8}{'cpu ms/call':>14}{'peak KiB/call':>16}")
+    for name, call in {"joinedload": joined, "selectinload": selectin, "read model": read_model}.items():
+        def request():
+            with SessionLocal() as db:
+                return call(db)
+
+        with track_queries() as usage:
+            request()
+        metrics = measure(request, iterations)
+        print(
+            f"{name:<16}{usage.queries:>9}{rows[name]:>8}"
+            f"{metrics['cpu_ms']:>14.3f}{metrics['peak_kib']:>16.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lectures", type=int, default=1000)
+    parser.add_argument("--teachers", type=int, default=5)
+    parser.add_argument("--deleted-ratio", type=float, default=0.1)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    run(args.lectures, args.teachers, args.deleted_ratio, args.iterations)
@@ -0,0 +1,63 @@
+"""
+Compare compression ratio and CPU cost of the catalog response variants.
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_compression --courses 10000 --lectures-per-course 10
+"""
+
+import argparse
+
+import orjson
+
+from app.core.compression import Compressor, EncodedBody, brotli
+from app.services.course_service import CourseService
+from benchmarks.common import create_benchmark_engine, measure, seed_catalog, session_factory
+
+# (coding, gzip level, brotli quality) variants compared
+VARIANTS = [("gzip", 1, 0), ("gzip", 6, 0), ("gzip", 9, 0)]
+if brotli is not None:
+    VARIANTS += [("br", 0, 1), ("br", 0, 5), ("br", 0, 9)]
+
+
+def run(courses: int, lectures_per_course: int, iterations: int) -> None:
+    """Encode each payload once and compress it with every variant."""
+    engine = create_benchmark_engine()
+    seed_catalog(engine, courses, lectures_per_course)
+    SessionLocal = session_factory(engine)
+
+    with SessionLocal() as db:
+        service = CourseService(db)
+        payloads = {
+            f"courses ({courses})": orjson.dumps(service.get_courses()),
+            "course detail": orjson.dumps(service.get_course_by_slug(f"curso-{courses // 2}")),
+        }
+
+    print(f"\nCompression: {courses} courses, {courses * lectures_per_course} lectures")
+    print(f"{'scenario':<22}{'variant':<12}{'bytes':>12}{'ratio':>8}{'cpu ms':>10}{'cached ms':>11}")
+    for scenario, body in payloads.items():
+        print(f"{scenario:<22}{'identity':<12}{len(body):>12}{1:>8.3f}{0:>10.3f}{0:>11.3f}")
+        for encoding, level, quality in VARIANTS:
+            compressor = Compressor(min_size=0, gzip_level=level, brotli_quality=quality)
+            compressed = compressor.compress(body, encoding)
+            cpu = measure(lambda: compressor.compress(body, encoding), iterations)
+
+            # Served from the precompressed body cache after the first request
+            encoded = EncodedBody(body)
+            encoded.variant(encoding, compressor)
+            cached = measure(lambda: encoded.variant(encoding, compressor), iterations)
+
+            name = f"{encoding}-{level if encoding == 'gzip' else quality}"
+            print(
+                f"{scenario:<22}{name:<12}{len(compressed):>12}"
+                f"{len(compressed) / len(body):>8.3f}"
+                f"{cpu['cpu_ms']:>10.3f}{cached['cpu_ms']:>11.3f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--courses", type=int, default=10_000)
+    parser.add_argument("--lectures-per-course", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+    run(args.courses, args.lectures_per_course, args.iterations)
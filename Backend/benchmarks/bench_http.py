@@ -0,0 +1,279 @@
+"""
+Load-test the HTTP API and compare the results against committed baselines.
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_http --compare
+    python -m benchmarks.bench_http --scale small --update-baseline
+
+For each scale the catalog is generated (app.db.synthetic_seed) into a
+temporary SQLite database, the app is started with uvicorn in a subprocess and
+concurrent clients replay a fixed mix of catalog requests. Throughput and
+p50/p95/p99 latency are reported per endpoint. With --compare the run fails
+(exit code 1) when an endpoint's throughput drops or its p95 latency grows
+beyond --tolerance relative to benchmarks/baselines/bench_http.json.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+from statistics import quantiles
+from typing import Any, Callable, Dict, List, Tuple
+
+from sqlalchemy import create_engine
+
+from app.db.base import Base
+from app.db.synthetic_seed import create_synthetic_catalog
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "bench_http.json"
+
+# scale -> (courses, lectures per course)
+SCALES = {
+    "small": (500, 10),
+    "medium": (5_000, 20),
+}
+TEACHERS_PER_COURSE = 2
+DELETED_FRACTION = 0.05
+
+# endpoint -> (share of requests, path builder); unknown ids (404) are part of the mix
+Mix = Dict[str, Tuple[float, Callable[[random.Random, int, int], str]]]
+MIX: Mix = {
+    "courses": (0.05, lambda rng, courses, lectures: "/courses"),
+    "courses_page": (0.15, lambda rng, courses, lectures: "/courses?limit=20"),
+    "course_detail": (0.45, lambda rng, courses, lectures: f"/courses/curso-{rng.randint(1, courses)}"),
+    "lecture": (0.35, lambda rng, courses, lectures: f"/lectures/{rng.randint(1, lectures)}"),
+}
+OK_STATUSES = {200, 304, 404}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def seed_database(path: str, courses: int, lectures_per_course: int) -> str:
+    """Create and seed a SQLite database file; returns its URL."""
+    url = f"sqlite:///{path}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    create_synthetic_catalog(
+        courses=courses,
+        lectures_per_course=lectures_per_course,
+        teachers_per_course=TEACHERS_PER_COURSE,
+        deleted_fraction=DELETED_FRACTION,
+        engine=engine,
+    )
+    engine.dispose()
+    return url
+
+
+def start_server(database_url: str, port: int) -> subprocess.Popen:
+    """Start the app with uvicorn and wait until it has warmed up (/ready)."""
+    env = {**os.environ, "DATABASE_URL": database_url, "DEBUG": "false"}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app",
+         "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("uvicorn exited during startup")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/ready", timeout=5):
+                return server
+        except OSError:
+            pass
+        time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("uvicorn did not become ready within 60s")
+
+
+async def _fetch(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, path: str) -> int:
+    """Send one keep-alive GET and read the whole response; returns the status code."""
+    writer.write(
+        f"GET {path} HTTP/1.1\r\nHost: bench\r\nAccept-Encoding: gzip\r\n\r\n".encode()
+    )
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = 0
+    for line in head.split(b"\r\n")[1:]:
+        name, _, value = line.partition(b":")
+        if name.lower() == b"content-length":
+            length = int(value)
+        elif name.lower() == b"transfer-encoding":
+            raise RuntimeError("chunked responses are not supported")
+    await reader.readexactly(length)
+    return int(head[9:12])
+
+
+async def drive_load(
+    port: int, courses: int, lectures: int, concurrency: int, duration: float, warmup: float
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run concurrent clients for warmup + duration seconds; returns samples per endpoint.
+
+    Clients speak minimal HTTP/1.1 over asyncio streams: a full HTTP client
+    library costs more CPU per request than the endpoints being measured.
+    """
+    names = list(MIX)
+    weights = [MIX[name][0] for name in names]
+    samples: Dict[str, List[float]] = {name: [] for name in names}
+    errors: Dict[str, int] = {name: 0 for name in names}
+    measure_from = time.perf_counter() + warmup
+    stop_at = measure_from + duration
+
+    async def client(worker: int) -> None:
+        rng = random.Random(worker)
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            while True:
+                name = rng.choices(names, weights)[0]
+                path = MIX[name][1](rng, courses, lectures)
+                start = time.perf_counter()
+                if start >= stop_at:
+                    return
+                try:
+                    status = await _fetch(reader, writer, path)
+                except (OSError, asyncio.IncompleteReadError):
+                    status = None
+                    writer.close()
+                    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                if start >= measure_from:
+                    samples[name].append((time.perf_counter() - start) * 1000)
+                    if status not in OK_STATUSES:
+                        errors[name] += 1
+        finally:
+            writer.close()
+
+    await asyncio.gather(*(client(worker) for worker in range(concurrency)))
+    return {
+        name: {"samples": samples[name], "errors": errors[name]}
+        for name in names
+    }
+
+
+def summarize(raw: Dict[str, Dict[str, Any]], duration: float) -> Dict[str, Dict[str, float]]:
+    """Throughput and latency percentiles per endpoint, plus the total."""
+    raw = {**raw, "total": {
+        "samples": [sample for data in raw.values() for sample in data["samples"]],
+        "errors": sum(data["errors"] for data in raw.values()),
+    }}
+    results = {}
+    for name, data in raw.items():
+        samples = data["samples"]
+        cuts = quantiles(samples, n=100) if len(samples) > 1 else [0.0] * 99
+        results[name] = {
+            "requests": len(samples),
+            "errors": data["errors"],
+            "rps": round(len(samples) / duration, 1),
+            "p50_ms": round(cuts[49], 2),
+            "p95_ms": round(cuts[94], 2),
+            "p99_ms": round(cuts[98], 2),
+        }
+    return results
+
+
+def run_scale(scale: str, concurrency: int, duration: float, warmup: float) -> Dict[str, Dict[str, float]]:
+    """Seed, serve and load-test one scale."""
+    courses, lectures_per_course = SCALES[scale]
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        database_url = seed_database(
+            os.path.join(directory, "bench.db"), courses, lectures_per_course
+        )
+        print(f"\n[{scale}] {courses} courses, {courses * lectures_per_course} lectures "
+              f"seeded in {time.perf_counter() - start:.1f}s")
+
+        port = _free_port()
+        server = start_server(database_url, port)
+        try:
+            raw = asyncio.run(drive_load(
+                port, courses, courses * lectures_per_course,
+                concurrency, duration, warmup,
+            ))
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+    return summarize(raw, duration)
+
+
+def print_results(scale: str, results: Dict[str, Dict[str, float]]) -> None:
+    print(f"{'endpoint':<16}{'requests':>10}{'errors':>8}{'req/s':>10}"
+          f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, metrics in results.items():
+        print(f"{name:<16}{metrics['requests']:>10}{metrics['errors']:>8}{metrics['rps']:>10.1f}"
+              f"{metrics['p50_ms']:>10.2f}{metrics['p95_ms']:>10.2f}{metrics['p99_ms']:>10.2f}")
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, Dict[str, float]]],
+    baseline: Dict[str, Dict[str, Dict[str, float]]],
+    tolerance: float,
+) -> List[str]:
+    """Endpoints whose throughput fell or p95 grew beyond tolerance, or that failed requests."""
+    regressions = []
+    for scale, endpoints in results.items():
+        for name, metrics in endpoints.items():
+            if metrics["errors"]:
+                regressions.append(f"{scale}/{name}: {metrics['errors']} failed requests")
+            expected = baseline.get(scale, {}).get(name)
+            if expected is None:
+                continue
+            if metrics["rps"] < expected["rps"] * (1 - tolerance):
+                regressions.append(
+                    f"{scale}/{name}: {metrics['rps']:.1f} req/s < baseline {expected['rps']:.1f}"
+                )
+            if metrics["p95_ms"] > expected["p95_ms"] * (1 + tolerance):
+                regressions.append(
+                    f"{scale}/{name}: p95 {metrics['p95_ms']:.2f} ms > baseline {expected['p95_ms']:.2f}"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", choices=list(SCALES), action="append",
+                        help="scale to run (repeatable, default: all)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=15.0, help="measured seconds per scale")
+    parser.add_argument("--warmup", type=float, default=3.0, help="unmeasured seconds per scale")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative drop in req/s or growth in p95")
+    parser.add_argument("--compare", action="store_true", help="fail on regressions vs the baseline")
+    parser.add_argument("--update-baseline", action="store_true", help="store the results as baseline")
+    args = parser.parse_args()
+
+    results = {}
+    for scale in args.scale or list(SCALES):
+        results[scale] = run_scale(scale, args.concurrency, args.duration, args.warmup)
+        print_results(scale, results[scale])
+
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    if args.update_baseline:
+        BASELINE_PATH.parent.mkdir(exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps({**baseline, **results}, indent=2) + "\n")
+        print(f"\nBaseline written to {BASELINE_PATH}")
+
+    if args.compare:
+        regressions = find_regressions(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+            for regression in regressions:
+                print(f"   - {regression}")
+            return 1
+        print(f"\n✅ No regressions beyond {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""
+Compare the previous index set with the partial live-row indexes.
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_indexes --courses 10000 --lectures-per-course 10
+
+Prints SQLite's EXPLAIN QUERY PLAN for the catalog access paths and the write
+cost of each schema (bulk load time, soft-delete time, database size).
+"""
+
+import argparse
+import time
+
+from sqlalchemy import func, select, text, update
+
+from app.db.course_read_model import refresh_course_read_models
+from app.db.models import Course, CourseTeacher, Lecture, Teacher
+from benchmarks.common import create_benchmark_engine, seed_catalog
+
+# Indexes dropped by migration c5e1a9d3f7b2, recreated for the "before" schema
+PREVIOUS_INDEXES = [
+    "CREATE INDEX ix_courses_id ON courses (id)",
+    "CREATE INDEX idx_courses_deleted_at ON courses (deleted_at)",
+    "CREATE INDEX idx_courses_slug_deleted_at ON courses (slug, deleted_at)",
+    "CREATE INDEX idx_courses_created_at_id ON courses (created_at, id)",
+    "CREATE INDEX ix_teachers_id ON teachers (id)",
+    "CREATE INDEX idx_teachers_deleted_at ON teachers (deleted_at)",
+    "CREATE INDEX idx_teachers_email_deleted_at ON teachers (email, deleted_at)",
+    "CREATE INDEX idx_course_teacher_course_id ON course_teacher (course_id)",
+    "CREATE INDEX ix_lectures_id ON lectures (id)",
+    "CREATE INDEX idx_lectures_course_id ON lectures (course_id)",
+    "CREATE INDEX idx_lectures_slug ON lectures (slug)",
+    "CREATE INDEX idx_lectures_deleted_at ON lectures (deleted_at)",
+    "CREATE INDEX idx_lectures_course_id_deleted_at ON lectures (course_id, deleted_at)",
+]
+NEW_INDEXES = ["idx_courses_live_created_at_id", "idx_lectures_live_course_id_id"]
+
+# Access paths of the catalog (with the soft-delete criterion they run with)
+ACCESS_PATHS = {
+    "lectures of courses": (
+        select(Lecture.course_id, Lecture.id, Lecture.name)
+        .where(Lecture.course_id.in_([10, 20]))
+        .where(Lecture.deleted_at.is_(None))
+        .order_by(Lecture.course_id, Lecture.id)
+    ),
+    "lecture by id": select(Lecture.id, Lecture.name).where(Lecture.id == 5).where(
+        Lecture.deleted_at.is_(None)
+    ),
+    "course by slug": select(Course.id).where(Course.slug == "curso-5").where(
+        Course.deleted_at.is_(None)
+    ),
+    "live course ids": select(Course.id).where(Course.deleted_at.is_(None)),
+    "teachers of courses": (
+        select(CourseTeacher.course_id, Teacher.id, Teacher.name)
+        .join(Teacher, Teacher.id == CourseTeacher.teacher_id)
+        .where(CourseTeacher.course_id.in_([10, 20]))
+        .where(Teacher.deleted_at.is_(None))
+    ),
+    "courses of teacher": select(CourseTeacher.course_id).where(CourseTeacher.teacher_id == 7),
+}
+
+
+def build(schema: str, courses: int, lectures_per_course: int):
+    """Create and load one schema variant; returns (engine, write costs)."""
+    engine = create_benchmark_engine()
+    with engine.begin() as connection:
+        if schema == "before":
+            for name in NEW_INDEXES:
+                connection.execute(text(f"DROP INDEX {name}"))
+            for statement in PREVIOUS_INDEXES:
+                connection.execute(text(statement))
+        index_count = connection.execute(
+            text("SELECT count(*) FROM sqlite_master WHERE type = 'index'")
+        ).scalar()
+
+    start = time.perf_counter()
+    seed_catalog(engine, courses, lectures_per_course)
+    load_seconds = time.perf_counter() - start
+
+    with engine.begin() as connection:
+        start = time.perf_counter()
+        # Soft delete 10% of the lectures, then rebuild their courses' rows
+        connection.execute(
+            update(Lecture).where(Lecture.id % 10 == 0).values(deleted_at=func.now())
+        )
+        refresh_course_read_models(connection, range(1, courses + 1))
+        delete_seconds = time.perf_counter() - start
+        size = connection.execute(text("PRAGMA page_count")).scalar() * connection.execute(
+            text("PRAGMA page_size")
+        ).scalar()
+
+    return engine, {
+        "indexes": index_count,
+        "load_s": load_seconds,
+        "soft_delete_s": delete_seconds,
+        "size_mib": size / 1024 / 1024,
+    }
+
+
+def explain(engine, statement) -> str:
+    """One-line EXPLAIN QUERY PLAN of a statement."""
+    compiled = statement.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as connection:
+        rows = connection.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return " | ".join(row[-1] for row in rows)
+
+
+def run(courses: int, lectures_per_course: int) -> None:
+    """Build both schemas and print plans and write costs side by side."""
+    results = {schema: build(schema, courses, lectures_per_course) for schema in ("before", "after")}
+
+    print(f"\nIndexes: {courses} courses, {courses * lectures_per_course} lectures")
+    print(f"{'schema':<8}{'indexes':>9}{'load s':>9}{'soft delete s':>15}{'size MiB':>10}")
+    for schema, (_, costs) in results.items():
+        print(
+            f"{schema:<8}{costs['indexes']:>9}{costs['load_s']:>9.2f}"
+            f"{costs['soft_delete_s']:>15.2f}{costs['size_mib']:>10.1f}"
+        )
+
+    for name, statement in ACCESS_PATHS.items():
+        print(f"\n{name}")
+        for schema, (engine, _) in results.items():
+            print(f"  {schema:<7}{explain(engine, statement)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--courses", type=int, default=10_000)
+    parser.add_argument("--lectures-per-course", type=int, default=10)
+    args = parser.parse_args()
+    run(args.courses, args.lectures_per_course)
@@ -0,0 +1,109 @@
+"""
+Compare the ORM entity read path with the column projection read path.
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_projection --courses 10000 --lectures-per-course 10
+"""
+
+import argparse
+
+from sqlalchemy.orm import Session, joinedload
+
+from app.db.models import Course, Lecture
+from app.services.course_service import CourseService
+from benchmarks.common import (
+    create_benchmark_engine,
+    measure,
+    print_comparison,
+    seed_catalog,
+    session_factory,
+)
+
+
+class EntityCourseService:
+    """The previous read path: hydrate full ORM entities, then copy fields."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_courses(self):
+        courses = (
+            self.db.query(Course)
+            .filter(Course.deleted_at.is_(None))
+            .order_by(Course.created_at.desc())
+            .all()
+        )
+        return [
+            {"id": c.id, "name": c.name, "description": c.description,
+             "thumbnail": c.thumbnail, "slug": c.slug}
+            for c in courses
+        ]
+
+    def get_course_by_slug(self, slug):
+        course = (
+            self.db.query(Course)
+            .options(joinedload(Course.teachers), joinedload(Course.lectures))
+            .filter(Course.slug == slug)
+            .filter(Course.deleted_at.is_(None))
+            .first()
+        )
+        return {
+            "id": course.id, "name": course.name, "description": course.description,
+            "thumbnail": course.thumbnail, "slug": course.slug,
+            "teacher_id": [{"id": t.id, "name": t.name}
+                           for t in course.teachers if t.deleted_at is None],
+            "lectures": [{"id": l.id, "name": l.name, "description": l.description,
+                          "slug": l.slug}
+                         for l in course.lectures if l.deleted_at is None],
+        }
+
+    def get_lecture_by_id(self, lecture_id):
+        lecture = (
+            self.db.query(Lecture)
+            .filter(Lecture.id == lecture_id)
+            .filter(Lecture.deleted_at.is_(None))
+            .first()
+        )
+        return {"id": lecture.id, "name": lecture.name, "description": lecture.description,
+                "slug": lecture.slug, "video_url": lecture.video_url}
+
+
+def run(courses: int, lectures_per_course: int, iterations: int) -> None:
+    """Seed the catalog and compare both read paths per endpoint."""
+    engine = create_benchmark_engine()
+    seed_catalog(engine, courses, lectures_per_course)
+    SessionLocal = session_factory(engine)
+
+    variants = {"entity": EntityCourseService, "projection": CourseService}
+    middle_slug = f"curso-{courses // 2}"
+    middle_lecture = (courses * lectures_per_course) // 2
+    scenarios = {
+        f"get_courses ({courses})": lambda service: service.get_courses(),
+        "get_course_by_slug": lambda service: service.get_course_by_slug(middle_slug),
+        "get_lecture_by_id": lambda service: service.get_lecture_by_id(middle_lecture),
+    }
+
+    results = {}
+    for scenario, call in scenarios.items():
+        results[scenario] = {}
+        for variant, service_class in variants.items():
+            def request():
+                # One session per call, like one request per session in the API
+                with SessionLocal() as db:
+                    return call(service_class(db))
+
+            results[scenario][variant] = measure(request, iterations)
+
+    print_comparison(
+        f"Read path: {courses} courses, {courses * lectures_per_course} lectures",
+        results,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--courses", type=int, default=10_000)
+    parser.add_argument("--lectures-per-course", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    run(args.courses, args.lectures_per_course, args.iterations)
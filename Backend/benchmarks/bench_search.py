@@ -0,0 +1,80 @@
+"""
+Measure full-text search latency against the previous client-side filtering.
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_search --courses 10000 --lectures-per-course 100
+
+Runs CourseService.search on the SQLite FTS5 backend for queries of different
+selectivity and, as the baseline, the previous approach of loading the whole
+course list and filtering it in Python (which cannot find lectures at all).
+"""
+
+import argparse
+import time
+from statistics import quantiles
+from typing import Callable, Dict
+
+from app.services.course_service import CourseService
+from benchmarks.common import create_benchmark_engine, seed_catalog, session_factory
+
+# query -> rough number of matching rows in the seeded catalog
+QUERIES = {
+    "curso 4242": "1 course",
+    "clase 7": "1 lecture per course",
+    "clase": "every lecture",
+}
+
+
+def latency(call: Callable[[], object], iterations: int) -> Dict[str, float]:
+    """Wall-clock p50/p95 of a call in milliseconds."""
+    call()  # warm up statement caches
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1000)
+    cuts = quantiles(samples, n=20)
+    return {"p50": cuts[9], "p95": cuts[18]}
+
+
+def client_filter(service: CourseService, query: str) -> list:
+    """The previous path: download every course and filter on the client."""
+    terms = query.lower().split()
+    return [
+        course for course in service.get_courses()
+        if all(term in f"{course['name']} {course['description']}".lower() for term in terms)
+    ]
+
+
+def run(courses: int, lectures_per_course: int, iterations: int) -> None:
+    """Seed the catalog and print search latency per query."""
+    engine = create_benchmark_engine()
+    start = time.perf_counter()
+    seed_catalog(engine, courses, lectures_per_course)
+    print(f"\nSeeded {courses} courses, {courses * lectures_per_course} lectures "
+          f"(with search index) in {time.perf_counter() - start:.1f}s")
+
+    print(f"{'query':<14}{'matches':<22}{'variant':<16}{'hits':>6}{'p50 ms':>10}{'p95 ms':>10}")
+    with session_factory(engine)() as db:
+        service = CourseService(db)
+        for query, matches in QUERIES.items():
+            variants = {
+                "search page 1": lambda: service.search(query, 20)["items"],
+                "search page 10": lambda: service.search(query, 20, 180)["items"],
+                "client filter": lambda: client_filter(service, query),
+            }
+            for variant, call in variants.items():
+                timing = latency(call, iterations)
+                print(
+                    f"{query:<14}{matches:<22}{variant:<16}{len(call()):>6}"
+                    f"{timing['p50']:>10.2f}{timing['p95']:>10.2f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--courses", type=int, default=10_000)
+    parser.add_argument("--lectures-per-course", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    run(args.courses, args.lectures_per_course, args.iterations)
@@ -0,0 +1,72 @@
+"""
+Compare response serialization strategies for the catalog endpoints.
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_serialization --courses 10000 --lectures-per-course 10
+"""
+
+import argparse
+import json
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from app.core.cache import LRUTTLCache
+from app.services.course_service import CourseService
+from benchmarks.common import (
+    create_benchmark_engine,
+    measure,
+    print_comparison,
+    seed_catalog,
+    session_factory,
+)
+
+
+def stdlib_json(value):
+    """The previous path: FastAPI's JSONResponse (jsonable_encoder + json.dumps)."""
+    return json.dumps(
+        jsonable_encoder(value),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def run(courses: int, lectures_per_course: int, iterations: int) -> None:
+    """Load each payload once and compare the cost of turning it into a body."""
+    engine = create_benchmark_engine()
+    seed_catalog(engine, courses, lectures_per_course)
+    SessionLocal = session_factory(engine)
+
+    with SessionLocal() as db:
+        service = CourseService(db)
+        payloads = {
+            f"courses ({courses})": service.get_courses(),
+            "course detail": service.get_course_by_slug(f"curso-{courses // 2}"),
+            "lecture detail": service.get_lecture_by_id((courses * lectures_per_course) // 2),
+        }
+
+    body_cache = LRUTTLCache(max_entries=16, ttl_seconds=3600)
+    results = {}
+    for scenario, payload in payloads.items():
+        body_cache.set(scenario, orjson.dumps(payload))
+        results[scenario] = {
+            "json": measure(lambda: stdlib_json(payload), iterations),
+            "orjson": measure(lambda: orjson.dumps(payload), iterations),
+            "cached bytes": measure(lambda: body_cache.get(scenario), iterations),
+        }
+
+    print_comparison(
+        f"Serialization: {courses} courses, {courses * lectures_per_course} lectures",
+        results,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--courses", type=int, default=10_000)
+    parser.add_argument("--lectures-per-course", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    run(args.courses, args.lectures_per_course, args.iterations)
@@ -0,0 +1,138 @@
+"""
+Compare statements rebuilt on every call with the precompiled read statements.
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_statements --courses 1000 --lectures-per-course 10
+
+Each service call runs against a small in-memory catalog through one reused
+session, so the time measured is mostly SQLAlchemy's Python-side work per
+call: building the statement, generating its cache key, adding the
+soft-delete criterion and processing the result.
+"""
+
+import argparse
+import time
+from statistics import median
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.db.models import Lecture
+from app.db.models.course_read_model import CourseReadModel
+from app.services.course_service import LECTURE_DETAIL_COLUMNS, CourseService
+from app.services.pagination import decode_cursor
+from benchmarks.common import create_benchmark_engine, seed_catalog, session_factory
+
+
+class RebuiltCourseService:
+    """The previous read path: a new select() per call, criterion added on execution."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_courses(self):
+        statement = select(CourseReadModel.summary).order_by(CourseReadModel.created_at.desc())
+        return list(self.db.execute(statement).scalars())
+
+    def get_courses_page(self, limit: int, cursor: Optional[str] = None):
+        statement: Select = (
+            select(CourseReadModel.summary, CourseReadModel.created_at, CourseReadModel.course_id)
+            .order_by(CourseReadModel.created_at.desc(), CourseReadModel.course_id.desc())
+            .limit(limit + 1)
+        )
+        if cursor:
+            created_at, course_id = decode_cursor(cursor)
+            statement = statement.where(
+                tuple_(CourseReadModel.created_at, CourseReadModel.course_id)
+                < tuple_(created_at, course_id)
+            )
+        return self.db.execute(statement).mappings().all()
+
+    def get_course_by_slug(self, slug: str):
+        statement = select(CourseReadModel.detail).where(CourseReadModel.slug == slug)
+        return self.db.execute(statement).scalar()
+
+    def get_lecture_by_id(self, lecture_id: int):
+        statement = select(*LECTURE_DETAIL_COLUMNS).where(Lecture.id == lecture_id)
+        lecture = self.db.execute(statement).mappings().first()
+        return dict(lecture) if lecture else None
+
+    def get_courses_version(self):
+        statement = select(
+            func.max(CourseReadModel.refreshed_at).label("refreshed_at"),
+            func.count(CourseReadModel.course_id).label("courses"),
+        )
+        return self.db.execute(statement).mappings().one()
+
+    def get_course_version(self, slug: str):
+        statement = (
+            select(CourseReadModel.course_id.label("id"), CourseReadModel.version)
+            .where(CourseReadModel.slug == slug)
+        )
+        return self.db.execute(statement).mappings().first()
+
+    def get_lecture_version(self, lecture_id: int):
+        statement = select(Lecture.id, Lecture.updated_at).where(Lecture.id == lecture_id)
+        return self.db.execute(statement).mappings().first()
+
+
+def per_call_us(call: Callable[[], Any], calls: int, rounds: int) -> float:
+    """Median CPU time per call (microseconds) over rounds of consecutive calls."""
+    for _ in range(calls):
+        call()  # warm up the compiled statement cache
+    samples = []
+    for _ in range(rounds):
+        start = time.process_time()
+        for _ in range(calls):
+            call()
+        samples.append((time.process_time() - start) / calls * 1_000_000)
+    return median(samples)
+
+
+def run(courses: int, lectures_per_course: int, calls: int, rounds: int) -> None:
+    """Seed the catalog and time each read method with both statement styles."""
+    engine = create_benchmark_engine()
+    seed_catalog(engine, courses, lectures_per_course)
+    SessionLocal = session_factory(engine)
+
+    middle_slug = f"curso-{courses // 2}"
+    middle_lecture = (courses * lectures_per_course) // 2
+    scenarios = {
+        f"get_courses ({courses})": lambda service: service.get_courses(),
+        "get_courses_page": lambda service: service.get_courses_page(20),
+        "get_course_by_slug": lambda service: service.get_course_by_slug(middle_slug),
+        "get_lecture_by_id": lambda service: service.get_lecture_by_id(middle_lecture),
+        "get_courses_version": lambda service: service.get_courses_version(),
+        "get_course_version": lambda service: service.get_course_version(middle_slug),
+        "get_lecture_version": lambda service: service.get_lecture_version(middle_lecture),
+    }
+    variants = {"rebuilt": RebuiltCourseService, "precompiled": CourseService}
+
+    results: Dict[str, Dict[str, float]] = {}
+    with SessionLocal() as db:
+        for scenario, call in scenarios.items():
+            results[scenario] = {}
+            for variant, service_class in variants.items():
+                service = service_class(db)
+                # Fewer calls for the full list, whose rows dominate its time
+                scenario_calls = max(calls // 50, 1) if scenario.startswith("get_courses (") else calls
+                results[scenario][variant] = per_call_us(
+                    lambda: call(service), scenario_calls, rounds
+                )
+
+    print(f"\nPer-call overhead: {courses} courses, {courses * lectures_per_course} lectures")
+    print(f"{'scenario':<28}{'rebuilt µs':>14}{'precompiled µs':>18}{'speedup':>10}")
+    for scenario, timings in results.items():
+        print(f"{scenario:<28}{timings['rebuilt']:>14.1f}{timings['precompiled']:>18.1f}"
+              f"{timings['rebuilt'] / timings['precompiled']:>9.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--courses", type=int, default=1_000)
+    parser.add_argument("--lectures-per-course", type=int, default=10)
+    parser.add_argument("--calls", type=int, default=1_000, help="calls per timed round")
+    parser.add_argument("--rounds", type=int, default=7)
+    args = parser.parse_args()
+    run(args.courses, args.lectures_per_course, args.calls, args.rounds)
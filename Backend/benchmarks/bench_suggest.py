@@ -0,0 +1,103 @@
+"""
+Measure the suggestion prefix index: memory per 100k titles and lookup latency.
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_suggest --titles 100000
+
+Builds a PrefixIndex over synthetic Spanish titles (with accents) and reports
+the load time, the memory footprint of titles, entries and payloads (the
+index's own estimate and tracemalloc), prefix lookup latency and incremental
+update cost.
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from statistics import quantiles
+from typing import Callable, Dict, List
+
+from app.core.prefix_index import PrefixIndex
+
+TOPICS = [
+    "Programación", "Diseño", "Introducción", "Análisis", "Gestión", "Fundamentos",
+    "Desarrollo", "Computación", "Administración", "Educación", "Fotografía", "Música",
+]
+SUBJECTS = [
+    "Python", "React", "bases de datos", "algoritmos", "redes", "inglés", "marketing",
+    "finanzas", "inteligencia artificial", "videojuegos", "producción audiovisual",
+]
+LEVELS = ["básico", "intermedio", "avanzado", "práctico", "profesional"]
+PREFIXES = ["p", "pro", "programacion", "diseno de", "intel", "avanz", "python avanzado 12"]
+
+
+def titles(count: int) -> List[str]:
+    """Synthetic titles such as "Programación de Python avanzado 42"."""
+    rng = random.Random(42)
+    return [
+        f"{rng.choice(TOPICS)} de {rng.choice(SUBJECTS)} {rng.choice(LEVELS)} {n}"
+        for n in range(count)
+    ]
+
+
+def latency_us(call: Callable[[], object], iterations: int) -> Dict[str, float]:
+    """Wall-clock p50/p95 of a call in microseconds."""
+    call()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    cuts = quantiles(samples, n=20)
+    return {"p50": cuts[9], "p95": cuts[18]}
+
+
+def run(count: int, iterations: int) -> None:
+    """Build the index and print its footprint and lookup latency."""
+    def build() -> PrefixIndex:
+        index = PrefixIndex()
+        # Same key and payload shapes as app.services.suggest
+        index.load(
+            (("lecture", n), title, ("lecture", n, n // 10, title, f"clase-{n}"))
+            for n, title in enumerate(titles(count))
+        )
+        return index
+
+    start = time.perf_counter()
+    build()
+    load_seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    index = build()
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stats = index.stats()
+
+    per_100k = 100_000 / count
+    print(f"\nSuggest index: {stats['titles']} titles, {stats['entries']} entries, "
+          f"loaded in {load_seconds:.2f}s")
+    print(f"memory (stats)      {stats['memory_bytes'] / 1024 / 1024 * per_100k:8.1f} MiB / 100k titles")
+    print(f"memory (tracemalloc){traced / 1024 / 1024 * per_100k:8.1f} MiB / 100k titles")
+
+    print(f"\n{'prefix':<20}{'hits':>6}{'p50 us':>10}{'p95 us':>10}")
+    for prefix in PREFIXES:
+        timing = latency_us(lambda: index.search(prefix, 10), iterations)
+        print(f"{prefix:<20}{len(index.search(prefix, 10)):>6}"
+              f"{timing['p50']:>10.1f}{timing['p95']:>10.1f}")
+
+    new_title = "Análisis de videojuegos profesional"
+    put = latency_us(lambda: index.put(("lecture", count), new_title, {}), iterations)
+    discard = latency_us(
+        lambda: (index.discard(("lecture", count)), index.put(("lecture", count), new_title, {})),
+        iterations,
+    )
+    print(f"\nput (replace)       p50 {put['p50']:8.1f} us   p95 {put['p95']:8.1f} us")
+    print(f"discard + put       p50 {discard['p50']:8.1f} us   p95 {discard['p95']:8.1f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--titles", type=int, default=100_000)
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+    run(args.titles, args.iterations)
@@ -0,0 +1,117 @@
+"""
+Shared helpers for the micro-benchmarks.
+
+Benchmarks run against an in-memory SQLite database so they can be executed
+anywhere with `python -m benchmarks.<name>` from the Backend directory.
+"""
+
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from statistics import median
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base
+from app.db.course_read_model import refresh_all_course_read_models
+from app.db.models import Course, CourseTeacher, Lecture, Teacher
+
+BATCH_SIZE = 10_000
+
+
+def create_benchmark_engine() -> Engine:
+    """Create an in-memory SQLite engine with the application schema."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def _insert_batched(connection: Any, table: Any, rows: List[Dict[str, Any]]) -> None:
+    """Insert rows in executemany batches."""
+    for start in range(0, len(rows), BATCH_SIZE):
+        connection.execute(insert(table), rows[start:start + BATCH_SIZE])
+
+
+def seed_catalog(
+    engine: Engine,
+    courses: int,
+    lectures_per_course: int,
+    teachers_per_course: int = 2,
+    teachers: int = 100,
+) -> None:
+    """Bulk load a synthetic catalog of the requested size."""
+    now = datetime(2025, 1, 1)
+    with engine.begin() as connection:
+        _insert_batched(connection, Teacher, [
+            {"id": i, "name": f"Teacher {i}", "email": f"teacher{i}@platzi.com",
+             "created_at": now, "updated_at": now}
+            for i in range(1, teachers + 1)
+        ])
+        _insert_batched(connection, Course, [
+            {"id": i, "name": f"Curso {i}", "description": f"Descripción del curso {i} " * 8,
+             "thumbnail": f"https://static.platzi.com/media/{i}.png", "slug": f"curso-{i}",
+             "created_at": now + timedelta(seconds=i), "updated_at": now}
+            for i in range(1, courses + 1)
+        ])
+        _insert_batched(connection, CourseTeacher, [
+            {"course_id": course_id, "teacher_id": (course_id + offset) % teachers + 1}
+            for course_id in range(1, courses + 1)
+            for offset in range(teachers_per_course)
+        ])
+        _insert_batched(connection, Lecture, [
+            {"id": (course_id - 1) * lectures_per_course + n, "course_id": course_id,
+             "name": f"Clase {n}", "description": f"Descripción de la clase {n} " * 4,
+             "slug": f"clase-{n}", "video_url": f"https://videos.platzi.com/{course_id}/{n}",
+             "created_at": now, "updated_at": now}
+            for course_id in range(1, courses + 1)
+            for n in range(1, lectures_per_course + 1)
+        ])
+        refresh_all_course_read_models(connection)
+
+
+def session_factory(engine: Engine) -> sessionmaker:
+    """Create a session factory bound to the benchmark engine."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def measure(call: Callable[[], Any], iterations: int) -> Dict[str, float]:
+    """
+    Measure a callable.
+
+    Returns the median CPU time per call in milliseconds and the peak traced
+    memory of a single call in KiB.
+    """
+    call()  # warm up statement caches
+
+    cpu_times = []
+    for _ in range(iterations):
+        start = time.process_time()
+        call()
+        cpu_times.append((time.process_time() - start) * 1000)
+
+    tracemalloc.start()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"cpu_ms": median(cpu_times), "peak_kib": peak / 1024}
+
+
+def print_comparison(title: str, results: Dict[str, Dict[str, Dict[str, float]]]) -> None:
+    """Print a before/after table: {scenario: {variant: metrics}}."""
+    print(f"\n{title}")
+    print(f"{'scenario':<28}{'variant':<14}{'cpu ms/call':>14}{'peak KiB/call':>16}")
+    for scenario, variants in results.items():
+        for variant, metrics in variants.items():
+            print(
+                f"{scenario:<28}{variant:<14}"
+                f"{metrics['cpu_ms']:>14.3f}{metrics['peak_kib']:>16.1f}"
+            )
@@ -16,6 +16,10 @@ echo "✅ Database is ready!"
 echo "🚀 Running database migrations..."
 cd app && uv run alembic upgrade head && cd ..
 
+# Backfill the course read models (migrations only create their tables)
+echo "🧱 Rebuilding course read models..."
+uv run python scripts/rebuild_read_models.py
+
 # Run seeds
 echo "🌱 Running database seeds..."
 uv run python scripts/run_seeds.py
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Rebuild the course read models from the catalog tables.
+
+The session hooks keep them current for writes made through the application;
+run this after migrations, which only create the tables, and after writes
+that bypass the hooks (raw SQL, other applications).
+"""
+
+import sys
+import os
+
+# Add the parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, func, select
+
+from app.core.config import get_settings
+from app.db.course_read_model import refresh_all_course_read_models
+from app.db.models import CourseReadModel
+
+
+if __name__ == "__main__":
+    print("🔄 Rebuilding course read models...")
+    try:
+        engine = create_engine(get_settings().DATABASE_URL)
+        with engine.begin() as connection:
+            refresh_all_course_read_models(connection)
+            rows = connection.execute(select(func.count()).select_from(CourseReadModel)).scalar()
+        print(f"✅ {rows} course read models rebuilt")
+    except Exception as e:
+        print(f"❌ Error rebuilding read models: {e}")
+        sys.exit(1)
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """
 Script to run database seeds.
-This script can be used to populate the database with sample data.
+This script can be used to populate the database with sample data, or with a
+large synthetic catalog for capacity testing (--synthetic).
 """
 
+import argparse
 import sys
 import os
 
@@ -11,11 +13,35 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.db.seed import create_sample_data
+from app.db.synthetic_seed import create_synthetic_catalog
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Populate the database with seed data.")
+    parser.add_argument("--synthetic", action="store_true",
+                        help="bulk load a synthetic catalog instead of the sample data")
+    parser.add_argument("--courses", type=int, default=1_000)
+    parser.add_argument("--lectures-per-course", type=int, default=100)
+    parser.add_argument("--teachers-per-course", type=int, default=2)
+    parser.add_argument("--deleted-fraction", type=float, default=0.0,
+                        help="fraction of soft-deleted teachers, courses and lectures")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
+    args = parse_args()
     print("🌱 Running database seeds...")
     try:
-        create_sample_data()
+        if args.synthetic:
+            counts = create_synthetic_catalog(
+                courses=args.courses,
+                lectures_per_course=args.lectures_per_course,
+                teachers_per_course=args.teachers_per_course,
+                deleted_fraction=args.deleted_fraction,
+            )
+            print(f"📊 Loaded: {', '.join(f'{n} {table}' for table, n in counts.items())}")
+        else:
+            create_sample_data()
         print("✅ Seeds executed successfully!")
     except Exception as e:
         print(f"❌ Error running seeds: {e}")